@@ -0,0 +1,245 @@
+# backend/app/batch.py
+"""
+Offline batch runner: compare schedulers over a JSONL file of workloads, no HTTP involved.
+
+    cd backend
+    python -m app.batch workloads.jsonl --output results.jsonl
+    python -m app.batch workloads.jsonl --db --policies baseline,memory_aware,srtf
+    python -m app.batch workloads.jsonl --output metrics.jsonl --metrics-only --resume
+
+Each input line is a SimulationInput (nested or flat, like the /compare body), optionally
+wrapped as {"input": {...}, "name": ...}. Lines are sent to a process pool in chunks as raw
+text, so parsing and validation happen in the workers too; results are written in input
+order as soon as their chunk is done, either as JSONL ({"line", "name", "results"} or
+{"line", "name", "error"}) or as rows in the runs table.
+
+--resume skips lines that already have a result: for JSONL the line numbers found in the
+output file (a torn last line is dropped), for --db the runs named "<prefix>:<line>".
+--metrics-only runs the RR schedulers as metrics-only passes (no trace or timeline;
+fault records are never computed here); other policies run normally and keep only their scalar fields.
+"""
+from __future__ import annotations
+import argparse
+import os
+import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+import orjson
+from pydantic import ValidationError
+from sqlalchemy import select
+
+from .core.policies import DEFAULT_POLICIES, POLICIES, run_policies
+from .core.stream import metrics_summary
+from .core.workload import Workload
+from .db.analytics import record_metrics
+from .db.base import SessionLocal, engine
+from .db.migrate import init_db
+from .db.models import Run
+
+DEFAULT_CHUNK = 16
+# fields kept per policy with --metrics-only
+METRIC_FIELDS = ("turnaround_times", "waiting_times", "cpu_utilization", "total_time", "context_switches",
+                 "core_utilization", "migrations", "inferred_quanta", "memory_estimates")
+RR_POLICIES = ("baseline", "memory_aware")
+
+
+def _metrics(w: Workload, names: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+    out = {}
+    for name in dict.fromkeys(names):
+        if name in RR_POLICIES:
+            out[name] = metrics_summary(w, name)
+        else:
+            res = run_policies(w, [name], "rle")[name]
+            out[name] = {k: res[k] for k in METRIC_FIELDS if res.get(k) is not None}
+    return out
+
+
+def run_line(line_no: int, text: str, names: Sequence[str], trace_mode: str, metrics_only: bool,
+             keep_input: bool) -> Dict[str, Any]:
+    """One JSONL record -> {"line", "name", "results"[, "input"]} or {"line", "name", "error"}."""
+    name: Optional[str] = None
+    try:
+        record = orjson.loads(text)
+        payload = record
+        if isinstance(record, dict):
+            name = record.get("name") or record.get("id")
+            if isinstance(record.get("input"), dict):
+                payload = record["input"]
+        w = Workload.from_payload(payload)
+        results = _metrics(w, names) if metrics_only else run_policies(w, names, trace_mode)
+    except orjson.JSONDecodeError as exc:
+        return {"line": line_no, "name": name, "error": f"invalid JSON: {exc}"}
+    except ValidationError as exc:
+        return {"line": line_no, "name": name, "error": f"invalid workload: {exc.errors(include_url=False, include_input=False)}"}
+    except ValueError as exc:
+        return {"line": line_no, "name": name, "error": str(exc)}
+    except Exception as exc:
+        # anything else (e.g. MemoryError on one huge record) fails that line, not the batch
+        return {"line": line_no, "name": name, "error": f"{type(exc).__name__}: {exc}"}
+    out = {"line": line_no, "name": name, "results": results}
+    if keep_input:
+        out["input"] = w.to_input()
+    return out
+
+
+def run_chunk(chunk: List[Tuple[int, str]], names: Sequence[str], trace_mode: str, metrics_only: bool,
+              keep_input: bool) -> List[Dict[str, Any]]:
+    # executed in a worker process; only line text goes in and plain data comes back
+    return [run_line(n, text, names, trace_mode, metrics_only, keep_input) for n, text in chunk]
+
+
+def read_chunks(path: str, chunk_size: int, skip: Set[int]) -> Iterator[List[Tuple[int, str]]]:
+    # 1-based line numbers; blank lines and already finished lines are skipped
+    chunk: List[Tuple[int, str]] = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, text in enumerate(f, start=1):
+            if line_no in skip or not text.strip():
+                continue
+            chunk.append((line_no, text))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+class JsonlSink:
+    def __init__(self, path: str, resume: bool):
+        self.done: Set[int] = set()
+        if resume and os.path.exists(path):
+            self.done = self._recover(path)
+            self.f = open(path, "ab")
+        else:
+            self.f = open(path, "wb")
+
+    @staticmethod
+    def _recover(path: str) -> Set[int]:
+        # finished line numbers; anything after the last complete line is cut off
+        done: Set[int] = set()
+        good = 0
+        with open(path, "rb") as f:
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break
+                try:
+                    done.add(int(orjson.loads(raw)["line"]))
+                except (orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+                    break
+                good += len(raw)
+        with open(path, "r+b") as f:
+            f.truncate(good)
+        return done
+
+    def write(self, results: List[Dict[str, Any]]) -> None:
+        self.f.write(b"".join(orjson.dumps(r, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY)
+                              for r in results))
+        self.f.flush()
+
+    def close(self) -> None:
+        self.f.close()
+
+
+class DbSink:
+    # one runs row per record, named "<prefix>:<line>", committed per chunk
+    def __init__(self, prefix: str, resume: bool):
+        init_db(engine)
+        self.prefix = prefix
+        self.done: Set[int] = set()
+        if resume:
+            with SessionLocal() as db:
+                names = db.scalars(select(Run.name).where(Run.name.startswith(f"{prefix}:", autoescape=True)))
+                for name in names:
+                    tail = name[len(prefix) + 1:]
+                    if tail.isdigit():
+                        self.done.add(int(tail))
+
+    def write(self, results: List[Dict[str, Any]]) -> None:
+        rows = []
+        for r in results:
+            if "error" in r:
+                print(f"line {r['line']}: {r['error']}", file=sys.stderr)
+                continue
+            rows.append(Run.build(f"{self.prefix}:{r['line']}", r["input"], r["results"]))
+        if rows:
+            with SessionLocal() as db:
+                db.add_all(rows)
+                db.flush()
+                record_metrics(db, ((row.id, row.input, row.results) for row in rows))
+                db.commit()
+
+    def close(self) -> None:
+        pass
+
+
+def run_batch(path: str, sink, names: Sequence[str], trace_mode: str, metrics_only: bool, workers: int,
+              chunk_size: int, keep_input: bool) -> Tuple[int, int]:
+    """Returns (records written, records with errors)."""
+    written = errors = 0
+    chunks = read_chunks(path, chunk_size, sink.done)
+
+    def emit(results: List[Dict[str, Any]]) -> None:
+        nonlocal written, errors
+        sink.write(results)
+        written += len(results)
+        errors += sum(1 for r in results if "error" in r)
+
+    if workers <= 1:
+        for chunk in chunks:
+            emit(run_chunk(chunk, names, trace_mode, metrics_only, keep_input))
+        return written, errors
+
+    # bounded in-flight chunks keep memory flat; results are written in input order
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        inflight: Deque[Future] = deque()
+        for chunk in chunks:
+            inflight.append(pool.submit(run_chunk, chunk, names, trace_mode, metrics_only, keep_input))
+            if len(inflight) >= workers * 2:
+                emit(inflight.popleft().result())
+        while inflight:
+            emit(inflight.popleft().result())
+    return written, errors
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Compare schedulers over a JSONL file of workloads")
+    ap.add_argument("input", help="JSONL file, one SimulationInput (or {\"input\": ..., \"name\": ...}) per line")
+    ap.add_argument("--output", default=None, help="write results here as JSONL")
+    ap.add_argument("--db", action="store_true", help="save each result as a run in the app database (DB_URL)")
+    ap.add_argument("--name-prefix", default=None, help="run name prefix for --db (default: input file name)")
+    ap.add_argument("--policies", default=",".join(DEFAULT_POLICIES), help=f"comma-separated subset of {','.join(POLICIES)}")
+    ap.add_argument("--trace", choices=("ticks", "rle"), default="rle", help="trace representation (default: rle)")
+    ap.add_argument("--metrics-only", action="store_true", help="skip trace and timeline")
+    ap.add_argument("--workers", type=int, default=0, help="worker processes (0 = one per CPU, 1 = in-process)")
+    ap.add_argument("--chunk", type=int, default=DEFAULT_CHUNK, help="records per task sent to a worker")
+    ap.add_argument("--resume", action="store_true", help="skip records that already have a result")
+    args = ap.parse_args(argv)
+
+    if args.output is None and not args.db:
+        ap.error("give --output, --db or both")
+    if args.output and args.db:
+        ap.error("--output and --db are exclusive")
+    names = [n.strip() for n in args.policies.split(",") if n.strip()]
+    unknown = [n for n in names if n not in POLICIES]
+    if unknown:
+        ap.error(f"unknown policies {unknown}; expected any of {list(POLICIES)}")
+    if args.db and args.metrics_only:
+        ap.error("--metrics-only results cannot be saved as runs; use --output")
+
+    if args.db:
+        sink = DbSink(args.name_prefix or os.path.basename(args.input), args.resume)
+    else:
+        sink = JsonlSink(args.output, args.resume)
+    workers = args.workers or os.cpu_count() or 1
+    try:
+        written, errors = run_batch(args.input, sink, names, args.trace, args.metrics_only, workers,
+                                    max(1, args.chunk), keep_input=args.db)
+    finally:
+        sink.close()
+    print(f"{written} records written ({errors} errors), {len(sink.done)} already done", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
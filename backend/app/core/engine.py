@@ -0,0 +1,126 @@
+# backend/app/core/engine.py
+from __future__ import annotations
+import heapq
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+# index yielded for idle segments by iter_rr_segments
+IDLE = -1
+
+
+class RRCheckpoint(NamedTuple):
+    """
+    Full RR core state at the top of a loop iteration, taken right after time advanced
+    (so no earlier iteration ran at `t`).
+    """
+    t: int
+    rem: List[int]
+    pending: List[Tuple[int, int]]
+    current: List[int]
+    upcoming: List[int]
+    cursor: int
+    made_progress: bool
+    live: int
+
+
+def iter_rr_segments(bursts: Sequence[int], quanta: Sequence[int], arrivals: Sequence[int],
+                     idle_between_quanta: int = 0, checkpoint_every: int = 0,
+                     on_checkpoint: Optional[Callable[[RRCheckpoint], None]] = None
+                     ) -> Iterator[Tuple[int, int, int]]:
+    """
+    Event-driven RR core over index-aligned vectors (lists or NumPy arrays).
+    Yields (index, start, end) per segment, with index == IDLE for idle time.
+
+    The legacy loop scans processes in input order on every pass and only picks up a
+    process that arrived mid-pass if the scan has not passed it yet. We keep that
+    behaviour with two ready queues ordered by input position:
+      - `current`: ready processes still ahead of the cursor in this pass
+      - `upcoming`: ready processes that will run in the next pass
+    Arrivals live in a heap keyed by arrival time and `live` counts unfinished processes,
+    so no step ever walks the whole process list: O(segments * log n).
+
+    With checkpoint_every > 0, on_checkpoint receives an RRCheckpoint every that many
+    quanta; resume_rr_segments continues from one.
+    """
+    return resume_rr_segments(initial_rr_state(bursts, arrivals), quanta, idle_between_quanta,
+                              checkpoint_every, on_checkpoint)
+
+
+def initial_rr_state(bursts: Sequence[int], arrivals: Sequence[int]) -> RRCheckpoint:
+    rem = [int(b) for b in bursts]
+    pending = [(int(a), i) for i, a in enumerate(arrivals) if rem[i] > 0]
+    heapq.heapify(pending)
+    return RRCheckpoint(0, rem, pending, [], [], 0, False, len(pending))
+
+
+def resume_rr_segments(state: RRCheckpoint, quanta: Sequence[int], idle_between_quanta: int = 0,
+                       checkpoint_every: int = 0, on_checkpoint: Optional[Callable[[RRCheckpoint], None]] = None
+                       ) -> Iterator[Tuple[int, int, int]]:
+    """Run the RR core from `state`; its containers are consumed."""
+    gap = int(idle_between_quanta or 0)
+    # a zero quantum would never make progress (the legacy loop spins forever on it)
+    quantum = [max(1, int(q)) for q in quanta]
+
+    t, rem, pending, current, upcoming, cursor, made_progress, live = state
+    countdown = checkpoint_every
+
+    while live:
+        # admit everything that has arrived by now, on the correct side of the cursor
+        while pending and pending[0][0] <= t:
+            _, i = heapq.heappop(pending)
+            heapq.heappush(current if i >= cursor else upcoming, i)
+
+        if not current:
+            if made_progress:
+                # end of pass: start the next one from the first process
+                current, upcoming = upcoming, current
+                cursor = 0
+                made_progress = False
+                continue
+            # a whole pass found nothing ready: jump to the next arrival
+            if not pending:
+                break
+            next_t = pending[0][0]
+            if next_t > t:
+                yield IDLE, t, next_t
+            t = next_t
+            continue
+
+        i = heapq.heappop(current)
+        use = min(quantum[i], rem[i])
+        yield i, t, t + use
+        rem[i] -= use
+        t += use
+        cursor = i + 1
+        made_progress = True
+        if rem[i] > 0:
+            heapq.heappush(upcoming, i)
+        else:
+            live -= 1
+
+        if gap and live:
+            yield IDLE, t, t + gap
+            t += gap
+
+        if countdown:
+            countdown -= 1
+            if not countdown and live:
+                countdown = checkpoint_every
+                on_checkpoint(RRCheckpoint(t, rem[:], pending[:], current[:], upcoming[:],
+                                           cursor, made_progress, live))
+
+
+def simulate_rr_event_driven(processes: List[str], bursts: List[int], quanta: Dict[str, int],
+                             arrivals: Optional[Dict[str, int]] = None, idle_between_quanta: int = 0
+                            ) -> List[Tuple[str, int, int]]:
+    """
+    Event-driven RR scheduler. Produces exactly the same timeline as the pass-based loop
+    (scheduler.simulate_rr_legacy).
+    """
+    if arrivals is None:
+        arrivals = {}
+    q = [int(round(quanta.get(p, 1))) for p in processes]
+    arr = [arrivals.get(p, 0) for p in processes]
+    return [
+        ("IDLE" if i == IDLE else processes[i], s, e)
+        for i, s, e in iter_rr_segments(bursts, q, arr, idle_between_quanta)
+    ]
@@ -0,0 +1,229 @@
+# backend/app/core/paging.py
+from __future__ import annotations
+import heapq
+from collections import OrderedDict, deque
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..models.schemas import SystemConfig
+from .workload import Workload, as_workload
+
+# locality model: per reference, probability of jumping inside the current locality,
+# probability of moving to a new locality, and locality size as a fraction of the process's pages
+LOCALITY_JUMP = 0.05
+LOCALITY_PHASE = 0.002
+LOCALITY_WINDOW = 0.25
+
+
+def generate_references(pages: Sequence[int], bursts: Sequence[int], page_size: int, seed: int = 0
+                        ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Seeded locality model: one memory reference per CPU tick.
+    Each process walks its address space (pages_count * page_size units) sequentially,
+    occasionally jumping within its current locality and rarely moving to a new one,
+    so page_size consecutive references tend to land on the same page.
+
+    Generated for all processes at once. Returns (offsets, page_refs) where
+    page_refs[offsets[i]:offsets[i + 1]] is the reference string of process i.
+    The strings depend only on the workload and seed, not on the schedule, so every
+    scheduler sees the same references.
+    """
+    pages = np.asarray(pages, dtype=np.int64)
+    # processes without pages make no references
+    lengths = np.where(pages > 0, np.maximum(np.asarray(bursts, dtype=np.int64), 0), 0)
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    total = int(offsets[-1])
+    if total == 0:
+        return offsets, np.zeros(0, dtype=np.int64)
+
+    rng = np.random.default_rng(seed)
+    owner = np.repeat(np.arange(len(lengths)), lengths)
+    own_pages = pages[owner]
+    span = own_pages * page_size
+    window = np.maximum(1, np.ceil(own_pages * LOCALITY_WINDOW)).astype(np.int64) * page_size
+    starts = offsets[:-1][lengths > 0]
+    idx = np.arange(total)
+
+    phase = rng.random(total) < LOCALITY_PHASE
+    phase[starts] = True
+    jump = (rng.random(total) < LOCALITY_JUMP) | phase
+
+    # locality base page, forward-filled from the last phase change
+    base = (rng.random(total) * own_pages).astype(np.int64)
+    base = base[np.maximum.accumulate(np.where(phase, idx, 0))]
+    # address after a jump, then sequential walk until the next jump
+    target = base * page_size + (rng.random(total) * window).astype(np.int64)
+    last_jump = np.maximum.accumulate(np.where(jump, idx, 0))
+    addr = (target[last_jump] + (idx - last_jump)) % span
+    return offsets, addr // page_size
+
+
+class FIFOFrames:
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.order: deque = deque()
+        self.resident: set = set()
+
+    def access(self, key: int, pos: int) -> bool:
+        if key in self.resident:
+            return False
+        if len(self.resident) >= self.capacity:
+            self.resident.discard(self.order.popleft())
+        self.order.append(key)
+        self.resident.add(key)
+        return True
+
+
+class LRUFrames:
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.resident: OrderedDict = OrderedDict()
+
+    def access(self, key: int, pos: int) -> bool:
+        if key in self.resident:
+            self.resident.move_to_end(key)
+            return False
+        if len(self.resident) >= self.capacity:
+            self.resident.popitem(last=False)
+        self.resident[key] = None
+        return True
+
+
+class ClockFrames:
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        # ring buffer of resident keys with one reference bit per frame
+        self.frames: List[Optional[int]] = [None] * capacity
+        self.referenced = bytearray(capacity)
+        self.slot: Dict[int, int] = {}
+        self.hand = 0
+        self.used = 0
+
+    def access(self, key: int, pos: int) -> bool:
+        s = self.slot.get(key)
+        if s is not None:
+            self.referenced[s] = 1
+            return False
+        if self.used < self.capacity:
+            s = self.used
+            self.used += 1
+        else:
+            while self.referenced[self.hand]:
+                self.referenced[self.hand] = 0
+                self.hand = (self.hand + 1) % self.capacity
+            s = self.hand
+            del self.slot[self.frames[s]]
+            self.hand = (self.hand + 1) % self.capacity
+        self.frames[s] = key
+        self.referenced[s] = 1
+        self.slot[key] = s
+        return True
+
+
+class OPTFrames:
+    """Belady's optimal policy; needs the next-use position of every reference up front."""
+
+    def __init__(self, capacity: int, next_use: np.ndarray):
+        self.capacity = capacity
+        self.next_use = next_use
+        self.resident: Dict[int, int] = {}
+        # max-heap on next use, stale entries skipped lazily
+        self.heap: List[Tuple[int, int]] = []
+
+    def access(self, key: int, pos: int) -> bool:
+        nxt = int(self.next_use[pos])
+        hit = key in self.resident
+        if not hit and len(self.resident) >= self.capacity:
+            while True:
+                neg, victim = heapq.heappop(self.heap)
+                if self.resident.get(victim) == -neg:
+                    del self.resident[victim]
+                    break
+        self.resident[key] = nxt
+        heapq.heappush(self.heap, (-nxt, key))
+        return not hit
+
+
+REPLACEMENT_POLICIES = {
+    "FIFO": FIFOFrames,
+    "LRU": LRUFrames,
+    "CLOCK": ClockFrames,
+    "OPT": OPTFrames,
+}
+
+
+def _next_use(keys: np.ndarray) -> np.ndarray:
+    # position of the next reference to the same key, len(keys) if never referenced again
+    n = len(keys)
+    order = np.argsort(keys, kind="stable")
+    nxt = np.full(n, n, dtype=np.int64)
+    same = keys[order[1:]] == keys[order[:-1]]
+    nxt[order[:-1][same]] = order[1:][same]
+    return nxt
+
+
+def simulate_paging(cfg: Union[SystemConfig, Workload], timeline: List[Tuple[str, int, int]]) -> Dict[str, List[int]]:
+    """
+    Demand paging interleaved with a CPU timeline: each running tick issues one reference
+    from the process's locality-model string, resolved against a global pool of
+    cfg.total_frames frames under cfg.replacement_policy. With several CPUs the timeline
+    holds every core's segments in start order and all cores share the pool.
+    Returns fault times per pid.
+    """
+    cfg = as_workload(cfg)
+    pids = cfg.pids
+    index = {pid: i for i, pid in enumerate(pids)}
+    offsets, refs = generate_references(cfg.pages, cfg.burst, cfg.page_size, seed=cfg.paging_seed)
+    faults: Dict[str, List[int]] = {pid: [] for pid in pids}
+
+    # global reference stream in execution order, as (key, time) with key = pid index * stride + page
+    stride = int(refs.max()) + 1 if len(refs) else 1
+    pos = offsets[:-1].copy()
+    key_parts: List[np.ndarray] = []
+    time_parts: List[np.ndarray] = []
+    for pid, s, e in timeline:
+        i = index.get(pid)
+        if i is None:
+            continue
+        take = min(e - s, int(offsets[i + 1] - pos[i]))
+        if take <= 0:
+            continue
+        key_parts.append(refs[pos[i]:pos[i] + take] + i * stride)
+        time_parts.append(np.arange(s, s + take, dtype=np.int64))
+        pos[i] += take
+    if not key_parts:
+        return faults
+    keys = np.concatenate(key_parts)
+    times = np.concatenate(time_parts)
+    if len(times) > 1 and bool((times[1:] < times[:-1]).any()):
+        # segments from several CPUs overlap in time: interleave their references tick by tick
+        order = np.argsort(times, kind="stable")
+        keys = keys[order]
+        times = times[order]
+
+    # back-to-back references to the same page can never fault and do not change any
+    # policy's eviction order, so only the first of each run is simulated
+    first = np.ones(len(keys), dtype=bool)
+    first[1:] = keys[1:] != keys[:-1]
+    keys = keys[first]
+    times = times[first]
+
+    if cfg.total_frames <= 0:
+        owners, fault_times = keys // stride, times
+    else:
+        # a pool with room for every distinct page never evicts, so frames beyond that
+        # change no fault; the policies' per-frame state stays bounded by the workload
+        capacity = min(cfg.total_frames, len(np.unique(keys)))
+        if cfg.replacement_policy == "OPT":
+            frames = OPTFrames(capacity, _next_use(keys))
+        else:
+            frames = REPLACEMENT_POLICIES[cfg.replacement_policy](capacity)
+        access = frames.access
+        faulted = np.fromiter((access(k, n) for n, k in enumerate(keys.tolist())), dtype=bool, count=len(keys))
+        owners, fault_times = keys[faulted] // stride, times[faulted]
+
+    for i, t in zip(owners.tolist(), fault_times.tolist()):
+        faults[pids[i]].append(t)
+    return faults
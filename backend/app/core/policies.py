@@ -0,0 +1,236 @@
+# backend/app/core/policies.py
+"""
+Scheduling policy registry for /compare.
+
+"baseline" and "memory_aware" are the RR schedulers from scheduler.py (single-CPU or SMP).
+The other policies share one event-driven core, iter_policy_segments, and differ only in
+their ready queue:
+
+    sjf       shortest job first, non-preemptive        heap on (burst, arrival, index)
+    srtf      shortest remaining time first, preemptive heap on (remaining, arrival, index)
+    priority  lowest priority value first, non-preemptive heap on (priority, arrival, index)
+    mlfq      multi-level feedback queue                 one deque per level
+
+Every push/pop is O(log n) (O(1) for MLFQ), so a run is O((n + segments) log n).
+"""
+from __future__ import annotations
+import heapq
+from collections import deque
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+
+from ..models.schemas import TraceMode
+from ..utils.metrics import timed
+from .engine import IDLE
+from .scheduler import run_baseline, run_memory_aware, summarize_timeline
+from .workload import Workload
+
+# MLFQ: level k gets cpu_quantum * 2**k; a process that uses its whole slice moves down a level
+MLFQ_LEVELS = 3
+
+DEFAULT_POLICIES = ("baseline", "memory_aware")
+
+
+class ReadyQueue:
+    """
+    Ready-queue interface for iter_policy_segments. `rem` is the core's remaining-burst
+    list, shared so queues keyed on remaining time can read it.
+    """
+    preemptive = False
+
+    def __init__(self, w: Workload, rem: List[int]):
+        self.rem = rem
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def push(self, i: int) -> None:
+        """i arrived and is ready."""
+        raise NotImplementedError
+
+    def pop(self) -> Tuple[int, int]:
+        """Next process to run and its slice (0 = until it finishes or is preempted)."""
+        raise NotImplementedError
+
+    def requeue(self, i: int, used_slice: bool) -> None:
+        """i stopped with work left: its slice ran out (used_slice) or it was preempted."""
+        self.push(i)
+
+    def preempts(self, remaining: int) -> bool:
+        """Whether the best ready process should take the CPU from one with `remaining` left."""
+        return False
+
+
+class _KeyedHeap(ReadyQueue):
+    # binary heap on (key, arrival, index); ties go to the earlier arrival, then input order
+    def __init__(self, w: Workload, rem: List[int]):
+        super().__init__(w, rem)
+        self.arrival = w.arrival.tolist()
+        self.heap: List[Tuple[int, int, int]] = []
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def key(self, i: int) -> int:
+        raise NotImplementedError
+
+    def push(self, i: int) -> None:
+        heapq.heappush(self.heap, (self.key(i), self.arrival[i], i))
+
+    def pop(self) -> Tuple[int, int]:
+        return heapq.heappop(self.heap)[2], 0
+
+
+class SJFQueue(_KeyedHeap):
+    def __init__(self, w: Workload, rem: List[int]):
+        super().__init__(w, rem)
+        self.burst = w.burst.tolist()
+
+    def key(self, i: int) -> int:
+        return self.burst[i]
+
+
+class SRTFQueue(_KeyedHeap):
+    preemptive = True
+
+    def key(self, i: int) -> int:
+        return self.rem[i]
+
+    def preempts(self, remaining: int) -> bool:
+        # strictly shorter only, so equal remaining times never thrash
+        return bool(self.heap) and self.heap[0][0] < remaining
+
+
+class PriorityQueue(_KeyedHeap):
+    def __init__(self, w: Workload, rem: List[int]):
+        super().__init__(w, rem)
+        self.priority = w.priority.tolist()
+
+    def key(self, i: int) -> int:
+        return self.priority[i]
+
+
+class MLFQQueue(ReadyQueue):
+    # arrivals enter the top level; levels are served strictly in order, RR within a level
+    def __init__(self, w: Workload, rem: List[int]):
+        super().__init__(w, rem)
+        self.quanta = [w.cpu_quantum * 2 ** k for k in range(MLFQ_LEVELS)]
+        self.levels: List[deque] = [deque() for _ in range(MLFQ_LEVELS)]
+        self.level = [0] * len(rem)
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def push(self, i: int) -> None:
+        self.levels[self.level[i]].append(i)
+        self.size += 1
+
+    def pop(self) -> Tuple[int, int]:
+        for k, queue in enumerate(self.levels):
+            if queue:
+                self.size -= 1
+                return queue.popleft(), self.quanta[k]
+        raise IndexError("pop from an empty MLFQ")
+
+    def requeue(self, i: int, used_slice: bool) -> None:
+        if used_slice:
+            self.level[i] = min(self.level[i] + 1, MLFQ_LEVELS - 1)
+        self.push(i)
+
+
+def iter_policy_segments(queue: ReadyQueue, arrivals: Sequence[int], idle_between_quanta: int = 0
+                         ) -> Iterator[Tuple[int, int, int]]:
+    """
+    Event-driven single-CPU core shared by the queue-based policies. Yields (index, start,
+    end) like iter_rr_segments, IDLE for idle time. queue.rem holds the bursts and is
+    consumed. Arrivals wait in a heap; a preemptive queue is asked at each arrival during
+    a slice whether the newcomer takes the CPU.
+    """
+    rem = queue.rem
+    gap = int(idle_between_quanta or 0)
+    pending = [(int(a), i) for i, a in enumerate(arrivals) if rem[i] > 0]
+    heapq.heapify(pending)
+    live = len(pending)
+    t = 0
+
+    while live:
+        while pending and pending[0][0] <= t:
+            queue.push(heapq.heappop(pending)[1])
+        if not len(queue):
+            if not pending:
+                break
+            next_t = pending[0][0]
+            yield IDLE, t, next_t
+            t = next_t
+            continue
+
+        i, slice_ = queue.pop()
+        end = t + (min(slice_, rem[i]) if slice_ else rem[i])
+        if queue.preemptive:
+            while pending and pending[0][0] < end:
+                at = pending[0][0]
+                while pending and pending[0][0] == at:
+                    queue.push(heapq.heappop(pending)[1])
+                if queue.preempts(rem[i] - (at - t)):
+                    end = at
+                    break
+        yield i, t, end
+        rem[i] -= end - t
+        used_slice = bool(slice_) and end - t == slice_
+        t = end
+        if rem[i] > 0:
+            queue.requeue(i, used_slice)
+        else:
+            live -= 1
+        if gap and live:
+            yield IDLE, t, t + gap
+            t += gap
+
+
+def _queue_policy(queue_cls: Callable[[Workload, List[int]], ReadyQueue], name: str
+                  ) -> Callable[..., Dict[str, Any]]:
+    def run(w: Workload, trace_mode: TraceMode = "ticks", faults: bool = False) -> Dict[str, Any]:
+        if w.num_cpus > 1:
+            raise ValueError(f"policy {name!r} only supports num_cpus = 1")
+        pids = w.pids
+        queue = queue_cls(w, w.burst.tolist())
+        with timed("rr", name):
+            timeline = [("IDLE" if i == IDLE else pids[i], s, e)
+                        for i, s, e in iter_policy_segments(queue, w.arrival.tolist(), w.cpu_idle_gap)]
+        return summarize_timeline(w, timeline, trace_mode, name, faults)
+    return run
+
+
+# name -> runner(workload, trace_mode, faults) returning a SimulationResult-shaped dict
+POLICIES: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "baseline": run_baseline,
+    "memory_aware": run_memory_aware,
+    "sjf": _queue_policy(SJFQueue, "sjf"),
+    "srtf": _queue_policy(SRTFQueue, "srtf"),
+    "priority": _queue_policy(PriorityQueue, "priority"),
+    "mlfq": _queue_policy(MLFQQueue, "mlfq"),
+}
+
+
+# policies that also run with num_cpus > 1 (the SMP engine is round robin)
+MULTI_CPU_POLICIES = frozenset(DEFAULT_POLICIES)
+
+
+def check_policies(w: Workload, names: Sequence[str]) -> None:
+    """Raise ValueError for unknown names or policies that cannot run this workload."""
+    unknown = [n for n in names if n not in POLICIES]
+    if unknown:
+        raise ValueError(f"unknown policies {unknown}; expected any of {list(POLICIES)}")
+    single = [n for n in names if n not in MULTI_CPU_POLICIES]
+    if w.num_cpus > 1 and single:
+        raise ValueError(f"policies {single} only support num_cpus = 1")
+
+
+def run_policies(w: Workload, names: Sequence[str] = DEFAULT_POLICIES, trace_mode: TraceMode = "ticks",
+                 faults: bool = False) -> Dict[str, Dict[str, Any]]:
+    """
+    Each named policy over the same validated workload, keyed by name (CompareBundle-shaped
+    for the defaults). Raises ValueError for unknown names or unsupported combinations.
+    """
+    check_policies(w, names)
+    return {name: POLICIES[name](w, trace_mode, faults) for name in dict.fromkeys(names)}
@@ -1,8 +1,19 @@
 # backend/app/core/scheduler.py
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Tuple
+import os
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from ..models.schemas import SystemConfig, SimulationResult, TraceEntry
+import numpy as np
+
+from ..models.schemas import SystemConfig, SimulationResult, TraceEntry, TraceMode
+from ..utils.metrics import record_simulation, timed
+from .engine import IDLE, simulate_rr_event_driven
+from .paging import simulate_paging
+from .smp import count_migrations, iter_smp_segments, split_by_cpu
+from .workload import Workload, as_workload
+
+# "event" (default) or "legacy"; both engines produce identical timelines
+RR_ENGINE = os.getenv("RR_ENGINE", "event")
 
 # ---------- helpers ----------
 def trace_to_timeline(trace: List[TraceEntry]) -> List[Dict[str, Any]]:
@@ -33,13 +44,12 @@ def trace_to_timeline(trace: List[TraceEntry]) -> List[Dict[str, Any]]:
     return timeline
 
 
-def simulate_rr_with_quanta(processes: List[str], bursts: List[int], quanta: Dict[str, int],
-                            arrivals: Optional[Dict[str, int]] = None, idle_between_quanta: int = 0
-                           ) -> List[Tuple[str, int, int]]:
+def simulate_rr_legacy(processes: List[str], bursts: List[int], quanta: Dict[str, int],
+                       arrivals: Optional[Dict[str, int]] = None, idle_between_quanta: int = 0
+                      ) -> List[Tuple[str, int, int]]:
     """
-    RR scheduler that respects per-process arrival times.
-    Returns timeline: list of (pid, start, end)
-    idle_between_quanta: if >0, insert an IDLE segment of that length after each quantum (useful for visualization)
+    Original pass-based RR loop (O(n^2 * bursts/quantum)). Kept as the reference
+    implementation for checking the event-driven engine.
     """
     if arrivals is None:
         arrivals = {p: 0 for p in processes}
@@ -79,6 +89,63 @@ def simulate_rr_with_quanta(processes: List[str], bursts: List[int], quanta: Dic
     return timeline
 
 
+RR_ENGINES = {
+    "event": simulate_rr_event_driven,
+    "legacy": simulate_rr_legacy,
+}
+
+
+def simulate_rr_with_quanta(processes: List[str], bursts: List[int], quanta: Dict[str, int],
+                            arrivals: Optional[Dict[str, int]] = None, idle_between_quanta: int = 0,
+                            engine: Optional[str] = None) -> List[Tuple[str, int, int]]:
+    """
+    RR scheduler that respects per-process arrival times.
+    Returns timeline: list of (pid, start, end)
+    idle_between_quanta: if >0, insert an IDLE segment of that length after each quantum (useful for visualization)
+    engine: "event" or "legacy" (defaults to RR_ENGINE)
+    """
+    name = engine or RR_ENGINE
+    if name not in RR_ENGINES:
+        raise ValueError(f"unknown RR engine {name!r}; expected one of {sorted(RR_ENGINES)}")
+    return RR_ENGINES[name](processes, bursts, quanta, arrivals=arrivals, idle_between_quanta=idle_between_quanta)
+
+
+def build_trace(timeline: List[Tuple[str, int, int]]) -> List[Dict[str, Any]]:
+    # one TraceEntry-shaped row per time unit; size grows with simulated time, not with segment count
+    trace: List[Dict[str, Any]] = []
+    append = trace.append
+    for pid, s, e in timeline:
+        if pid == "IDLE":
+            for t in range(s, e):
+                append({"time": t, "event": "idle", "pid": None})
+        else:
+            for t in range(s, e):
+                append({"time": t, "event": "running", "pid": pid})
+    return trace
+
+
+def build_trace_rle(timeline: List[Tuple[str, int, int]]) -> List[Dict[str, Any]]:
+    # same information as build_trace, but adjacent ticks with the same event/pid collapse into one TraceRun row
+    runs: List[Dict[str, Any]] = []
+    for pid, s, e in timeline:
+        if e <= s:
+            continue
+        event, run_pid = ("idle", None) if pid == "IDLE" else ("running", pid)
+        last = runs[-1] if runs else None
+        if last is not None and last["event"] == event and last["pid"] == run_pid and last["start"] + last["length"] == s:
+            last["length"] += e - s
+        else:
+            runs.append({"event": event, "pid": run_pid, "start": s, "length": e - s})
+    return runs
+
+
+def build_trace_fields(timeline: List[Tuple[str, int, int]], trace_mode: TraceMode = "ticks") -> Dict[str, Any]:
+    # only the requested representation is built
+    if trace_mode == "rle":
+        return {"trace": [], "trace_rle": build_trace_rle(timeline)}
+    return {"trace": build_trace(timeline), "trace_rle": None}
+
+
 def count_context_switches(timeline: List[Tuple[str, int, int]]) -> int:
     if not timeline:
         return 0
@@ -123,96 +190,176 @@ def compute_wait_turnaround(processes: List[str], bursts: List[int], timeline: L
     return waiting, turnaround, avg_wait, avg_tat
 
 
-def simulate_baseline(cfg: SystemConfig) -> SimulationResult:
-    processes = [p.pid for p in cfg.processes]
-    bursts = [p.burst_time for p in cfg.processes]
-    arrivals = {p.pid: p.arrival_time for p in cfg.processes}
-    baseline_quanta = {p: cfg.cpu_quantum for p in processes}
-
+def _run_rr(w: Workload, quanta: Dict[str, int], trace_mode: TraceMode, scheduler: str, faults: bool = False
+            ) -> Dict[str, Any]:
+    if w.num_cpus > 1:
+        return _run_smp(w, quanta, trace_mode, scheduler, faults)
     # pass idle_between_quanta from cfg.cpu_idle_gap
-    timeline = simulate_rr_with_quanta(processes, bursts, baseline_quanta, arrivals=arrivals, idle_between_quanta=getattr(cfg, "cpu_idle_gap", 0))
-    ctx = count_context_switches(timeline)
-    waiting, turnaround, avg_wait, avg_tat = compute_wait_turnaround(processes, bursts, timeline, arrivals=arrivals)
+    arrivals = dict(zip(w.pids, w.arrival.tolist()))
+    with timed("rr", scheduler):
+        timeline = simulate_rr_with_quanta(w.pids, w.burst.tolist(), quanta, arrivals=arrivals, idle_between_quanta=w.cpu_idle_gap)
+    return summarize_timeline(w, timeline, trace_mode, scheduler, faults)
+
+
+def _fault_record(w: Workload, timeline: List[Tuple[str, int, int]], faults: bool, scheduler: str
+                  ) -> Optional[Dict[str, List[int]]]:
+    # opt-in: the replay is O(simulated time), unlike everything else on the default path
+    if not faults:
+        return None
+    # same reference strings and frame budget for every scheduler, so fault counts are comparable
+    with timed("paging", scheduler):
+        return simulate_paging(w, timeline)
+
+
+def summarize_timeline(w: Workload, timeline: List[Tuple[str, int, int]], trace_mode: TraceMode = "ticks",
+                       scheduler: str = "", faults: bool = False) -> Dict[str, Any]:
+    # every SimulationResult field, as plain JSON-ready data; `scheduler` only labels metrics,
+    # `faults` adds the demand-paging fault_record
+    processes = w.pids
+    bursts = w.burst.tolist()
+    arrivals = dict(zip(processes, w.arrival.tolist()))
+    with timed("context_switches", scheduler):
+        ctx = count_context_switches(timeline)
+    with timed("wait_turnaround", scheduler):
+        waiting, turnaround, avg_wait, avg_tat = compute_wait_turnaround(processes, bursts, timeline, arrivals=arrivals)
 
     total_time = timeline[-1][2] if timeline else 0
     cpu_busy = sum((e - s) for (pid, s, e) in timeline if pid != "IDLE")
     utilization = (cpu_busy / total_time) * 100.0 if total_time > 0 else 0.0
 
-    trace: List[TraceEntry] = []
-    for pid, s, e in timeline:
-        if pid == "IDLE":
-            for t in range(s, e):
-                trace.append(TraceEntry(time=t, event="idle", pid=None))
-        else:
-            for t in range(s, e):
-                trace.append(TraceEntry(time=t, event="running", pid=pid))
+    with timed("trace", scheduler):
+        trace_fields = build_trace_fields(timeline, trace_mode)
+    fault_record = _fault_record(w, timeline, faults, scheduler)
+    record_simulation(scheduler, total_time, len(timeline), len(trace_fields["trace"]) + len(trace_fields["trace_rle"] or ()))
 
-    # do not include IDLE rows in the per-process memory_timeline — frontend expects only real process bars
-    memory_timeline = [{"pid": pid, "start": s, "end": e} for (pid, s, e) in timeline if pid != "IDLE"]
+    return {
+        "turnaround_times": turnaround,
+        "waiting_times": waiting,
+        "cpu_utilization": utilization,
+        "total_time": total_time,
+        "context_switches": ctx,
+        **trace_fields,
+        "fault_record": fault_record,
+        # do not include IDLE rows in the per-process memory_timeline — frontend expects only real process bars
+        "memory_timeline": [{"pid": pid, "start": s, "end": e} for (pid, s, e) in timeline if pid != "IDLE"],
+        "inferred_quanta": None,
+        "memory_estimates": None,
+    }
 
 
-    return SimulationResult(
-        turnaround_times=turnaround,
-        waiting_times=waiting,
-        cpu_utilization=utilization,
-        total_time=total_time,
-        context_switches=ctx,
-        trace=trace,
-        memory_timeline=memory_timeline,
-    )
+def _run_smp(w: Workload, quanta: Dict[str, int], trace_mode: TraceMode, scheduler: str, faults: bool = False
+             ) -> Dict[str, Any]:
+    # num_cpus > 1: per-core RR queues with work stealing (core/smp.py), one shared frame pool
+    pids = w.pids
+    q = [int(round(quanta.get(p, 1))) for p in pids]
+    with timed("rr", scheduler):
+        segments = list(iter_smp_segments(w.burst.tolist(), q, w.arrival.tolist(), w.num_cpus, w.cpu_idle_gap))
+    total_time = max((e for _, _, _, e in segments), default=0)
+    cores = [
+        [("IDLE" if i == IDLE else pids[i], s, e) for i, s, e in core]
+        for core in split_by_cpu(segments, w.num_cpus, total_time)
+    ]
+    # all cores' segments in start order (cpu order on ties); a process never overlaps itself
+    merged = sorted(((s, c, pid, e) for c, core in enumerate(cores) for pid, s, e in core if pid != "IDLE"),
+                    key=lambda seg: (seg[0], seg[1]))
+    timeline = [(pid, s, e) for s, _, pid, e in merged]
 
+    with timed("context_switches", scheduler):
+        ctx = sum(count_context_switches(core) for core in cores)
+    with timed("wait_turnaround", scheduler):
+        waiting, turnaround, _, _ = compute_wait_turnaround(pids, w.burst.tolist(), timeline,
+                                                            arrivals=dict(zip(pids, w.arrival.tolist())))
+    busy = [sum(e - s for pid, s, e in core if pid != "IDLE") for core in cores]
+    core_utilization = [(b / total_time) * 100.0 if total_time > 0 else 0.0 for b in busy]
 
-def simulate_memory_aware(cfg: SystemConfig) -> SimulationResult:
-    processes = [p.pid for p in cfg.processes]
-    bursts = [p.burst_time for p in cfg.processes]
-    arrivals = {p.pid: p.arrival_time for p in cfg.processes}
+    with timed("trace", scheduler):
+        trace_fields = _smp_trace_fields(cores, trace_mode)
+    fault_record = _fault_record(w, timeline, faults, scheduler)
+    record_simulation(scheduler, total_time, len(segments), len(trace_fields["trace"]) + len(trace_fields["trace_rle"] or ()))
 
-    mem_estimates: Dict[str, int] = {}
-    inferred_quanta: Dict[str, int] = {}
-    for p in cfg.processes:
-        mem_signal = min(1.0, (getattr(p, "pages_count", 0) / max(1, cfg.total_frames)))
-        mem_estimates[p.pid] = int(8 + mem_signal * (320 - 8))
-        inferred_quanta[p.pid] = max(1, int(round(cfg.cpu_quantum * (1.0 + mem_signal))))
+    return {
+        "turnaround_times": turnaround,
+        "waiting_times": waiting,
+        # mean over cores
+        "cpu_utilization": sum(core_utilization) / len(core_utilization),
+        "total_time": total_time,
+        "context_switches": ctx,
+        **trace_fields,
+        "fault_record": fault_record,
+        "memory_timeline": [{"pid": pid, "start": s, "end": e, "cpu": c} for s, c, pid, e in merged],
+        "inferred_quanta": None,
+        "memory_estimates": None,
+        "core_utilization": core_utilization,
+        "migrations": count_migrations(segments),
+    }
 
-    timeline = simulate_rr_with_quanta(processes, bursts, inferred_quanta, arrivals=arrivals, idle_between_quanta=getattr(cfg, "cpu_idle_gap", 0))
-    ctx = count_context_switches(timeline)
-    waiting, turnaround, avg_wait, avg_tat = compute_wait_turnaround(processes, bursts, timeline, arrivals=arrivals)
 
-    total_time = timeline[-1][2] if timeline else 0
-    cpu_busy = sum((e - s) for (pid, s, e) in timeline if pid != "IDLE")
-    utilization = (cpu_busy / total_time) * 100.0 if total_time > 0 else 0.0
+def _smp_trace_fields(cores: List[List[Tuple[str, int, int]]], trace_mode: TraceMode) -> Dict[str, Any]:
+    # the single-CPU rows per core, tagged with "cpu" and ordered by time, then cpu
+    if trace_mode == "rle":
+        runs = [dict(row, cpu=c) for c, core in enumerate(cores) for row in build_trace_rle(core)]
+        runs.sort(key=lambda row: (row["start"], row["cpu"]))
+        return {"trace": [], "trace_rle": runs}
+    rows = [dict(row, cpu=c) for c, core in enumerate(cores) for row in build_trace(core)]
+    rows.sort(key=lambda row: (row["time"], row["cpu"]))
+    return {"trace": rows, "trace_rle": None}
 
-    trace: List[TraceEntry] = []
-    for pid, s, e in timeline:
-        if pid == "IDLE":
-            for t in range(s, e):
-                trace.append(TraceEntry(time=t, event="idle", pid=None))
-        else:
-            for t in range(s, e):
-                trace.append(TraceEntry(time=t, event="running", pid=pid))
 
-    fault_record = {p.pid: [] for p in cfg.processes}
+def infer_memory_quanta(cfg: Union[SystemConfig, Workload]) -> Tuple[Dict[str, int], Dict[str, int]]:
+    # quantum grows with the share of frames a process needs; returns (quanta, memory estimates)
+    w = as_workload(cfg)
+    mem_signal = np.minimum(1.0, w.pages / max(1, w.total_frames))
+    mem_estimates = (8 + mem_signal * (320 - 8)).astype(np.int64)
+    # np.round rounds half to even, same as Python's round()
+    inferred_quanta = np.maximum(1, np.round(w.cpu_quantum * (1.0 + mem_signal))).astype(np.int64)
+    return dict(zip(w.pids, inferred_quanta.tolist())), dict(zip(w.pids, mem_estimates.tolist()))
+
+
+def run_baseline(cfg: Union[SystemConfig, Workload], trace_mode: TraceMode = "ticks", faults: bool = False
+                 ) -> Dict[str, Any]:
+    """simulate_baseline without building response models; output is SimulationResult-shaped."""
+    w = as_workload(cfg)
+    return _run_rr(w, {p: w.cpu_quantum for p in w.pids}, trace_mode, "baseline", faults)
+
+
+def run_memory_aware(cfg: Union[SystemConfig, Workload], trace_mode: TraceMode = "ticks", faults: bool = False
+                     ) -> Dict[str, Any]:
+    """simulate_memory_aware without building response models; output is SimulationResult-shaped."""
+    w = as_workload(cfg)
+    inferred_quanta, mem_estimates = infer_memory_quanta(w)
+    result = _run_rr(w, inferred_quanta, trace_mode, "memory_aware", faults)
+    result["inferred_quanta"] = inferred_quanta
+    result["memory_estimates"] = mem_estimates
+    return result
+
+
+def run_compare(cfg: Union[SystemConfig, Workload], trace_mode: TraceMode = "ticks", faults: bool = False
+                ) -> Dict[str, Dict[str, Any]]:
+    w = as_workload(cfg)
+    return {
+        "baseline": run_baseline(w, trace_mode, faults),
+        "memory_aware": run_memory_aware(w, trace_mode, faults),
+    }
+
 
-    # do not include IDLE rows in the per-process memory_timeline — frontend expects only real process bars
-    memory_timeline = [{"pid": pid, "start": s, "end": e} for (pid, s, e) in timeline if pid != "IDLE"]
+def simulate_baseline(cfg: Union[SystemConfig, Workload], trace_mode: TraceMode = "ticks", faults: bool = False
+                      ) -> SimulationResult:
+    return SimulationResult.model_validate(run_baseline(cfg, trace_mode, faults))
 
 
-    return SimulationResult(
-        turnaround_times=turnaround,
-        waiting_times=waiting,
-        cpu_utilization=utilization,
-        total_time=total_time,
-        context_switches=ctx,
-        trace=trace,
-        fault_record=fault_record,
-        memory_timeline=memory_timeline,
-        inferred_quanta=inferred_quanta,
-        memory_estimates=mem_estimates,
-    )
+def simulate_memory_aware(cfg: Union[SystemConfig, Workload], trace_mode: TraceMode = "ticks", faults: bool = False
+                          ) -> SimulationResult:
+    return SimulationResult.model_validate(run_memory_aware(cfg, trace_mode, faults))
 
 
-def compare_schedulers(cfg: SystemConfig) -> Dict[str, SimulationResult]:
+def compare_schedulers(cfg: Union[SystemConfig, Workload], trace_mode: TraceMode = "ticks",
+                       policies: Optional[List[str]] = None, faults: bool = False) -> Dict[str, SimulationResult]:
+    w = as_workload(cfg)
+    if policies:
+        # policies.py builds on this module
+        from .policies import run_policies
+        return {k: SimulationResult.model_validate(v) for k, v in run_policies(w, policies, trace_mode, faults).items()}
     return {
-        "baseline": simulate_baseline(cfg),
-        "memory_aware": simulate_memory_aware(cfg),
+        "baseline": simulate_baseline(w, trace_mode, faults),
+        "memory_aware": simulate_memory_aware(w, trace_mode, faults),
     }
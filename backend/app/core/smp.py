@@ -0,0 +1,304 @@
+# backend/app/core/smp.py
+from __future__ import annotations
+import heapq
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .engine import IDLE
+
+# simulated ticks between two rebalances (0 = about SMP_EPOCHS rebalances over the run, at
+# least the largest quantum apart)
+SMP_EPOCH = int(os.getenv("SMP_EPOCH", "0"))
+SMP_EPOCHS = 64
+# worker processes for the per-core phases (0 = one per CPU), and the workload size below which
+# the phases run inline instead; results are the same either way
+SMP_WORKERS = int(os.getenv("SMP_WORKERS", "0")) or os.cpu_count() or 1
+SMP_PARALLEL_MIN = int(os.getenv("SMP_PARALLEL_MIN", "20000"))
+
+# one core's phase: (cpu, start clock, epoch end, insert gaps, other work left, queue, arrivals),
+# queue and arrivals carrying (index, remaining, quantum) and (arrival, index, remaining, quantum)
+CoreTask = Tuple[int, int, int, int, bool, List[Tuple[int, int, int]], List[Tuple[int, int, int, int]]]
+
+_NEVER = float("inf")
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=SMP_WORKERS)
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    # a dead worker breaks the whole pool; the next _get_pool starts a fresh one
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False)
+
+
+def shutdown() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def _core_phase(task: CoreTask) -> Tuple[int, np.ndarray, List[Tuple[int, int]], int, int]:
+    """
+    Round robin on one core from `clock` until it starts no more quanta before `until`.
+    Returns (cpu, flat (index, start, end) segments, (index, remaining) for the processes
+    still queued in order, how many of them are untouched from the head of the given
+    queue, clock).
+    """
+    c, t, until, gap, more, queued, arrivals = task
+    rem = {i: r for i, r, _ in queued}
+    quantum = {i: q for i, _, q in queued}
+    for _, i, r, q in arrivals:
+        rem[i] = r
+        quantum[i] = q
+    queue = deque(i for i, _, _ in queued)
+    # the given queue's items never popped stay at its head, ahead of anything appended
+    fresh = len(queue)
+    out: List[int] = []
+    k = 0
+    next_arrival = arrivals[0][0] if arrivals else _NEVER
+    running = -1
+    while True:
+        # arrivals up to now are queued before the process preempted at this instant
+        while next_arrival <= t:
+            queue.append(arrivals[k][1])
+            k += 1
+            next_arrival = arrivals[k][0] if k < len(arrivals) else _NEVER
+        if running >= 0:
+            if rem[running] > 0:
+                queue.append(running)
+            running = -1
+        if t >= until:
+            break
+        if not queue:
+            if next_arrival == _NEVER:
+                break
+            t = next_arrival
+            continue
+        i = queue.popleft()
+        if fresh:
+            fresh -= 1
+        r = rem[i]
+        use = quantum[i]
+        if use > r:
+            use = r
+        out.extend((i, t, t + use))
+        rem[i] = r = r - use
+        t += use
+        running = i
+        if gap and (r > 0 or queue or next_arrival != _NEVER or more):
+            out.extend((IDLE, t, t + gap))
+            t += gap
+    return c, np.array(out, dtype=np.int64), [(i, rem[i]) for i in queue], fresh, t
+
+
+def _core_phases(tasks: List[CoreTask]) -> List[Tuple[int, np.ndarray, List[Tuple[int, int]], int, int]]:
+    return [_core_phase(task) for task in tasks]
+
+
+def _steal(queues: List[List[int]], running: List[int]) -> None:
+    # at an epoch boundary each core with an empty queue takes the most recently queued
+    # half of the longest queue (lowest cpu on ties); a process whose quantum is still
+    # running past the boundary stays where it is
+    for c, queue in enumerate(queues):
+        if queue:
+            continue
+        victim = max(range(len(queues)), key=lambda k: (len(queues[k]), -k))
+        taken = queues[victim]
+        if len(taken) < 2:
+            return
+        pinned = taken.pop() if taken[-1] == running[victim] else -1
+        half = len(taken) // 2 + (pinned < 0 and len(taken) % 2)
+        queue.extend(taken[len(taken) - half:])
+        del taken[len(taken) - half:]
+        if pinned >= 0:
+            taken.append(pinned)
+
+
+def _reach(queue: List[int], rem: List[int], quantum: List[int], gap: int, budget: int) -> int:
+    # how many queue entries a core can start within `budget` ticks: its first pass over
+    # them takes at least their sum of min(quantum, remaining) (plus a gap each), so the
+    # entries behind that are not reached before the boundary and need not be shipped
+    used = 0
+    for k, i in enumerate(queue):
+        if used >= budget:
+            return k
+        used += min(quantum[i], rem[i]) + gap
+    return len(queue)
+
+
+def iter_smp_segments(bursts: Sequence[int], quanta: Sequence[int], arrivals: Sequence[int], num_cpus: int,
+                      idle_between_quanta: int = 0, epoch: int = 0) -> Iterator[Tuple[int, int, int, int]]:
+    """
+    RR over `num_cpus` cores with one run queue each, simulated in epochs.
+    Yields (cpu, index, start, end), quanta in start-time order (cpu order on ties);
+    index == IDLE only for the idle_between_quanta gap a core inserts after a quantum,
+    yielded right after it.
+
+    Cores interact only at epoch boundaries, `epoch` ticks apart (default SMP_EPOCH):
+    - Work stealing: a core whose queue is empty takes the most recently queued process
+      from the core with the longest queue. That is the only way a process migrates.
+    - Placement: each process arriving during the coming epoch is assigned to the
+      least-loaded core (queued + already assigned, lowest cpu on ties), which queues
+      it at its arrival time.
+    Between boundaries every core runs its own queue round robin, a preempted process
+    going to the back after anything that arrived meanwhile, so the per-core phases of
+    an epoch are independent and run in a process pool for large workloads (inline in
+    worker processes, or below SMP_PARALLEL_MIN processes). A core that runs out of
+    work waits for the next boundary; a quantum is never cut at one.
+    """
+    n_cpus = max(1, int(num_cpus))
+    gap = int(idle_between_quanta or 0)
+    quantum = [max(1, int(q)) for q in quanta]
+    rem = [int(b) for b in bursts]
+    pending = sorted((int(a), i) for i, a in enumerate(arrivals) if rem[i] > 0)
+    if not pending:
+        return
+    # default: the busy time per core split into SMP_EPOCHS phases
+    epoch = max(1, int(epoch or SMP_EPOCH or max(max(quantum), sum(rem) // (n_cpus * SMP_EPOCHS))))
+    parallel = len(rem) >= SMP_PARALLEL_MIN and SMP_WORKERS > 1 and multiprocessing.parent_process() is None
+
+    queues: List[List[int]] = [[] for _ in range(n_cpus)]
+    clock = [0] * n_cpus
+    # per core, the process of its last quantum while that quantum (or its gap) runs past the boundary
+    running = [-1] * n_cpus
+    p = 0
+    t = pending[0][0]
+    while True:
+        queued = sum(len(q) for q in queues)
+        if not queued:
+            if p == len(pending):
+                return
+            # every core is idle: skip ahead to the next arrival
+            t = max(t, pending[p][0])
+        until = t + epoch
+        _steal(queues, [r if clock[c] > t else -1 for c, r in enumerate(running)])
+
+        placed: List[List[Tuple[int, int]]] = [[] for _ in range(n_cpus)]
+        loads = [(len(q), c) for c, q in enumerate(queues)]
+        heapq.heapify(loads)
+        while p < len(pending) and pending[p][0] < until:
+            a, i = pending[p]
+            p += 1
+            load, c = heapq.heappop(loads)
+            placed[c].append((a, i))
+            heapq.heappush(loads, (load + 1, c))
+        left = queued + sum(len(a) for a in placed) + len(pending) - p
+
+        tasks: List[CoreTask] = []
+        reach = [0] * n_cpus
+        for c in range(n_cpus):
+            if not queues[c] and not placed[c]:
+                continue
+            start = max(clock[c], t)
+            reach[c] = _reach(queues[c], rem, quantum, gap, until - start)
+            head = queues[c][:reach[c]]
+            tasks.append((c, start, until, gap, left > len(head) + len(placed[c]),
+                          [(i, rem[i], quantum[i]) for i in head],
+                          [(a, i, rem[i], quantum[i]) for a, i in placed[c]]))
+        if parallel and len(tasks) > 1:
+            # contiguous runs of cores per worker, so results come back in cpu order
+            size = -(-len(tasks) // SMP_WORKERS)
+            chunks = [tasks[k:k + size] for k in range(0, len(tasks), size)]
+            pool = _get_pool()
+            try:
+                results = [r for chunk in pool.map(_core_phases, chunks) for r in chunk]
+            except BrokenProcessPool:
+                # the phases are pure, so this epoch runs inline with the same result
+                _discard_pool(pool)
+                results = _core_phases(tasks)
+        else:
+            results = _core_phases(tasks)
+
+        runs = []
+        for c, out, queue, fresh, end in results:
+            # shipped processes missing from the returned queue have finished
+            for i in queues[c][:reach[c]]:
+                rem[i] = 0
+            for _, i in placed[c]:
+                rem[i] = 0
+            for i, r in queue:
+                rem[i] = r
+            order = [i for i, _ in queue]
+            queues[c] = order[:fresh] + queues[c][reach[c]:] + order[fresh:]
+            clock[c] = end
+            if len(out):
+                rows = out.reshape(-1, 3)
+                running[c] = int(rows[np.flatnonzero(rows[:, 0] != IDLE)[-1], 0])
+                runs.append((c, rows))
+        yield from _merge(runs, final=not any(queues) and p == len(pending))
+        t = until
+
+
+def _merge(runs: List[Tuple[int, np.ndarray]], final: bool) -> List[Tuple[int, int, int, int]]:
+    # one epoch's per-core (index, start, end) rows in start order, cpu order on ties; a gap
+    # keeps its place right after the quantum before it, whose start it sorts by
+    if not runs:
+        return []
+    cpu = np.concatenate([np.full(len(rows), c, dtype=np.int64) for c, rows in runs])
+    rows = np.concatenate([rows for _, rows in runs])
+    idle = rows[:, 0] == IDLE
+    key = rows[:, 1].copy()
+    key[idle] = rows[np.flatnonzero(idle) - 1, 1]
+    order = np.argsort(key, kind="stable")
+    cpu, rows, idle = cpu[order], rows[order], idle[order]
+    if final:
+        # no gap after the quantum that finishes the simulation
+        last = int(np.flatnonzero(~idle)[-1])
+        if last + 1 < len(rows) and idle[last + 1] and cpu[last + 1] == cpu[last]:
+            keep = np.ones(len(rows), dtype=bool)
+            keep[last + 1] = False
+            cpu, rows = cpu[keep], rows[keep]
+    return list(zip(cpu.tolist(), rows[:, 0].tolist(), rows[:, 1].tolist(), rows[:, 2].tolist()))
+
+
+def split_by_cpu(segments: Sequence[Tuple[int, int, int, int]], num_cpus: int, total_time: int
+                 ) -> List[List[Tuple[int, int, int]]]:
+    """
+    Per-core timelines of (index, start, end) covering [0, total_time), with the time a
+    core had nothing to run filled in as IDLE, like the single-CPU timeline.
+    """
+    cores: List[List[Tuple[int, int, int]]] = [[] for _ in range(num_cpus)]
+    clock = [0] * num_cpus
+    for c, i, s, e in segments:
+        if s > clock[c]:
+            cores[c].append((IDLE, clock[c], s))
+        cores[c].append((i, s, e))
+        clock[c] = e
+    for c in range(num_cpus):
+        if clock[c] < total_time:
+            cores[c].append((IDLE, clock[c], total_time))
+    return cores
+
+
+def count_migrations(segments: Sequence[Tuple[int, int, int, int]]) -> int:
+    # times a process resumes on a different core than the one it last ran on
+    last: Dict[int, int] = {}
+    migrations = 0
+    for c, i, _, _ in segments:
+        if i == IDLE:
+            continue
+        prev = last.get(i)
+        if prev is not None and prev != c:
+            migrations += 1
+        last[i] = c
+    return migrations
@@ -0,0 +1,186 @@
+# backend/app/core/stream.py
+from __future__ import annotations
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import orjson
+
+from ..models.schemas import SystemConfig, TraceMode
+from .engine import IDLE, iter_rr_segments
+from .scheduler import RR_ENGINE, compute_wait_turnaround, infer_memory_quanta, simulate_rr_with_quanta
+from .smp import iter_smp_segments
+from .sweep import rr_metrics, segment_metrics
+from .workload import Workload, as_workload
+from ..utils.metrics import timed
+
+# flush NDJSON to the client in chunks of roughly this many bytes
+STREAM_CHUNK_BYTES = 64 * 1024
+
+
+def _scheduler_params(w: Workload, scheduler: str) -> Dict[str, Any]:
+    if scheduler == "baseline":
+        return {"quanta": {p: w.cpu_quantum for p in w.pids}}
+    quanta, estimates = infer_memory_quanta(w)
+    return {"quanta": quanta, "inferred_quanta": quanta, "memory_estimates": estimates}
+
+
+class _Run:
+    # index-aligned inputs for the RR core, shared by the summary and segment passes
+    def __init__(self, w: Workload, scheduler: str):
+        self.scheduler = scheduler
+        self.pids = w.pids
+        n = len(self.pids)
+        self.bursts = w.burst
+        self.arrivals = w.arrival
+        self.params = _scheduler_params(w, scheduler)
+        quanta = self.params["quanta"]
+        self.quanta = np.fromiter((int(round(quanta.get(p, 1))) for p in self.pids), dtype=np.int64, count=n)
+        self.gap = w.cpu_idle_gap
+        self.num_cpus = w.num_cpus
+        self.arrival_map = dict(zip(self.pids, w.arrival.tolist()))
+        # RR_ENGINE other than "event" (single CPU): that engine's timeline, built once for both passes
+        self._timeline: Optional[List[Tuple[int, int, int]]] = None
+
+    @property
+    def streaming(self) -> bool:
+        return self.num_cpus > 1 or RR_ENGINE == "event"
+
+    def segments(self) -> Iterator[Tuple[int, int, int]]:
+        # single-CPU (index, start, end) segments from the configured RR engine, IDLE for idle time
+        if RR_ENGINE == "event":
+            return iter_rr_segments(self.bursts.tolist(), self.quanta.tolist(), self.arrivals.tolist(), self.gap)
+        if self._timeline is None:
+            index = {p: i for i, p in enumerate(self.pids)}
+            quanta = dict(zip(self.pids, self.quanta.tolist()))
+            timeline = simulate_rr_with_quanta(self.pids, self.bursts.tolist(), quanta, arrivals=self.arrival_map,
+                                               idle_between_quanta=self.gap)
+            self._timeline = [(IDLE if pid == "IDLE" else index[pid], s, e) for pid, s, e in timeline]
+        return iter(self._timeline)
+
+
+def simulation_summary(run: _Run) -> Dict[str, Any]:
+    # metrics-only pass over the RR core: no timeline is kept (except with a non-streaming RR_ENGINE)
+    with timed("rr_metrics", run.scheduler):
+        if run.streaming:
+            completion, total, busy, switches = rr_metrics(run.bursts, run.quanta, run.arrivals, run.gap, run.num_cpus)
+        else:
+            completion, total, busy, switches = segment_metrics(run.segments(), len(run.pids))
+    finished = [(run.pids[i], 0, c) for i, c in enumerate(completion.tolist()) if c >= 0]
+    waiting, turnaround, _, _ = compute_wait_turnaround(run.pids, run.bursts.tolist(), finished, arrivals=run.arrival_map)
+    summary: Dict[str, Any] = {
+        "type": "summary",
+        "turnaround_times": turnaround,
+        "waiting_times": waiting,
+        "cpu_utilization": (busy / (total * run.num_cpus)) * 100.0 if total > 0 else 0.0,
+        "total_time": total,
+        "context_switches": switches,
+    }
+    for k in ("inferred_quanta", "memory_estimates"):
+        if k in run.params:
+            summary[k] = run.params[k]
+    return summary
+
+
+def metrics_summary(w: Workload, scheduler: str) -> Dict[str, Any]:
+    """SimulationResult scalars and per-pid times from the metrics-only pass (no trace, timeline or paging)."""
+    summary = simulation_summary(_Run(w, scheduler))
+    del summary["type"]
+    return summary
+
+
+def iter_segment_records(run: _Run, trace_mode: TraceMode = "ticks") -> Iterator[Dict[str, Any]]:
+    """
+    Second pass, straight from the generator: per timeline segment a "segment" record
+    (non-IDLE only, like memory_timeline) followed by its trace rows ("trace" per tick,
+    or "trace_run" in rle mode), then "end".
+    """
+    if run.num_cpus > 1:
+        yield from _smp_segment_records(run, trace_mode)
+        return
+    pids = run.pids
+    trace_run: Optional[Dict[str, Any]] = None
+    for i, s, e in run.segments():
+        pid = None if i == IDLE else pids[i]
+        event = "idle" if i == IDLE else "running"
+        if pid is not None:
+            yield {"type": "segment", "pid": pid, "start": s, "end": e}
+        if trace_mode == "rle":
+            # same merging rule as build_trace_rle
+            last = trace_run
+            if last is not None and last["event"] == event and last["pid"] == pid and last["start"] + last["length"] == s:
+                last["length"] += e - s
+                continue
+            if last is not None:
+                yield last
+            trace_run = {"type": "trace_run", "event": event, "pid": pid, "start": s, "length": e - s}
+        else:
+            for t in range(s, e):
+                yield {"type": "trace", "time": t, "event": event, "pid": pid}
+    if trace_run is not None:
+        yield trace_run
+    yield {"type": "end"}
+
+
+def _smp_segment_records(run: _Run, trace_mode: TraceMode) -> Iterator[Dict[str, Any]]:
+    # num_cpus > 1: records carry "cpu"; time a core spends waiting for work is implied, not emitted
+    pids = run.pids
+    trace_runs: Dict[int, Dict[str, Any]] = {}
+    for c, i, s, e in iter_smp_segments(run.bursts.tolist(), run.quanta.tolist(), run.arrivals.tolist(),
+                                        run.num_cpus, run.gap):
+        pid = None if i == IDLE else pids[i]
+        event = "idle" if i == IDLE else "running"
+        if pid is not None:
+            yield {"type": "segment", "pid": pid, "start": s, "end": e, "cpu": c}
+        if trace_mode == "rle":
+            last = trace_runs.get(c)
+            if last is not None and last["event"] == event and last["pid"] == pid and last["start"] + last["length"] == s:
+                last["length"] += e - s
+                continue
+            if last is not None:
+                yield last
+            trace_runs[c] = {"type": "trace_run", "event": event, "pid": pid, "start": s, "length": e - s, "cpu": c}
+        else:
+            for t in range(s, e):
+                yield {"type": "trace", "time": t, "event": event, "pid": pid, "cpu": c}
+    yield from trace_runs.values()
+    yield {"type": "end"}
+
+
+def iter_ndjson(records: Iterator[Dict[str, Any]], scheduler: Optional[str] = None) -> Iterator[bytes]:
+    # newline-delimited JSON, buffered into chunks; tags each record with its scheduler for /compare
+    buf = []
+    size = 0
+    for rec in records:
+        if scheduler is not None:
+            rec["scheduler"] = scheduler
+        line = orjson.dumps(rec, option=orjson.OPT_APPEND_NEWLINE)
+        buf.append(line)
+        size += len(line)
+        if size >= STREAM_CHUNK_BYTES:
+            yield b"".join(buf)
+            buf = []
+            size = 0
+    if buf:
+        yield b"".join(buf)
+
+
+def stream_simulation(cfg: Union[SystemConfig, Workload], scheduler: str, trace_mode: TraceMode = "ticks") -> Iterator[bytes]:
+    """
+    NDJSON stream for one scheduler: the "summary" record first, then segments and
+    trace rows. With the event RR engine memory stays O(processes) whatever the
+    simulated horizon (RR_ENGINE=legacy keeps its timeline); paging faults are not
+    part of the stream.
+    """
+    run = _Run(as_workload(cfg), scheduler)
+    yield from iter_ndjson(iter([simulation_summary(run)]))
+    yield from iter_ndjson(iter_segment_records(run, trace_mode))
+
+
+def stream_compare(cfg: Union[SystemConfig, Workload], trace_mode: TraceMode = "ticks") -> Iterator[bytes]:
+    # both summaries up front, then each scheduler's segments; records carry a "scheduler" tag
+    w = as_workload(cfg)
+    runs = {name: _Run(w, name) for name in ("baseline", "memory_aware")}
+    for name, run in runs.items():
+        yield from iter_ndjson(iter([simulation_summary(run)]), name)
+    for name, run in runs.items():
+        yield from iter_ndjson(iter_segment_records(run, trace_mode), name)
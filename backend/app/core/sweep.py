@@ -0,0 +1,146 @@
+# backend/app/core/sweep.py
+from __future__ import annotations
+import hashlib
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..models.schemas import SystemConfig
+from .engine import IDLE, iter_rr_segments
+from .smp import iter_smp_segments
+from .workload import Workload, as_workload
+
+METRICS = ("avg_wait", "avg_turnaround", "cpu_utilization", "context_switches")
+
+
+def rr_metrics(bursts: np.ndarray, quanta: np.ndarray, arrivals: np.ndarray, idle_gap: int, num_cpus: int = 1
+               ) -> Tuple[np.ndarray, int, int, int]:
+    """
+    Run the event-driven RR core without building a timeline or trace.
+    Returns (completion times, total_time, busy_time, context_switches); with num_cpus > 1
+    busy time and switches are summed over cores.
+    Completion is -1 for processes that never ran (burst <= 0), like compute_wait_turnaround.
+    """
+    if num_cpus > 1:
+        return _smp_metrics(bursts, quanta, arrivals, idle_gap, num_cpus)
+    return segment_metrics(iter_rr_segments(bursts.tolist(), quanta.tolist(), arrivals.tolist(), idle_gap), len(bursts))
+
+
+def segment_metrics(segments: Iterable[Tuple[int, int, int]], n: int) -> Tuple[np.ndarray, int, int, int]:
+    # rr_metrics over any single-CPU (index, start, end) segment sequence in time order
+    completion = np.full(n, -1, dtype=np.int64)
+    total = busy = switches = 0
+    prev = None
+    for i, s, e in segments:
+        # same rule as count_context_switches: IDLE on either side is not a switch
+        if prev is not None and i != IDLE and prev != IDLE and i != prev:
+            switches += 1
+        prev = i
+        total = e
+        if i != IDLE:
+            busy += e - s
+            completion[i] = e
+    return completion, total, busy, switches
+
+
+def _smp_metrics(bursts: np.ndarray, quanta: np.ndarray, arrivals: np.ndarray, idle_gap: int, num_cpus: int
+                 ) -> Tuple[np.ndarray, int, int, int]:
+    completion = np.full(len(bursts), -1, dtype=np.int64)
+    total = busy = switches = 0
+    prev = [IDLE] * num_cpus
+    clock = [0] * num_cpus
+    for c, i, s, e in iter_smp_segments(bursts.tolist(), quanta.tolist(), arrivals.tolist(), num_cpus, idle_gap):
+        # a core waiting for work between two segments counts as IDLE, as in split_by_cpu
+        if i != IDLE and prev[c] != IDLE and s == clock[c] and i != prev[c]:
+            switches += 1
+        prev[c] = i
+        clock[c] = e
+        total = max(total, e)
+        if i != IDLE:
+            busy += e - s
+            completion[i] = e
+    return completion, total, busy, switches
+
+
+def memory_aware_quanta(cpu_quantum: Sequence[int], total_frames: Sequence[int], pages: np.ndarray
+                        ) -> Iterator[np.ndarray]:
+    """
+    Vectorized version of the quantum inference in simulate_memory_aware: one quanta
+    vector per (cpu_quantum, total_frames) point, cpu_quantum-major.
+    """
+    for q in cpu_quantum:
+        for f in total_frames:
+            mem_signal = np.minimum(1.0, pages / max(1, f))
+            # np.round rounds half to even, same as Python's round()
+            yield np.maximum(1, np.round(q * (1.0 + mem_signal))).astype(np.int64)
+
+
+def _run_lanes(lanes: Iterable[np.ndarray], gaps: np.ndarray, bursts: np.ndarray, arrivals: np.ndarray,
+               num_cpus: int = 1) -> Dict[str, np.ndarray]:
+    """
+    lanes: quanta vectors, one per grid point; gaps: (G,) idle gaps.
+    Identical lanes are simulated once and broadcast back, and each simulation is reduced
+    to its sums as soon as it returns, so memory stays O(L * G + n) rather than one
+    completion vector per lane and gap.
+    Returns metric arrays shaped (L, G).
+    """
+    n = len(bursts)
+    seen: Dict[bytes, int] = {}
+    sums: List[List[Tuple[int, int, int, int, int]]] = []
+    inverse: List[int] = []
+    for quanta in lanes:
+        # a digest instead of the vector itself, so the distinct lanes are not all held either
+        key = hashlib.blake2b(quanta.tobytes(), digest_size=32).digest()
+        u = seen.get(key)
+        if u is None:
+            u = seen[key] = len(sums)
+            sums.append([_lane_sums(bursts, quanta, arrivals, gap, num_cpus) for gap in gaps.tolist()])
+        inverse.append(u)
+
+    wait, turnaround, total, busy, switches = np.array(sums, dtype=np.int64).reshape(len(sums), len(gaps), 5
+                                                                                   ).transpose(2, 0, 1)
+    denom = max(1, n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        utilization = np.where(total > 0, busy / (total * num_cpus) * 100.0, 0.0)
+    out = {
+        "avg_wait": wait / denom,
+        "avg_turnaround": turnaround / denom,
+        "cpu_utilization": utilization,
+        "context_switches": switches,
+    }
+    return {k: v[inverse] for k, v in out.items()}
+
+
+def _lane_sums(bursts: np.ndarray, quanta: np.ndarray, arrivals: np.ndarray, gap: int, num_cpus: int
+               ) -> Tuple[int, int, int, int, int]:
+    # one simulation as (total wait, total turnaround, total_time, busy time, switches)
+    completion, total, busy, switches = rr_metrics(bursts, quanta, arrivals, gap, num_cpus)
+    ran = completion >= 0
+    turnaround = int(np.where(ran, completion - arrivals, 0).sum())
+    return turnaround - int(bursts[ran].sum()), turnaround, total, busy, switches
+
+
+def sweep(cfg: Union[SystemConfig, Workload], cpu_quantum: List[int], total_frames: List[int], cpu_idle_gap: List[int]
+          ) -> Dict[str, Dict[str, list]]:
+    """
+    Run baseline and memory-aware RR over the cpu_quantum x total_frames x cpu_idle_gap grid.
+    Metric lists are flattened row-major in that axis order.
+    """
+    w = as_workload(cfg)
+    bursts, arrivals = w.burst, w.arrival
+    pages = w.pages.astype(np.float64)
+    g = np.asarray(cpu_idle_gap, dtype=np.int64)
+
+    # baseline ignores total_frames: simulate (Q, G) and broadcast across F
+    base_lanes = (np.full(len(bursts), q, dtype=np.int64) for q in cpu_quantum)
+    base = _run_lanes(base_lanes, g, bursts, arrivals, w.num_cpus)
+    shape = (len(cpu_quantum), len(total_frames), len(g))
+    base = {k: np.broadcast_to(v[:, None, :], shape) for k, v in base.items()}
+
+    mem = _run_lanes(memory_aware_quanta(cpu_quantum, total_frames, pages), g, bursts, arrivals, w.num_cpus)
+    mem = {k: v.reshape(shape) for k, v in mem.items()}
+
+    return {
+        "baseline": {k: base[k].reshape(-1).tolist() for k in METRICS},
+        "memory_aware": {k: mem[k].reshape(-1).tolist() for k in METRICS},
+    }
@@ -0,0 +1,129 @@
+# backend/app/core/timeline_index.py
+from __future__ import annotations
+import os
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from ..utils.lru import LRUCache
+
+# runs whose timeline indexes stay in memory for /runs/{id}/timeline
+TIMELINE_CACHE_RUNS = int(os.getenv("TIMELINE_CACHE_RUNS", "16"))
+
+
+# segment times and viewport bounds live in int64
+MAX_TIME = int(np.iinfo(np.int64).max)
+
+
+def _valid(seg: Any) -> bool:
+    if not isinstance(seg, dict) or seg.get("pid") is None:
+        return False
+    start, end = seg.get("start"), seg.get("end")
+    return (type(start) is int and type(end) is int) and 0 <= start <= end <= MAX_TIME
+
+
+class TimelineIndex:
+    """
+    A run's memory_timeline (busy segments, non-overlapping) as sorted numpy columns plus a
+    prefix sum of busy time. A viewport query is two binary searches plus work proportional
+    to the segments inside it; busy time up to any instant is a binary search.
+    """
+
+    __slots__ = ("pids", "codes", "starts", "ends", "busy_before", "horizon")
+
+    def __init__(self, segments: Sequence[Any]):
+        # saved results are free-form: segments without a pid and int 0 <= start <= end are skipped
+        segments = [s for s in segments if _valid(s)]
+        n = len(segments)
+        codes_by_pid: Dict[str, int] = {}
+        codes = np.fromiter((codes_by_pid.setdefault(str(s["pid"]), len(codes_by_pid)) for s in segments),
+                            dtype=np.int64, count=n)
+        starts = np.fromiter((s["start"] for s in segments), dtype=np.int64, count=n)
+        ends = np.fromiter((s["end"] for s in segments), dtype=np.int64, count=n)
+        order = np.argsort(starts, kind="stable")
+        self.pids: List[str] = list(codes_by_pid)
+        self.codes = codes[order]
+        self.starts = starts[order]
+        self.ends = ends[order]
+        self.busy_before = np.concatenate(([0], np.cumsum(self.ends - self.starts)))
+        self.horizon = int(self.ends.max()) if n else 0
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def window(self, start: int, end: int) -> Tuple[int, int]:
+        # [lo, hi) of the segments overlapping [start, end); ends are sorted too since segments don't overlap
+        lo = int(np.searchsorted(self.ends, start, side="right"))
+        hi = int(np.searchsorted(self.starts, end, side="left"))
+        return lo, max(lo, hi)
+
+    def busy_until(self, t: np.ndarray) -> np.ndarray:
+        """Busy time in [0, t) for each instant in t."""
+        k = np.searchsorted(self.starts, t, side="right")
+        busy = self.busy_before[k]
+        prev = np.maximum(k - 1, 0)
+        # the last segment starting at or before t may still be running at t
+        overhang = np.where(k > 0, np.maximum(self.ends[prev] - t, 0), 0) if len(self) else 0
+        return busy - overhang
+
+    def query(self, start: int, end: int, resolution: int) -> Dict[str, Any]:
+        """
+        The viewport [start, end) at `resolution` buckets. When it holds at most `resolution`
+        segments they are returned as they are; otherwise each non-empty bucket is returned
+        with its dominant pid (most busy time), busy fraction and segment count.
+        """
+        lo, hi = self.window(start, end)
+        out: Dict[str, Any] = {"total_segments": len(self), "horizon": self.horizon, "in_view": hi - lo}
+        if hi - lo <= resolution:
+            pids = self.pids
+            out["level"] = "segments"
+            out["segments"] = [
+                {"pid": pids[c], "start": s, "end": e}
+                for c, s, e in zip(self.codes[lo:hi].tolist(), self.starts[lo:hi].tolist(), self.ends[lo:hi].tolist())
+            ]
+            return out
+
+        resolution = min(resolution, end - start)
+        # i * (end - start) // resolution, split so that no product overflows int64
+        q, r = divmod(end - start, resolution)
+        steps = np.arange(resolution + 1, dtype=np.int64)
+        edges = start + steps * q + (steps * r) // resolution
+        busy = np.diff(self.busy_until(edges))
+
+        # split the visible segments at bucket edges; pieces <= segments + buckets
+        s = np.clip(self.starts[lo:hi], start, end)
+        e = np.clip(self.ends[lo:hi], start, end)
+        first = np.searchsorted(edges, s, side="right") - 1
+        last = np.searchsorted(edges, e, side="left") - 1
+        pieces = last - first + 1
+        seg = np.repeat(np.arange(hi - lo), pieces)
+        offsets = np.concatenate(([0], np.cumsum(pieces)[:-1]))
+        bucket = first[seg] + (np.arange(len(seg)) - offsets[seg])
+        dur = np.minimum(e[seg], edges[bucket + 1]) - np.maximum(s[seg], edges[bucket])
+        counts = np.bincount(bucket, minlength=resolution)
+
+        # busy time per (bucket, pid), then the largest per bucket (lowest pid code on ties)
+        n_pids = max(1, len(self.pids))
+        keys, inverse = np.unique(bucket * n_pids + self.codes[lo:hi][seg], return_inverse=True)
+        totals = np.bincount(inverse, weights=dur)
+        key_bucket, key_code = keys // n_pids, keys % n_pids
+        order = np.lexsort((key_code, -totals, key_bucket))
+        head = order[np.r_[True, key_bucket[order][1:] != key_bucket[order][:-1]]]
+        dominant = np.full(resolution, -1, dtype=np.int64)
+        dominant[key_bucket[head]] = key_code[head]
+
+        pids = self.pids
+        width = np.diff(edges)
+        out["level"] = "buckets"
+        out["buckets"] = [
+            {"start": bs, "end": be, "pid": pids[d], "busy": b / w, "segments": c}
+            for bs, be, d, b, w, c in zip(edges[:-1].tolist(), edges[1:].tolist(), dominant.tolist(),
+                                          busy.tolist(), width.tolist(), counts.tolist())
+            if c
+        ]
+        return out
+
+
+# whatever routers/runs.py builds per run (its per-core TimelineIndexes); saved runs are
+# immutable, so entries never go stale
+timeline_indexes: LRUCache[Any, Any] = LRUCache(TIMELINE_CACHE_RUNS)
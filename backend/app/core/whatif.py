@@ -0,0 +1,232 @@
+# backend/app/core/whatif.py
+from __future__ import annotations
+import heapq
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..models.schemas import ProcessPatch, TraceMode
+from ..utils.lru import LRUCache
+from ..utils.metrics import timed
+from .engine import IDLE, RRCheckpoint, initial_rr_state, resume_rr_segments
+from .scheduler import infer_memory_quanta, run_baseline, run_memory_aware, summarize_timeline
+from .workload import Workload
+
+# quanta between engine checkpoints; 0 means max(MIN_CHECKPOINT_EVERY, process count),
+# which keeps the O(processes) checkpoint copies proportional to the timeline length
+WHATIF_CHECKPOINT_EVERY = int(os.getenv("WHATIF_CHECKPOINT_EVERY", "0"))
+# recorded base runs (timeline + checkpoints per scheduler) kept in memory
+WHATIF_CACHE_RUNS = int(os.getenv("WHATIF_CACHE_RUNS", "8"))
+MIN_CHECKPOINT_EVERY = 256
+
+SCHEDULERS = ("baseline", "memory_aware")
+# num_cpus > 1 has no checkpoints to resume from; those runs are simulated in full
+FULL_RUNS = {"baseline": run_baseline, "memory_aware": run_memory_aware}
+
+
+def scheduler_quanta(w: Workload, scheduler: str) -> Tuple[List[int], Optional[Dict[str, int]], Optional[Dict[str, int]]]:
+    # per-index quanta as simulate_rr_with_quanta resolves them, plus the memory-aware extras
+    if scheduler == "baseline":
+        return [w.cpu_quantum] * len(w), None, None
+    quanta, estimates = infer_memory_quanta(w)
+    return [int(round(quanta.get(p, 1))) for p in w.pids], quanta, estimates
+
+
+class RecordedRun:
+    """One scheduler's base timeline plus (segment count, engine state) checkpoints."""
+
+    __slots__ = ("timeline", "checkpoints", "quanta")
+
+    def __init__(self, w: Workload, scheduler: str, every: int = 0):
+        pids = w.pids
+        self.quanta, _, _ = scheduler_quanta(w, scheduler)
+        self.timeline: List[Tuple[str, int, int]] = []
+        timeline = self.timeline
+        # the initial state is always a valid resume point
+        self.checkpoints: List[Tuple[int, RRCheckpoint]] = [(0, initial_rr_state(w.burst.tolist(), w.arrival.tolist()))]
+
+        def keep(state: RRCheckpoint) -> None:
+            self.checkpoints.append((len(timeline), state))
+
+        every = every or WHATIF_CHECKPOINT_EVERY or max(MIN_CHECKPOINT_EVERY, len(w))
+        segments = resume_rr_segments(initial_rr_state(w.burst.tolist(), w.arrival.tolist()), self.quanta,
+                                      w.cpu_idle_gap, every, keep)
+        for i, s, e in segments:
+            timeline.append(("IDLE" if i == IDLE else pids[i], s, e))
+
+
+# recorded base runs keyed by (workload digest, scheduler)
+recordings: LRUCache[Tuple[str, str], RecordedRun] = LRUCache(WHATIF_CACHE_RUNS)
+
+
+class WhatIf:
+    """
+    A process diff applied to a base workload.
+
+    Engine indices are the base positions followed by added processes; removed processes
+    keep their slot with zero burst, which the RR core treats exactly like absence, so the
+    relative order of everything else (and thus the base checkpoints) stays valid.
+    """
+
+    def __init__(self, base: Workload, changes: Sequence[ProcessPatch]):
+        if len(set(base.pids)) != len(base.pids):
+            raise ValueError("what-if needs unique pids in the base run")
+        index = {pid: i for i, pid in enumerate(base.pids)}
+        seen = set()
+        pids = list(base.pids)
+        cols = {k: getattr(base, k).tolist() for k in ("arrival", "burst", "priority", "pages")}
+        removed = set()
+        for patch in changes:
+            if patch.pid in seen:
+                raise ValueError(f"process {patch.pid!r} is changed more than once")
+            seen.add(patch.pid)
+            fields = {"arrival": patch.arrival_time, "burst": patch.burst_time,
+                      "priority": patch.priority, "pages": patch.pages_count}
+            i = index.get(patch.pid)
+            if i is None:
+                if patch.remove:
+                    raise ValueError(f"process {patch.pid!r} is not in the base run")
+                if any(v is None for v in fields.values()):
+                    raise ValueError(f"new process {patch.pid!r} needs arrival_time, burst_time, priority and pages_count")
+                pids.append(patch.pid)
+                for k, v in fields.items():
+                    cols[k].append(v)
+                continue
+            if patch.remove:
+                removed.add(i)
+                continue
+            for k, v in fields.items():
+                if v is not None:
+                    cols[k][i] = v
+
+        self.base = base
+        self.pids = pids
+        self.removed = removed
+        keep = [i for i in range(len(pids)) if i not in removed]
+        arrays = {k: np.asarray(v, dtype=np.int64) for k, v in cols.items()}
+        self.workload = base.with_processes([pids[i] for i in keep], *(arrays[k][keep] for k in ("arrival", "burst", "priority", "pages")))
+        self.arrival = arrays["arrival"].tolist()
+        # removed slots run as zero-burst placeholders
+        self.burst = [0 if i in removed else b for i, b in enumerate(arrays["burst"].tolist())]
+
+    def run(self, scheduler: str, trace_mode: TraceMode = "ticks", faults: bool = False) -> Tuple[Dict[str, Any], int]:
+        """
+        Re-simulate one scheduler from the latest base checkpoint the diff cannot have
+        influenced. Returns (SimulationResult-shaped dict, resume time).
+        """
+        if self.workload.num_cpus > 1:
+            return FULL_RUNS[scheduler](self.workload, trace_mode, faults), 0
+        base_run = recordings.get_or_build((self.base.digest(), scheduler),
+                                           lambda: RecordedRun(self.base, scheduler))
+        new_quanta, inferred, estimates = scheduler_quanta(self.workload, scheduler)
+        # quanta over engine indices: base values, then the new workload's for changed and added slots
+        by_pid = dict(zip(self.workload.pids, new_quanta))
+        quanta = [by_pid.get(pid, 1) for pid in self.pids]
+
+        n_base = len(self.base)
+        old_arrival = self.base.arrival.tolist()
+        old_burst = self.base.burst.tolist()
+        changed = []
+        for i in range(len(self.pids)):
+            if i >= n_base:
+                changed.append((i, 0, 0))
+            elif (self.arrival[i], self.burst[i], quanta[i]) != (old_arrival[i], old_burst[i], base_run.quanta[i]):
+                changed.append((i, old_arrival[i], old_burst[i]))
+
+        if changed:
+            with timed("rr_resume", scheduler):
+                seg, state = self._resume_point(base_run.checkpoints, changed)
+                segments = resume_rr_segments(state, quanta, self.workload.cpu_idle_gap)
+                pids = self.pids
+                timeline = base_run.timeline[:seg]
+                timeline.extend(("IDLE" if i == IDLE else pids[i], s, e) for i, s, e in segments)
+            resumed_at = state.t
+        else:
+            # only priority or pages without a quantum change: the schedule is the base one
+            timeline = list(base_run.timeline)
+            resumed_at = timeline[-1][2] if timeline else 0
+
+        result = summarize_timeline(self.workload, timeline, trace_mode, scheduler, faults)
+        if inferred is not None:
+            result["inferred_quanta"] = inferred
+            result["memory_estimates"] = estimates
+        return result, resumed_at
+
+    def compare(self, trace_mode: TraceMode = "ticks", faults: bool = False
+                ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, int]]:
+        # CompareBundle-shaped dict for the edited workload, plus the resume time per scheduler
+        results, resumed = {}, {}
+        for name in SCHEDULERS:
+            results[name], resumed[name] = self.run(name, trace_mode, faults)
+        return results, resumed
+
+    def _resume_point(self, checkpoints: List[Tuple[int, RRCheckpoint]], changed: List[Tuple[int, int, int]]
+                      ) -> Tuple[int, RRCheckpoint]:
+        # validity only ever goes from true to false as time advances, so binary search;
+        # checkpoint 0 is the initial state, where starting over with the new columns is always right
+        lo, hi = 0, len(checkpoints) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self._patch(checkpoints[mid][1], changed) is not None:
+                lo = mid
+            else:
+                hi = mid - 1
+        seg, cp = checkpoints[lo]
+        state = self._patch(cp, changed) if lo else initial_rr_state(self.burst, self.arrival)
+        return seg, state
+
+    def _patch(self, cp: RRCheckpoint, changed: List[Tuple[int, int, int]]) -> Optional[RRCheckpoint]:
+        """
+        The base state at `cp` with the diff applied, or None if the prefix before `cp`
+        could have run differently. A changed process must not have run yet. If its arrival
+        changed, or it was not live before, it must not have been admitted and the new arrival
+        must be >= cp.t (no iteration before a checkpoint ran at cp.t, so the prefix never read
+        it). At least one unchanged process must still be live, so `live` never hit zero
+        because of a changed one.
+        """
+        old_live = sum(1 for _, _, b in changed if b > 0)
+        if cp.live <= old_live:
+            return None
+        pending_idx = {i for _, i in cp.pending}
+        rem = cp.rem[:] + [0] * (len(self.pids) - len(cp.rem))
+        pending = cp.pending
+        current, upcoming = cp.current, cp.upcoming
+        drop_pending, drop_queued, admit = set(), set(), []
+        live = cp.live - old_live
+        for i, a, b in changed:
+            new_a, new_b = self.arrival[i], self.burst[i]
+            if b > 0 and i not in pending_idx:
+                # admitted before cp: only burst/quantum may change, and only before its first quantum
+                if rem[i] != b or new_a != a:
+                    return None
+                if new_b > 0:
+                    rem[i] = new_b
+                    live += 1
+                else:
+                    drop_queued.add(i)
+                    rem[i] = 0
+                continue
+            # a process that was never live has no arrival the base run could have read
+            if new_b > 0 and (new_a != a or b <= 0) and new_a < cp.t:
+                return None
+            if b > 0:
+                drop_pending.add(i)
+            rem[i] = new_b
+            if new_b > 0:
+                admit.append((new_a, i))
+                live += 1
+
+        if drop_pending or admit:
+            pending = [entry for entry in pending if entry[1] not in drop_pending] + admit
+            heapq.heapify(pending)
+        else:
+            pending = pending[:]
+        if drop_queued:
+            current = [i for i in current if i not in drop_queued]
+            upcoming = [i for i in upcoming if i not in drop_queued]
+            heapq.heapify(current)
+            heapq.heapify(upcoming)
+        else:
+            current, upcoming = current[:], upcoming[:]
+        return RRCheckpoint(cp.t, rem, pending, current, upcoming, cp.cursor, cp.made_progress, live)
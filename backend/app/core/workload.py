@@ -0,0 +1,199 @@
+# backend/app/core/workload.py
+from __future__ import annotations
+import hashlib
+import io
+import json
+from typing import Any, Dict, Iterable, List, Union
+
+import numpy as np
+from pydantic import TypeAdapter, ValidationError
+from typing_extensions import TypedDict
+
+from ..models.schemas import Int64, SystemConfig, SystemParams
+
+# system keys required for the flat request shape (same rule as AcceptsEither._coerce)
+FLAT_KEYS = ("total_frames", "page_size", "cpu_quantum", "memory_threshold", "processes")
+SYSTEM_KEYS = tuple(SystemParams.model_fields)
+
+
+class ProcessRow(TypedDict):
+    # same fields and coercion as schemas.Process, but validated without building model instances
+    pid: str
+    arrival_time: Int64
+    burst_time: Int64
+    priority: Int64
+    pages_count: Int64
+
+
+_process_rows = TypeAdapter(List[ProcessRow])
+
+
+class Workload:
+    """
+    Columnar, validated workload: system parameters plus one NumPy array per process field,
+    aligned by index (index i is pids[i]). Built in one validation pass from the raw request
+    body, or from an existing SystemConfig.
+    """
+
+    __slots__ = (
+        "pids", "arrival", "burst", "priority", "pages",
+        "total_frames", "page_size", "cpu_quantum", "memory_threshold", "cpu_idle_gap",
+        "replacement_policy", "paging_seed", "num_cpus",
+    )
+
+    def __init__(self, system: SystemParams, pids: List[str], arrival: np.ndarray, burst: np.ndarray,
+                 priority: np.ndarray, pages: np.ndarray):
+        self.pids = pids
+        self.arrival = arrival
+        self.burst = burst
+        self.priority = priority
+        self.pages = pages
+        for k in SYSTEM_KEYS:
+            setattr(self, k, getattr(system, k))
+
+    def __len__(self) -> int:
+        return len(self.pids)
+
+    @classmethod
+    def from_rows(cls, system: SystemParams, rows: List[Dict[str, Any]]) -> "Workload":
+        n = len(rows)
+
+        def column(key: str) -> np.ndarray:
+            return np.fromiter((r[key] for r in rows), dtype=np.int64, count=n)
+
+        return cls(system, [r["pid"] for r in rows], column("arrival_time"), column("burst_time"),
+                   column("priority"), column("pages_count"))
+
+    @classmethod
+    def from_payload(cls, data: Any) -> "Workload":
+        """
+        Validate a raw request body, nested ({system, processes}) or flat. Raises
+        pydantic.ValidationError with body-relative locations.
+        """
+        if isinstance(data, dict) and "system" in data and "processes" in data:
+            system_data, rows_data = data["system"], data["processes"]
+            prefix: tuple = ("system",)
+        elif isinstance(data, dict) and all(k in data for k in FLAT_KEYS):
+            system_data = {k: data[k] for k in SYSTEM_KEYS if k in data}
+            rows_data = data["processes"]
+            prefix = ()
+        else:
+            raise ValidationError.from_exception_data("Workload", [{
+                "type": "missing",
+                "loc": ("system",),
+                "input": data,
+            }])
+        try:
+            system = SystemParams.model_validate(system_data)
+        except ValidationError as exc:
+            raise _relocate(exc, prefix)
+        try:
+            rows = _process_rows.validate_python(rows_data)
+        except ValidationError as exc:
+            raise _relocate(exc, ("processes",))
+        return cls.from_rows(system, rows)
+
+    @classmethod
+    def from_chunks(cls, system: SystemParams, chunks: Iterable[List[Dict[str, Any]]]) -> "Workload":
+        """
+        Validate process rows chunk by chunk (e.g. while a file is being read) and append
+        them to the columns. Error locations are ("processes", row index, field) over all rows.
+        """
+        pids: List[str] = []
+        parts: Dict[str, List[np.ndarray]] = {"arrival_time": [], "burst_time": [], "priority": [], "pages_count": []}
+        for chunk in chunks:
+            try:
+                rows = _process_rows.validate_python(chunk)
+            except ValidationError as exc:
+                errors = []
+                for err in exc.errors(include_url=False):
+                    err = dict(err)
+                    loc = tuple(err["loc"])
+                    err["loc"] = ("processes", len(pids) + loc[0]) + loc[1:]
+                    errors.append(err)
+                raise ValidationError.from_exception_data(exc.title, errors)
+            n = len(rows)
+            for key, col in parts.items():
+                col.append(np.fromiter((r[key] for r in rows), dtype=np.int64, count=n))
+            pids.extend(r["pid"] for r in rows)
+
+        def column(key: str) -> np.ndarray:
+            return np.concatenate(parts[key]) if parts[key] else np.zeros(0, dtype=np.int64)
+
+        return cls(system, pids, column("arrival_time"), column("burst_time"), column("priority"), column("pages_count"))
+
+    @classmethod
+    def from_config(cls, cfg: SystemConfig) -> "Workload":
+        system = SystemParams.model_validate({k: getattr(cfg, k) for k in SYSTEM_KEYS})
+        procs = cfg.processes
+        n = len(procs)
+        return cls(
+            system,
+            [p.pid for p in procs],
+            np.fromiter((p.arrival_time for p in procs), dtype=np.int64, count=n),
+            np.fromiter((p.burst_time for p in procs), dtype=np.int64, count=n),
+            np.fromiter((p.priority for p in procs), dtype=np.int64, count=n),
+            np.fromiter((p.pages_count for p in procs), dtype=np.int64, count=n),
+        )
+
+    def with_processes(self, pids: List[str], arrival: np.ndarray, burst: np.ndarray, priority: np.ndarray,
+                       pages: np.ndarray) -> "Workload":
+        # same system parameters, different process columns
+        w = Workload.__new__(Workload)
+        for k in SYSTEM_KEYS:
+            setattr(w, k, getattr(self, k))
+        w.pids, w.arrival, w.burst, w.priority, w.pages = pids, arrival, burst, priority, pages
+        return w
+
+    def with_system(self, system: SystemParams) -> "Workload":
+        # same process columns, different system parameters
+        return Workload(system, self.pids, self.arrival, self.burst, self.priority, self.pages)
+
+    def to_blob(self) -> bytes:
+        # process columns as a compressed .npz (no pickling); system parameters are stored separately
+        buf = io.BytesIO()
+        np.savez_compressed(buf, pids=np.asarray(self.pids, dtype=str), arrival=self.arrival, burst=self.burst,
+                            priority=self.priority, pages=self.pages)
+        return buf.getvalue()
+
+    @classmethod
+    def from_blob(cls, system: SystemParams, blob: bytes) -> "Workload":
+        with np.load(io.BytesIO(blob), allow_pickle=False) as data:
+            return cls(system, data["pids"].tolist(), data["arrival"], data["burst"], data["priority"], data["pages"])
+
+    def system(self) -> Dict[str, Any]:
+        return {k: getattr(self, k) for k in SYSTEM_KEYS}
+
+    def to_input(self) -> Dict[str, Any]:
+        # nested SimulationInput-shaped dict, as stored with saved runs
+        arrival, burst, priority, pages = (a.tolist() for a in (self.arrival, self.burst, self.priority, self.pages))
+        return {
+            "system": self.system(),
+            "processes": [
+                {"pid": pid, "arrival_time": arrival[i], "burst_time": burst[i], "priority": priority[i], "pages_count": pages[i]}
+                for i, pid in enumerate(self.pids)
+            ],
+        }
+
+    def digest(self) -> str:
+        """Content hash over parameters and columns, cheap even for very large workloads."""
+        h = hashlib.sha256()
+        h.update(json.dumps(self.system(), sort_keys=True).encode("utf-8"))
+        h.update(json.dumps(self.pids, separators=(",", ":")).encode("utf-8"))
+        for col in (self.arrival, self.burst, self.priority, self.pages):
+            h.update(np.ascontiguousarray(col, dtype=np.int64).tobytes())
+        return h.hexdigest()
+
+
+def as_workload(cfg: Union[SystemConfig, Workload]) -> Workload:
+    return cfg if isinstance(cfg, Workload) else Workload.from_config(cfg)
+
+
+def _relocate(exc: ValidationError, prefix: tuple) -> ValidationError:
+    errors = []
+    for err in exc.errors():
+        err = dict(err)
+        err["loc"] = prefix + tuple(err["loc"])
+        err.pop("url", None)
+        errors.append(err)
+    return ValidationError.from_exception_data(exc.title, errors)
@@ -0,0 +1,200 @@
+# backend/app/db/analytics.py
+"""
+Normalized run metrics behind /analytics.
+
+record_metrics fills run_metrics (one row per run and scheduler) and process_metrics (one
+row per process) whenever a run is saved; db/migrate.py backfills older runs. Queries read
+only these tables, never the runs blobs: counts, means and extremes are SQL aggregates,
+percentiles a streamed NumPy pass over the values ordered by group.
+"""
+from __future__ import annotations
+import itertools
+import operator
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import and_, distinct, func, insert, select
+from sqlalchemy.orm import Session
+
+from .models import ProcessMetric, Run, RunMetric, number, numbers
+
+# results keys that name the same scheduler; the frontend saves memory-aware results as "memoryAware"
+SCHEDULER_ALIASES = {"memoryAware": "memory_aware"}
+SYSTEM_FIELDS = ("total_frames", "page_size", "cpu_quantum", "cpu_idle_gap", "num_cpus", "replacement_policy")
+
+RUN_METRICS = ("avg_wait", "max_wait", "avg_turnaround", "max_turnaround", "cpu_utilization", "context_switches",
+               "total_time", "migrations")
+PROCESS_METRICS = ("waiting_time", "turnaround_time")
+GROUP_FIELDS = ("scheduler", "process_count") + SYSTEM_FIELDS
+# where= clauses apply to run-level columns, for process metrics too
+FILTER_FIELDS = GROUP_FIELDS + RUN_METRICS
+TEXT_FIELDS = ("scheduler", "replacement_policy")
+
+# rows fetched per round-trip by the percentile pass
+STREAM_ROWS = 10_000
+
+_WHERE = re.compile(r"^\s*([a-z_]+)\s*(<=|>=|!=|<|>|=)\s*(.*?)\s*$")
+_OPS = {"<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge, "=": operator.eq, "!=": operator.ne}
+
+
+def _scheduler_results(results: Dict[str, Any]) -> Iterable[Tuple[str, Dict[str, Any]]]:
+    seen = set()
+    for key, res in (results.items() if isinstance(results, dict) else ()):
+        if not isinstance(res, dict) or not ("waiting_times" in res or "cpu_utilization" in res):
+            continue
+        name = SCHEDULER_ALIASES.get(key, key)
+        if name not in seen:
+            seen.add(name)
+            yield name, res
+
+
+def _mean(values: List[float]) -> Optional[float]:
+    return sum(values) / len(values) if values else None
+
+
+def _int(value: Any) -> Optional[int]:
+    v = number(value)
+    return int(v) if v is not None else None
+
+
+def _system_field(system: Dict[str, Any], key: str) -> Any:
+    value = system.get(key)
+    if key in TEXT_FIELDS:
+        return value if isinstance(value, str) else None
+    return _int(value)
+
+
+def metric_rows(run_id: int, input: Dict[str, Any], results: Dict[str, Any]
+                ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    run_metrics and process_metrics rows for one run, taken from its input and results
+    payloads. Saved results are free-form, so non-numeric values are stored as NULL.
+    """
+    input = input if isinstance(input, dict) else {}
+    system = input.get("system") if isinstance(input.get("system"), dict) else {}
+    processes = input.get("processes") if isinstance(input.get("processes"), list) else []
+    by_pid = {str(p.get("pid")): p for p in processes if isinstance(p, dict)}
+    run_rows: List[Dict[str, Any]] = []
+    process_rows: List[Dict[str, Any]] = []
+    for scheduler, res in _scheduler_results(results):
+        waits, turnarounds = ({str(k): number(v) for k, v in values.items()} if isinstance(values, dict) else {}
+                              for values in (res.get("waiting_times"), res.get("turnaround_times")))
+        w, t = numbers(waits), numbers(turnarounds)
+        run_rows.append({
+            "run_id": run_id,
+            "scheduler": scheduler,
+            "process_count": len(processes),
+            **{k: _system_field(system, k) for k in SYSTEM_FIELDS},
+            "avg_wait": _mean(w),
+            "max_wait": max(w) if w else None,
+            "avg_turnaround": _mean(t),
+            "max_turnaround": max(t) if t else None,
+            "cpu_utilization": number(res.get("cpu_utilization")),
+            "context_switches": _int(res.get("context_switches")),
+            "total_time": _int(res.get("total_time")),
+            "migrations": _int(res.get("migrations")),
+        })
+        for pid in dict.fromkeys(itertools.chain(waits, turnarounds)):
+            p = by_pid.get(pid) or {}
+            process_rows.append({
+                "run_id": run_id,
+                "scheduler": scheduler,
+                "pid": pid,
+                "arrival_time": _int(p.get("arrival_time")),
+                "burst_time": _int(p.get("burst_time")),
+                "pages_count": _int(p.get("pages_count")),
+                "waiting_time": waits.get(pid),
+                "turnaround_time": turnarounds.get(pid),
+            })
+    return run_rows, process_rows
+
+
+def record_metrics(db: Session, runs: Iterable[Tuple[int, Dict[str, Any], Dict[str, Any]]]) -> None:
+    """Insert the metric rows for (run_id, input, results) triples; the caller commits."""
+    run_rows: List[Dict[str, Any]] = []
+    process_rows: List[Dict[str, Any]] = []
+    for run_id, input, results in runs:
+        r, p = metric_rows(run_id, input, results)
+        run_rows.extend(r)
+        process_rows.extend(p)
+    if run_rows:
+        db.execute(insert(RunMetric), run_rows)
+    if process_rows:
+        db.execute(insert(ProcessMetric), process_rows)
+
+
+def parse_where(clauses: Sequence[str]) -> List[Any]:
+    """'field<op>value' clauses (e.g. total_frames<64, scheduler=sjf,srtf) as SQL conditions; ValueError if malformed."""
+    conditions = []
+    for clause in clauses:
+        m = _WHERE.match(clause)
+        if m is None:
+            raise ValueError(f"malformed where clause {clause!r}; expected field<op>value")
+        field, op, raw = m.groups()
+        if field not in FILTER_FIELDS:
+            raise ValueError(f"cannot filter on {field!r}; expected any of {list(FILTER_FIELDS)}")
+        column = getattr(RunMetric, field)
+        try:
+            values = [v.strip() if field in TEXT_FIELDS else float(v) for v in raw.split(",")]
+        except ValueError:
+            raise ValueError(f"{field} compares against numbers, got {raw!r}")
+        if len(values) > 1:
+            if op not in ("=", "!="):
+                raise ValueError(f"a list of values needs = or !=, got {clause!r}")
+            conditions.append(column.in_(values) if op == "=" else column.not_in(values))
+        else:
+            conditions.append(_OPS[op](column, values[0]))
+    return conditions
+
+
+def aggregate(db: Session, metric: str, group_by: Sequence[str] = ("scheduler",), where: Sequence[str] = (),
+              percentiles: Sequence[float] = (50, 95), name_prefix: Optional[str] = None) -> Dict[str, Any]:
+    """
+    `metric` per group: count, number of runs, mean, min, max and the given percentiles
+    (linear interpolation, like percentile_cont). Process metrics are aggregated over
+    every process of the matching runs. Raises ValueError for unknown names or clauses.
+    """
+    if metric not in RUN_METRICS + PROCESS_METRICS:
+        raise ValueError(f"unknown metric {metric!r}; expected any of {list(RUN_METRICS + PROCESS_METRICS)}")
+    unknown = [g for g in group_by if g not in GROUP_FIELDS]
+    if unknown:
+        raise ValueError(f"cannot group by {unknown}; expected any of {list(GROUP_FIELDS)}")
+    if any(not 0 <= q <= 100 for q in percentiles):
+        raise ValueError("percentiles must be between 0 and 100")
+
+    level = "process" if metric in PROCESS_METRICS else "run"
+    value = getattr(ProcessMetric if level == "process" else RunMetric, metric)
+    keys = [getattr(RunMetric, g) for g in group_by]
+    conditions = parse_where(where) + [value.is_not(None)]
+
+    def scoped(stmt):
+        if level == "process":
+            stmt = stmt.select_from(ProcessMetric).join(
+                RunMetric, and_(RunMetric.run_id == ProcessMetric.run_id, RunMetric.scheduler == ProcessMetric.scheduler))
+        else:
+            stmt = stmt.select_from(RunMetric)
+        if name_prefix:
+            stmt = stmt.join(Run, Run.id == RunMetric.run_id).where(Run.name.startswith(name_prefix, autoescape=True))
+        return stmt.where(*conditions)
+
+    stmt = scoped(select(*keys, func.count(value), func.count(distinct(RunMetric.run_id)),
+                         func.avg(value), func.min(value), func.max(value)))
+    groups: Dict[tuple, Dict[str, Any]] = {}
+    for row in db.execute(stmt.group_by(*keys).order_by(*keys)):
+        k = tuple(row[:len(keys)])
+        count, runs, mean, low, high = row[len(keys):]
+        groups[k] = {"key": dict(zip(group_by, k)), "count": count, "runs": runs, "mean": mean, "min": low, "max": high}
+
+    if percentiles and groups:
+        # values arrive ordered by group, so only one group's values are held at a time
+        stream = db.execute(scoped(select(*keys, value)).order_by(*keys).execution_options(yield_per=STREAM_ROWS))
+        for k, rows in itertools.groupby(stream, key=lambda r: tuple(r[:len(keys)])):
+            values = np.fromiter((r[-1] for r in rows), dtype=np.float64)
+            group = groups.get(k)
+            if group is None or not len(values):
+                continue
+            for q, v in zip(percentiles, np.percentile(values, percentiles).tolist()):
+                group[f"p{q:g}"] = v
+
+    return {"metric": metric, "level": level, "group_by": list(group_by), "groups": list(groups.values())}
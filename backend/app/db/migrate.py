@@ -0,0 +1,83 @@
+from __future__ import annotations
+from sqlalchemy import Engine, exists, inspect, select, text, update
+from sqlalchemy.orm import Session, undefer
+
+from .analytics import record_metrics
+from .base import Base
+from .models import Run, RunMetric, summarize_run
+
+
+def upgrade_schema(engine: Engine) -> None:
+    """
+    create_all() only creates missing tables. For databases created before the runs
+    summary columns existed, add them (and their indexes) in place and backfill the
+    summaries from the stored payloads.
+    """
+    insp = inspect(engine)
+    if not insp.has_table(Run.__tablename__):
+        return
+    existing = {c["name"] for c in insp.get_columns(Run.__tablename__)}
+    table = Run.__table__
+    missing = [c for c in table.columns if c.name not in existing]
+    with engine.begin() as conn:
+        for col in missing:
+            ddl = col.type.compile(dialect=engine.dialect)
+            conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {col.name} {ddl}'))
+    # index=True columns (name, created_at) were not indexed in older databases
+    for index in table.indexes:
+        index.create(bind=engine, checkfirst=True)
+
+    with Session(engine) as db:
+        while True:
+            stale = db.scalars(select(Run).where(Run.process_count.is_(None)).limit(200)).all()
+            if not stale:
+                break
+            for row in stale:
+                for k, v in _summary(row).items():
+                    setattr(row, k, v)
+            db.commit()
+
+    backfill_metrics(engine)
+
+
+def _summary(row: Run) -> dict:
+    # never abort startup over one row: an unreadable payload gets empty summaries
+    # (process_count 0, so it is not picked up again)
+    try:
+        return summarize_run(row.input, row.results)
+    except Exception:
+        return summarize_run({}, {})
+
+
+def backfill_metrics(engine: Engine) -> None:
+    """
+    Metric rows for runs saved before run_metrics existed. Each run is marked once
+    looked at, even when it has no scheduler results or an unreadable payload, so it
+    is not scanned again on the next startup.
+    """
+    with Session(engine) as db:
+        # runs from before the marker column whose rows are already there
+        db.execute(update(Run).where(Run.metrics_recorded.is_(None), exists().where(RunMetric.run_id == Run.id))
+                   .values(metrics_recorded=True))
+        db.commit()
+        while True:
+            ids = db.scalars(select(Run.id).where(Run.metrics_recorded.is_(None)).order_by(Run.id).limit(200)).all()
+            if not ids:
+                break
+            for run_id in ids:
+                try:
+                    row = db.scalars(select(Run).options(undefer(Run.input), undefer(Run.results))
+                                     .where(Run.id == run_id)).one()
+                    record_metrics(db, [(row.id, row.input, row.results)])
+                    row.metrics_recorded = True
+                    db.commit()
+                except Exception:
+                    # never abort startup over one row: mark it and move on
+                    db.rollback()
+                    db.execute(update(Run).where(Run.id == run_id).values(metrics_recorded=True))
+                    db.commit()
+
+
+def init_db(engine: Engine) -> None:
+    Base.metadata.create_all(bind=engine)
+    upgrade_schema(engine)
@@ -1,13 +1,143 @@
 from __future__ import annotations
+from typing import Any, Dict, List, Optional
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import JSON, Integer, String, DateTime, func
+from sqlalchemy import Boolean, Float, ForeignKey, Index, Integer, String, DateTime, LargeBinary, UniqueConstraint, func
 from .base import Base
+from .types import CompressedJSON
+
+# results keys per scheduler; the frontend saves memory-aware results as "memoryAware"
+RESULT_KEYS = {
+    "baseline": ("baseline",),
+    "memory": ("memory_aware", "memoryAware"),
+}
+
+
+def number(value: Any) -> Optional[float]:
+    # saved results are free-form JSON: only real numbers count (bools are ints, but not metrics)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return None
+
+
+def numbers(values: Any) -> List[float]:
+    """The numeric values of a {pid: value} mapping; anything else is skipped."""
+    if not isinstance(values, dict):
+        return []
+    return [v for v in values.values() if number(v) is not None]
+
+
+def summarize_run(input: Dict[str, Any], results: Dict[str, Any]) -> Dict[str, Any]:
+    """Summary column values for a run, taken from its input and results payloads."""
+    processes = input.get("processes") if isinstance(input, dict) else None
+    results = results if isinstance(results, dict) else {}
+    fields: Dict[str, Any] = {"process_count": len(processes) if isinstance(processes, list) else 0}
+    for prefix, keys in RESULT_KEYS.items():
+        res = next((results[k] for k in keys if isinstance(results.get(k), dict)), None) or {}
+        waits = numbers(res.get("waiting_times"))
+        fields[f"{prefix}_avg_wait"] = sum(waits) / len(waits) if waits else None
+        fields[f"{prefix}_utilization"] = number(res.get("cpu_utilization"))
+        switches = number(res.get("context_switches"))
+        fields[f"{prefix}_context_switches"] = int(switches) if switches is not None else None
+    return fields
+
 
 class Run(Base):
     __tablename__ = "runs"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
+    created_at: Mapped[str] = mapped_column(DateTime(timezone=True), server_default=func.now(), index=True)
+    # large payloads: compressed, and only loaded when accessed
+    input: Mapped[dict] = mapped_column(CompressedJSON, nullable=False, deferred=True)
+    results: Mapped[dict] = mapped_column(CompressedJSON, nullable=False, deferred=True)
+
+    # summary columns, filled by Run.build (and backfilled by db/migrate.py for older rows)
+    process_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    baseline_avg_wait: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    baseline_utilization: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    baseline_context_switches: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    memory_avg_wait: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    memory_utilization: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    memory_context_switches: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    # set once run_metrics/process_metrics hold this run's rows (possibly none); NULL for runs awaiting the backfill
+    metrics_recorded: Mapped[Optional[bool]] = mapped_column(Boolean, nullable=True)
+    # the stored workload a run saved by reference points to; such workloads cannot be deleted
+    workload_id: Mapped[Optional[str]] = mapped_column(String(32), nullable=True, index=True)
+
+    @classmethod
+    def build(cls, name: str, input: Dict[str, Any], results: Dict[str, Any],
+              stored_input: Optional[Dict[str, Any]] = None) -> "Run":
+        # stored_input: persisted instead of `input` (a {"workload_id": id} reference); summaries use `input`
+        return cls(name=name, input=input if stored_input is None else stored_input, results=results,
+                   metrics_recorded=True, workload_id=stored_input["workload_id"] if stored_input else None,
+                   **summarize_run(input, results))
+
+
+class CachedResult(Base):
+    # on-disk tier of utils/cache.ResultCache
+    __tablename__ = "result_cache"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    body: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    size: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[str] = mapped_column(DateTime(timezone=True), server_default=func.now(), index=True)
+
+
+class StoredWorkload(Base):
+    # uploaded workloads (utils/workload_store.py), referenced by id from /simulate, /compare and /runs
+    __tablename__ = "workloads"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
     name: Mapped[str] = mapped_column(String(200), nullable=False)
-    created_at: Mapped[str] = mapped_column(DateTime(timezone=True), server_default=func.now())
-    input: Mapped[dict] = mapped_column(JSON, nullable=False)
-    results: Mapped[dict] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[str] = mapped_column(DateTime(timezone=True), server_default=func.now(), index=True)
+    digest: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    process_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    system: Mapped[dict] = mapped_column(CompressedJSON, nullable=False)
+    # Workload.to_blob(): process columns as compressed .npz
+    columns: Mapped[bytes] = mapped_column(LargeBinary, nullable=False, deferred=True)
+
+
+class RunMetric(Base):
+    # one row per (run, scheduler) for /analytics (db/analytics.py), so aggregates never touch the blobs
+    __tablename__ = "run_metrics"
+    __table_args__ = (
+        UniqueConstraint("run_id", "scheduler"),
+        Index("ix_run_metrics_scheduler_frames", "scheduler", "total_frames"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    run_id: Mapped[int] = mapped_column(ForeignKey("runs.id", ondelete="CASCADE"), nullable=False)
+    scheduler: Mapped[str] = mapped_column(String(32), nullable=False)
+    # system parameters of the run's input, for filters and group-bys
+    process_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    total_frames: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    page_size: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    cpu_quantum: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    cpu_idle_gap: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    num_cpus: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    replacement_policy: Mapped[Optional[str]] = mapped_column(String(16), nullable=True)
+
+    avg_wait: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    max_wait: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    avg_turnaround: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    max_turnaround: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    cpu_utilization: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    context_switches: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    total_time: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    migrations: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+
+class ProcessMetric(Base):
+    # one row per (run, scheduler, process); joined to run_metrics for the run-level filters
+    __tablename__ = "process_metrics"
+    __table_args__ = (Index("ix_process_metrics_run_scheduler", "run_id", "scheduler"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    run_id: Mapped[int] = mapped_column(ForeignKey("runs.id", ondelete="CASCADE"), nullable=False)
+    scheduler: Mapped[str] = mapped_column(String(32), nullable=False)
+    pid: Mapped[str] = mapped_column(String(200), nullable=False)
+    arrival_time: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    burst_time: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    pages_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    waiting_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    turnaround_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
@@ -0,0 +1,30 @@
+from __future__ import annotations
+import json
+import zlib
+from typing import Any, Optional
+
+from sqlalchemy import LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+
+class CompressedJSON(TypeDecorator):
+    """
+    JSON stored as a zlib-compressed blob.
+    Rows written before compression (plain JSON text in SQLite) are still readable.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        raw = json.dumps(value, separators=(",", ":")).encode("utf-8")
+        return zlib.compress(raw, 6)
+
+    def process_result_value(self, value: Any, dialect) -> Any:
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return json.loads(value)
+        return json.loads(zlib.decompress(bytes(value)))
@@ -3,14 +3,24 @@ import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from .db.base import Base, engine
-from .routers import config, simulate, compare, runs
+from .db.base import engine
+from .db.migrate import init_db
+from .core import smp
+from .routers import config, simulate, compare, runs, sweep, cache, jobs, metrics, workloads, analytics
+from .utils.jobs import job_manager
+from .utils.metrics import ENABLED as METRICS_ENABLED, MetricsMiddleware
+from .utils.serialization import WORKLOAD_SCHEMAS
 
 app = FastAPI(title="Memory-Aware Scheduler Backend", version="2.0.0")
 
 @app.on_event("startup")
 def on_startup():
-    Base.metadata.create_all(bind=engine)
+    init_db(engine)
+
+@app.on_event("shutdown")
+def on_shutdown():
+    job_manager.shutdown()
+    smp.shutdown()
 
 origins = os.getenv("CORS_ORIGINS", "*").split(",")
 app.add_middleware(
@@ -19,12 +29,36 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # let browser devtools show per-phase timings for cross-origin calls
+    expose_headers=["Server-Timing"],
 )
 
+# outermost, so request latency covers CORS handling too; not installed at all when off
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 app.include_router(config.router)
 app.include_router(simulate.router)
 app.include_router(compare.router)
 app.include_router(runs.router)
+app.include_router(sweep.router)
+app.include_router(cache.router)
+app.include_router(jobs.router)
+app.include_router(metrics.router)
+app.include_router(workloads.router)
+app.include_router(analytics.router)
+
+_openapi = app.openapi
+
+def openapi():
+    # schemas referenced by WORKLOAD_BODY (routes reading their body through workload_body)
+    if app.openapi_schema is None:
+        components = _openapi().setdefault("components", {}).setdefault("schemas", {})
+        for name, schema in WORKLOAD_SCHEMAS.items():
+            components.setdefault(name, schema)
+    return app.openapi_schema
+
+app.openapi = openapi
 
 @app.get("/")
 def root():
@@ -1,26 +1,43 @@
 # backend/app/models/schemas.py
 from __future__ import annotations
 from pydantic import BaseModel, Field, model_validator
-from typing import List, Dict, Optional, Any
+from typing import Annotated, List, Dict, Optional, Any, Literal
+
+
+# process and system integers are held in int64 columns (core/workload.py)
+INT64_MAX = 2 ** 63 - 1
+Int64 = Annotated[int, Field(ge=-INT64_MAX - 1, le=INT64_MAX)]
+# memory-aware quanta grow to twice cpu_quantum and are computed in float64
+MAX_QUANTUM = 2 ** 61
 
 
 # ========= Requests (frontend shape) =========
 
 class Process(BaseModel):
     pid: str
-    arrival_time: int
-    burst_time: int
-    priority: int
+    arrival_time: Int64
+    burst_time: Int64
+    priority: Int64
     # frontend now sends pages_count (replaces memory_footprint)
-    pages_count: int
+    pages_count: Int64
+
+
+ReplacementPolicy = Literal["FIFO", "LRU", "CLOCK", "OPT"]
+
+MAX_CPUS = 1024
 
 
 class SystemParams(BaseModel):
-    total_frames: int = Field(..., ge=0)
-    page_size: int = Field(..., ge=1)
-    cpu_quantum: int = Field(..., ge=1)
+    total_frames: int = Field(..., ge=0, le=INT64_MAX)
+    page_size: int = Field(..., ge=1, le=INT64_MAX)
+    cpu_quantum: int = Field(..., ge=1, le=MAX_QUANTUM)
     memory_threshold: float = Field(..., ge=0)
-    cpu_idle_gap: int = Field(0, ge=0)
+    cpu_idle_gap: int = Field(0, ge=0, le=INT64_MAX)
+    # demand paging (core/paging.py)
+    replacement_policy: ReplacementPolicy = "LRU"
+    paging_seed: int = Field(0, ge=0, le=INT64_MAX)
+    # > 1 switches to the SMP engine (core/smp.py): per-core run queues sharing the frame pool
+    num_cpus: int = Field(1, ge=1, le=MAX_CPUS)
 
 
 class SimulationInput(BaseModel):
@@ -28,6 +45,13 @@ class SimulationInput(BaseModel):
     processes: List[Process]
 
 
+class WorkloadRef(BaseModel):
+    # an uploaded workload (POST /workloads/upload or /workloads/generate) by id,
+    # with optional SystemParams overrides
+    workload_id: str
+    system: Optional[Dict[str, Any]] = None
+
+
 # ========= Internal flattened system config =========
 
 class SystemConfig(BaseModel):
@@ -36,6 +60,9 @@ class SystemConfig(BaseModel):
     cpu_quantum: int
     memory_threshold: float
     cpu_idle_gap: int = 0
+    replacement_policy: ReplacementPolicy = "LRU"
+    paging_seed: int = 0
+    num_cpus: int = 1
     processes: List[Process]
 
 
@@ -49,6 +76,9 @@ class AcceptsEither(BaseModel):
     cpu_quantum: Optional[int] = None
     memory_threshold: Optional[float] = None
     cpu_idle_gap: Optional[int] = None
+    replacement_policy: Optional[ReplacementPolicy] = None
+    paging_seed: Optional[int] = None
+    num_cpus: Optional[int] = None
 
     @model_validator(mode="before")
     @classmethod
@@ -66,8 +96,9 @@ class AcceptsEither(BaseModel):
                 "cpu_quantum": v["cpu_quantum"],
                 "memory_threshold": v["memory_threshold"],
             }
-            if "cpu_idle_gap" in v:
-                system["cpu_idle_gap"] = v["cpu_idle_gap"]
+            for k in ("cpu_idle_gap", "replacement_policy", "paging_seed", "num_cpus"):
+                if k in v:
+                    system[k] = v[k]
             return {
                 "system": system,
                 "processes": v["processes"],
@@ -83,6 +114,9 @@ class AcceptsEither(BaseModel):
             cpu_quantum=self.system.cpu_quantum,
             memory_threshold=self.system.memory_threshold,
             cpu_idle_gap=getattr(self.system, "cpu_idle_gap", 0),
+            replacement_policy=self.system.replacement_policy,
+            paging_seed=self.system.paging_seed,
+            num_cpus=self.system.num_cpus,
             processes=self.processes,
         )
 
@@ -94,6 +128,21 @@ class TraceEntry(BaseModel):
     time: int
     event: str
     pid: Optional[str] = None
+    # only with num_cpus > 1
+    cpu: Optional[int] = None
+
+
+# "ticks": one TraceEntry per time unit (default, what the frontend reads)
+# "rle":   run-length encoded TraceRun rows in `trace_rle`, `trace` left empty
+TraceMode = Literal["ticks", "rle"]
+
+
+class TraceRun(BaseModel):
+    event: str
+    pid: Optional[str] = None
+    start: int
+    length: int
+    cpu: Optional[int] = None
 
 
 class SimulationResult(BaseModel):
@@ -102,25 +151,187 @@ class SimulationResult(BaseModel):
     cpu_utilization: float
     total_time: int
     context_switches: int
-    trace: List[TraceEntry]
+    trace: List[TraceEntry] = Field(default_factory=list)
 
-    # optional: faults per pid (list of times)
+    # compact trace, only filled when trace mode "rle" is requested
+    trace_rle: Optional[List[TraceRun]] = None
+
+    # faults per pid (list of times), from the demand-paging engine
     fault_record: Optional[Dict[str, List[int]]] = None
 
-    # memory_timeline: list of objects with pid (string) and start/end ints
+    # memory_timeline: list of objects with pid (string) and start/end ints (plus cpu with num_cpus > 1)
     memory_timeline: Optional[List[Dict[str, Any]]] = None
 
     # inferred quanta & memory estimates per pid (optional)
     inferred_quanta: Optional[Dict[str, int]] = None
     memory_estimates: Optional[Dict[str, int]] = None
 
+    # num_cpus > 1 only: utilization per core (cpu_utilization is their mean), and how
+    # often a process resumed on a different core than it last ran on
+    core_utilization: Optional[List[float]] = None
+    migrations: Optional[int] = None
+
 
 class CompareBundle(BaseModel):
     baseline: SimulationResult
     memory_aware: SimulationResult
 
 
+# ========= Parameter sweep =========
+
+MAX_SWEEP_POINTS = 10_000
+# largest value a sweep axis may take, as a list entry or range endpoint (quanta, frames
+# and gaps are far below this)
+MAX_SWEEP_VALUE = 1_000_000_000
+
+
+class SweepRange(BaseModel):
+    # inclusive range: start, start + step, ... <= stop
+    start: int = Field(..., ge=0, le=MAX_SWEEP_VALUE)
+    stop: int = Field(..., ge=0, le=MAX_SWEEP_VALUE)
+    step: int = Field(1, ge=1)
+
+    def _range(self) -> range:
+        return range(self.start, self.stop + 1, self.step)
+
+    def __len__(self) -> int:
+        # without building the list
+        return len(self._range())
+
+    def values(self) -> List[int]:
+        return list(self._range())
+
+
+class SweepRequest(BaseModel):
+    # either a config, or the id of a stored workload (POST /workloads/upload or /workloads/generate)
+    config: Optional[AcceptsEither] = None
+    workload_id: Optional[str] = None
+    # each axis takes an explicit list or a range; omitted axes use the config's value
+    cpu_quantum: Optional[List[int] | SweepRange] = None
+    total_frames: Optional[List[int] | SweepRange] = None
+    cpu_idle_gap: Optional[List[int] | SweepRange] = None
+
+    @model_validator(mode="after")
+    def _check_source(self) -> "SweepRequest":
+        if (self.config is None) == (self.workload_id is None):
+            raise ValueError("give exactly one of config or workload_id")
+        return self
+
+    @model_validator(mode="after")
+    def _check_grid(self) -> "SweepRequest":
+        size = 1
+        for name, low in (("cpu_quantum", 1), ("total_frames", 0), ("cpu_idle_gap", 0)):
+            axis = getattr(self, name)
+            if axis is None:
+                continue
+            if not len(axis):
+                raise ValueError(f"{name} sweep is empty")
+            if (axis.start if isinstance(axis, SweepRange) else min(axis)) < low:
+                raise ValueError(f"{name} values must be >= {low}")
+            if not isinstance(axis, SweepRange) and max(axis) > MAX_SWEEP_VALUE:
+                raise ValueError(f"{name} values must be <= {MAX_SWEEP_VALUE}")
+            size *= len(axis)
+        if size > MAX_SWEEP_POINTS:
+            raise ValueError(f"sweep grid has {size} points (max {MAX_SWEEP_POINTS})")
+        return self
+
+    def axis_values(self, name: str, default: int) -> List[int]:
+        axis = getattr(self, name)
+        if axis is None:
+            return [default]
+        return axis.values() if isinstance(axis, SweepRange) else list(axis)
+
+
+class SweepMetrics(BaseModel):
+    avg_wait: List[float]
+    avg_turnaround: List[float]
+    cpu_utilization: List[float]
+    context_switches: List[int]
+
+
+class SweepResult(BaseModel):
+    # metric lists are flattened row-major over (cpu_quantum, total_frames, cpu_idle_gap)
+    cpu_quantum: List[int]
+    total_frames: List[int]
+    cpu_idle_gap: List[int]
+    shape: List[int]
+    baseline: SweepMetrics
+    memory_aware: SweepMetrics
+
+
 class SaveRunRequest(BaseModel):
     name: Optional[str] = None
-    input: SimulationInput
+    # either the full input, or the id of an uploaded workload (POST /workloads/upload)
+    input: Optional[SimulationInput] = None
+    workload_id: Optional[str] = None
     results: Dict[str, object]
+
+    @model_validator(mode="after")
+    def _check_source(self) -> "SaveRunRequest":
+        if (self.input is None) == (self.workload_id is None):
+            raise ValueError("give exactly one of input or workload_id")
+        return self
+
+
+# ========= Synthetic workloads =========
+
+GENERATE_MAX_PROCESSES = 1_000_000
+# upper bound of mean_burst and mean_interarrival, in ticks
+GENERATE_MAX_MEAN = 1_000_000
+GENERATE_MAX_PRIORITY = 1_000_000
+GENERATE_MAX_PAGES_RATIO = 1_000
+
+ArrivalPattern = Literal["batch", "poisson", "bursty"]
+BurstDistribution = Literal["uniform", "exponential", "pareto"]
+
+
+class GenerateRequest(BaseModel):
+    name: Optional[str] = None
+    seed: int = Field(0, ge=0)
+    num_processes: int = Field(..., ge=1, le=GENERATE_MAX_PROCESSES)
+    # poisson: exponential gaps between arrivals; bursty: clusters of ~cluster_size processes
+    # arriving together, so the mean gap per process is the same
+    arrivals: ArrivalPattern = "poisson"
+    # default mean_burst / num_cpus keeps the CPUs roughly saturated
+    mean_interarrival: Optional[float] = Field(None, gt=0, le=GENERATE_MAX_MEAN)
+    cluster_size: int = Field(50, ge=1, le=GENERATE_MAX_PROCESSES)
+    bursts: BurstDistribution = "exponential"
+    mean_burst: float = Field(20, ge=1, le=GENERATE_MAX_MEAN)
+    # pareto: heavy tail, scaled so the mean is still mean_burst
+    pareto_alpha: float = Field(1.5, gt=1)
+    # pages_count is uniform on [1, pages_ratio * total_frames]
+    pages_ratio: float = Field(2.0, gt=0, le=GENERATE_MAX_PAGES_RATIO)
+    max_priority: int = Field(9, ge=0, le=GENERATE_MAX_PRIORITY)
+    system: SystemParams
+
+
+# ========= What-if re-simulation =========
+
+class ProcessPatch(BaseModel):
+    # an existing pid is updated (omitted fields keep their value) or removed;
+    # an unknown pid is appended and must give every field
+    pid: str
+    arrival_time: Optional[int] = None
+    burst_time: Optional[int] = None
+    priority: Optional[int] = None
+    pages_count: Optional[int] = None
+    remove: bool = False
+
+
+class WhatIfRequest(BaseModel):
+    changes: List[ProcessPatch] = Field(..., min_length=1)
+
+
+# ========= Background jobs =========
+
+JobState = Literal["queued", "running", "done", "failed", "cancelled"]
+
+
+class JobStatus(BaseModel):
+    id: str
+    name: str
+    status: JobState
+    # fraction of scheduler runs finished (baseline, memory_aware)
+    progress: float
+    run_id: Optional[int] = None
+    error: Optional[str] = None
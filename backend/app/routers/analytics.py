@@ -0,0 +1,41 @@
+from __future__ import annotations
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from ..db.analytics import aggregate
+from ..db.base import get_session
+
+router = APIRouter(prefix="/analytics", tags=["Analytics"])
+
+Metric = Literal["avg_wait", "max_wait", "avg_turnaround", "max_turnaround", "cpu_utilization", "context_switches",
+                 "total_time", "migrations", "waiting_time", "turnaround_time"]
+
+def _split(values: Optional[List[str]]) -> List[str]:
+    # comma-separated and/or repeated query values
+    return [v.strip() for value in values or () for v in value.split(",") if v.strip()]
+
+# Accept both '/analytics' and '/analytics/' without redirect
+@router.get("")
+@router.get("/")
+def analytics(metric: Metric = "avg_wait", group_by: Optional[List[str]] = Query(None),
+              where: Optional[List[str]] = Query(None), percentiles: Optional[List[str]] = Query(None),
+              name_prefix: Optional[str] = None, db: Session = Depends(get_session)):
+    """
+    Aggregates of one metric across saved runs, e.g. p95 waiting time per scheduler over
+    runs with total_frames < 64:
+
+        /analytics?metric=waiting_time&group_by=scheduler&where=total_frames<64&percentiles=95
+
+    Run metrics (avg_wait, cpu_utilization, ...) have one value per run and scheduler;
+    waiting_time and turnaround_time have one per process. group_by defaults to scheduler
+    (group_by=none for a single group), percentiles to 50,95. `where` takes field<op>value
+    clauses on run-level fields (=, != also take comma-separated lists).
+    """
+    groups = _split(group_by) if group_by else ["scheduler"]
+    if groups == ["none"]:
+        groups = []
+    try:
+        qs = [float(q) for q in _split(percentiles)] if percentiles else [50.0, 95.0]
+        return aggregate(db, metric, groups, where or [], qs, name_prefix)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
@@ -0,0 +1,14 @@
+from __future__ import annotations
+from fastapi import APIRouter
+from ..utils.cache import result_cache
+
+router = APIRouter(prefix="/cache", tags=["Cache"])
+
+@router.get("/stats")
+def cache_stats():
+    return result_cache.stats()
+
+@router.delete("/")
+def clear_cache():
+    result_cache.clear()
+    return {"message": "Result cache cleared"}
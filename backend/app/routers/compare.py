@@ -1,14 +1,41 @@
 from __future__ import annotations
-from fastapi import APIRouter
-from ..models.schemas import AcceptsEither, SimulationInput, CompareBundle
-from ..core.scheduler import compare_schedulers
+from typing import Dict, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from ..models.schemas import SimulationResult, TraceMode
+from ..core.policies import DEFAULT_POLICIES, check_policies, run_policies
+from ..core.stream import stream_compare
+from ..core.workload import Workload
+from ..utils.cache import cache_key, result_cache
+from ..utils.serialization import WORKLOAD_BODY, dumps, json_response, workload_body
 
 router = APIRouter(prefix="/compare", tags=["Comparison"])
 
 # Accept both '/compare' and '/compare/' without redirect
-@router.post("", response_model=CompareBundle)
-@router.post("/", response_model=CompareBundle)
-def compare(config: AcceptsEither | SimulationInput):
-    flat = config.to_flat() if isinstance(config, AcceptsEither) \
-           else AcceptsEither.model_validate(config.model_dump()).to_flat()
-    return compare_schedulers(flat)
+@router.post("", response_model=Dict[str, SimulationResult], openapi_extra=WORKLOAD_BODY)
+@router.post("/", response_model=Dict[str, SimulationResult], openapi_extra=WORKLOAD_BODY)
+def compare(trace: TraceMode = "ticks", policies: Optional[List[str]] = Query(None), faults: bool = False,
+            workload: Workload = Depends(workload_body)):
+    # ?trace=rle returns run-length encoded `trace_rle` instead of the per-tick `trace`;
+    # ?policies=sjf,srtf (or repeated) picks the schedulers, keyed by name in the response;
+    # ?faults=true adds each scheduler's demand-paging fault_record
+    names = tuple(n.strip() for p in policies or () for n in p.split(",") if n.strip()) or DEFAULT_POLICIES
+    # the default pair keeps its original key, shared with /runs/{id}/what-if
+    params = {"trace": trace, "faults": faults}
+    if names != DEFAULT_POLICIES:
+        params["policies"] = list(names)
+    # rejected before the cache is consulted, whatever it holds
+    try:
+        check_policies(workload, names)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    body, hit = result_cache.get_or_compute(cache_key("compare", workload, **params),
+                                            lambda: dumps(run_policies(workload, names, trace, faults)))
+    # cached bytes are already serialized, one SimulationResult per policy
+    return json_response(body, headers={"X-Cache": "HIT" if hit else "MISS"})
+
+# NDJSON variant: both summaries first, then each scheduler's segments and trace rows
+@router.post("/stream", openapi_extra=WORKLOAD_BODY)
+def compare_stream(trace: TraceMode = "ticks", workload: Workload = Depends(workload_body)):
+    return StreamingResponse(stream_compare(workload, trace), media_type="application/x-ndjson")
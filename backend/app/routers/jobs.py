@@ -0,0 +1,49 @@
+from __future__ import annotations
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.orm import Session
+from ..db.base import get_session
+from ..db.models import Run
+from ..core.workload import Workload
+from ..models.schemas import JobStatus, TraceMode
+from ..utils.jobs import job_manager, QueueFull
+from ..utils.serialization import WORKLOAD_BODY, workload_body, workload_reference
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+def _job_or_404(job_id: str):
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+# Accept both '/jobs' and '/jobs/' without redirect
+@router.post("", response_model=JobStatus, status_code=202, openapi_extra=WORKLOAD_BODY)
+@router.post("/", response_model=JobStatus, status_code=202, openapi_extra=WORKLOAD_BODY)
+def submit_job(request: Request, name: str = "Job", trace: TraceMode = "ticks", faults: bool = False,
+               workload: Workload = Depends(workload_body)):
+    # body: AcceptsEither | SimulationInput | WorkloadRef, see workload_body; a WorkloadRef
+    # is saved with the run as the reference, like POST /runs by workload_id
+    try:
+        job = job_manager.submit(workload, name, trace, faults, stored_input=workload_reference(request))
+    except QueueFull:
+        raise HTTPException(status_code=429, detail="Job queue is full, retry later", headers={"Retry-After": "5"})
+    return job.status()
+
+@router.get("/{job_id}", response_model=JobStatus)
+def job_status(job_id: str):
+    return _job_or_404(job_id).status()
+
+@router.get("/{job_id}/result")
+def job_result(job_id: str, db: Session = Depends(get_session)):
+    job = _job_or_404(job_id)
+    if job.run_id is None:
+        raise HTTPException(status_code=409, detail=f"Job is {job.status()['status']}")
+    row = db.get(Run, job.run_id)
+    if row is None:
+        raise HTTPException(status_code=404, detail="Run not found")
+    return row.results
+
+@router.delete("/{job_id}", response_model=JobStatus)
+def cancel_job(job_id: str):
+    _job_or_404(job_id)
+    return job_manager.cancel(job_id).status()
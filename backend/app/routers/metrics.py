@@ -0,0 +1,10 @@
+from __future__ import annotations
+from fastapi import APIRouter, Response
+from ..utils.metrics import render
+
+router = APIRouter(tags=["Metrics"])
+
+# Prometheus scrape endpoint; series only fill up when METRICS_ENABLED=1
+@router.get("/metrics", include_in_schema=False)
+def metrics():
+    return Response(content=render(), media_type="text/plain; version=0.0.4; charset=utf-8")
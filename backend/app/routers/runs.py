@@ -1,37 +1,257 @@
 from __future__ import annotations
-from fastapi import APIRouter, Depends
+import json
+from typing import List, Literal, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
+from ..core.timeline_index import MAX_TIME, TimelineIndex, timeline_indexes
+from ..core.whatif import WhatIf
+from ..core.workload import Workload
+from ..db.analytics import record_metrics
 from ..db.base import get_session
-from ..db.models import Run
-from ..models.schemas import SaveRunRequest
+from ..db.models import RESULT_KEYS, Run, summarize_run
+from ..models.schemas import MAX_CPUS, CompareBundle, SaveRunRequest, TraceMode, WhatIfRequest
+from ..utils.cache import cache_key, result_cache
+from ..utils.serialization import dumps, json_response
+from ..utils.workload_store import WorkloadNotFound, workload_store
 
 router = APIRouter(prefix="/runs", tags=["Runs"])
 
+# rows per executemany round-trip in /runs/batch
+BATCH_CHUNK = 500
+
+# summary columns only; input/results blobs are deferred and never loaded for listings
+SUMMARY_COLUMNS = (
+    Run.id, Run.name, Run.created_at, Run.process_count,
+    Run.baseline_avg_wait, Run.baseline_utilization, Run.baseline_context_switches,
+    Run.memory_avg_wait, Run.memory_utilization, Run.memory_context_switches,
+)
+
+def _iso(value) -> str:
+    return getattr(value, "isoformat", lambda: str(value))()
+
+def _summary(r) -> dict:
+    return {
+        "id": r.id,
+        "name": r.name,
+        "created_at": _iso(r.created_at),
+        "process_count": r.process_count,
+        "baseline": {
+            "avg_wait": r.baseline_avg_wait,
+            "cpu_utilization": r.baseline_utilization,
+            "context_switches": r.baseline_context_switches,
+        },
+        "memory_aware": {
+            "avg_wait": r.memory_avg_wait,
+            "cpu_utilization": r.memory_utilization,
+            "context_switches": r.memory_context_switches,
+        },
+    }
+
+def _input(req: SaveRunRequest) -> Tuple[dict, Optional[dict]]:
+    # (full input for summaries and metrics, what to store instead); runs saved by
+    # workload_id store only the reference, resolved again when read
+    if req.input is not None:
+        return req.input.model_dump(), None
+    try:
+        return workload_store.get(req.workload_id).to_input(), {"workload_id": req.workload_id}
+    except WorkloadNotFound:
+        raise HTTPException(status_code=404, detail=f"Workload {req.workload_id} not found")
+
+def _reference(data) -> Optional[str]:
+    if isinstance(data, dict) and "processes" not in data and isinstance(data.get("workload_id"), str):
+        return data["workload_id"]
+    return None
+
+def _resolve(data: dict) -> Workload:
+    # a stored reference: the workload, with the system overrides a /jobs submission carried
+    system = data.get("system")
+    return workload_store.resolve(data["workload_id"], system if isinstance(system, dict) else None)
+
+def _run_workload(row: Run) -> Workload:
+    workload_id = _reference(row.input)
+    try:
+        if workload_id is not None:
+            return _resolve(row.input)
+        return Workload.from_payload(row.input)
+    except WorkloadNotFound:
+        raise HTTPException(status_code=404, detail=f"Workload {workload_id} of this run no longer exists")
+    except ValidationError:
+        raise HTTPException(status_code=422, detail="Run input is not a valid workload")
+
+def _run_or_404(db: Session, run_id: int) -> Run:
+    row = db.get(Run, run_id)
+    if row is None:
+        raise HTTPException(status_code=404, detail="Run not found")
+    return row
+
 @router.get("/")
-def list_runs(db: Session = Depends(get_session)):
-    rows = db.query(Run).order_by(Run.id.desc()).limit(200).all()
-    return [
-        {
-            "id": r.id,
-            "name": r.name,
-            "created_at": getattr(r.created_at, "isoformat", lambda: str(r.created_at))(),
-            "input": r.input,
-            "results": r.results,
-        }
-        for r in rows
-    ]
+def list_runs(after_id: Optional[int] = None, limit: int = Query(50, ge=1, le=500),
+              db: Session = Depends(get_session)):
+    # keyset pagination, newest first: pass the returned next_after_id to get the following page
+    stmt = select(*SUMMARY_COLUMNS).order_by(Run.id.desc()).limit(limit)
+    if after_id is not None:
+        stmt = stmt.where(Run.id < after_id)
+    rows = db.execute(stmt).all()
+    return {
+        "items": [_summary(r) for r in rows],
+        "next_after_id": rows[-1].id if len(rows) == limit else None,
+    }
+
+@router.get("/{run_id}")
+def get_run(run_id: int, db: Session = Depends(get_session)):
+    row = _run_or_404(db, run_id)
+    data = row.input
+    workload_id = _reference(data)
+    if workload_id is not None:
+        try:
+            data = _resolve(data).to_input()
+        except (WorkloadNotFound, ValidationError):
+            # deleted since the run was saved: the reference is all there is
+            pass
+    return {**_summary(row), "input": data}
+
+@router.get("/{run_id}/results")
+def get_run_results(run_id: int, db: Session = Depends(get_session)):
+    return _run_or_404(db, run_id).results
+
+def _num_cpus(row: Run) -> int:
+    # the run's core count, from its stored input or the workload it references
+    workload_id = _reference(row.input)
+    if workload_id is not None:
+        try:
+            system = workload_store.describe(workload_id)["system"]
+        except WorkloadNotFound:
+            # deleted since the run was saved: any core the schema allows
+            return MAX_CPUS
+        if isinstance(row.input.get("system"), dict):
+            system = {**system, **row.input["system"]}
+    else:
+        system = row.input.get("system") if isinstance(row.input, dict) else None
+    num_cpus = system.get("num_cpus", 1) if isinstance(system, dict) else 1
+    return num_cpus if type(num_cpus) is int and 1 <= num_cpus <= MAX_CPUS else 1
+
+def _timeline_indexes(db: Session, run_id: int) -> Tuple[int, dict]:
+    def build() -> dict:
+        row = _run_or_404(db, run_id)
+        results = row.results if isinstance(row.results, dict) else {}
+        num_cpus = _num_cpus(row)
+        indexes = {}
+        for name, keys in (("baseline", RESULT_KEYS["baseline"]), ("memory_aware", RESULT_KEYS["memory"])):
+            res = next((results[k] for k in keys if isinstance(results.get(k), dict)), None)
+            if res is None:
+                continue
+            # one index per core that has segments; SMP runs tag theirs with "cpu", others are core 0
+            cores = {}
+            timeline = res.get("memory_timeline")
+            for seg in timeline if isinstance(timeline, list) else ():
+                if not isinstance(seg, dict):
+                    continue
+                cpu = seg.get("cpu", 0)
+                if cpu is None:
+                    cpu = 0
+                if type(cpu) is int and 0 <= cpu < num_cpus:
+                    cores.setdefault(cpu, []).append(seg)
+            indexes[name] = {c: TimelineIndex(cores[c]) for c in sorted(cores)}
+        return num_cpus, indexes
+
+    return timeline_indexes.get_or_build(run_id, build)
+
+@router.get("/{run_id}/timeline")
+def get_run_timeline(run_id: int, start: int = Query(0, ge=0, le=MAX_TIME),
+                     end: Optional[int] = Query(None, gt=0, le=MAX_TIME),
+                     resolution: int = Query(1000, ge=1, le=10_000),
+                     scheduler: Optional[Literal["baseline", "memory_aware"]] = None,
+                     db: Session = Depends(get_session)):
+    """
+    The part of a saved run's memory_timeline inside [start, end) (end defaults to the
+    horizon), per scheduler. Viewports holding more than `resolution` segments come back
+    as per-bucket aggregates (dominant pid, busy fraction, segment count) instead.
+    Multi-CPU runs return one such view per core under "cpus", keyed by core id (cores
+    without segments are left out).
+    """
+    num_cpus, indexes = _timeline_indexes(db, run_id)
+    if scheduler is not None:
+        if scheduler not in indexes:
+            raise HTTPException(status_code=404, detail=f"Run has no {scheduler} results")
+        indexes = {scheduler: indexes[scheduler]}
+    if end is None:
+        end = max((ix.horizon for cores in indexes.values() for ix in cores.values()), default=0)
+    if end <= start:
+        raise HTTPException(status_code=422, detail="end must be greater than start")
+    body = {"start": start, "end": end, "resolution": resolution}
+    for name, cores in indexes.items():
+        if num_cpus == 1:
+            body[name] = (cores.get(0) or TimelineIndex([])).query(start, end, resolution)
+        else:
+            body[name] = {"cpus": {str(c): ix.query(start, end, resolution) for c, ix in cores.items()}}
+    return json_response(dumps(body))
+
+@router.post("/{run_id}/what-if", response_model=CompareBundle)
+def what_if(run_id: int, req: WhatIfRequest, trace: TraceMode = "ticks", faults: bool = False,
+            db: Session = Depends(get_session)):
+    """
+    /compare on a saved run's input with `changes` applied to its process list.
+    Each scheduler resumes from the last checkpoint of the base run the edit cannot
+    have affected; X-Resumed-At reports that time per scheduler.
+    """
+    base = _run_workload(_run_or_404(db, run_id))
+    try:
+        whatif = WhatIf(base, req.changes)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    resumed = {}
+
+    def compute() -> bytes:
+        results, at = whatif.compare(trace, faults)
+        resumed.update(at)
+        return dumps(results)
+
+    # same bytes as /compare on the edited input, so both share cache entries
+    body, hit = result_cache.get_or_compute(cache_key("compare", whatif.workload, trace=trace, faults=faults), compute)
+    headers = {"X-Cache": "HIT" if hit else "MISS"}
+    if resumed:
+        headers["X-Resumed-At"] = ", ".join(f"{k}={v}" for k, v in resumed.items())
+    return json_response(body, headers=headers)
 
 @router.post("/")
 def save_run(req: SaveRunRequest, db: Session = Depends(get_session)):
     name = req.name or "Run"
-    row = Run(name=name, input=req.input.model_dump(), results=req.results)
+    data, stored = _input(req)
+    row = Run.build(name, data, req.results, stored)
     db.add(row)
+    db.flush()
+    record_metrics(db, [(row.id, data, req.results)])
     db.commit()
     db.refresh(row)
-    return {
-        "id": row.id,
-        "name": row.name,
-        "created_at": getattr(row.created_at, "isoformat", lambda: str(row.created_at))(),
-        "input": row.input,
-        "results": row.results,
-    }
+    return _summary(row)
+
+@router.post("/batch")
+def save_runs_batch(reqs: List[SaveRunRequest], db: Session = Depends(get_session)):
+    """
+    Insert many runs in one transaction using multi-row INSERT ... RETURNING,
+    then stream back {"index", "id"} NDJSON lines in request order.
+    """
+    ids: List[int] = []
+    stmt = insert(Run).returning(Run.id, sort_by_parameter_order=True)
+    for start in range(0, len(reqs), BATCH_CHUNK):
+        values, inputs = [], []
+        for req in reqs[start:start + BATCH_CHUNK]:
+            data, stored = _input(req)
+            inputs.append(data)
+            values.append({"name": req.name or "Run", "input": data if stored is None else stored,
+                           "results": req.results, "metrics_recorded": True,
+                           "workload_id": stored["workload_id"] if stored else None, **summarize_run(data, req.results)})
+        chunk_ids = db.scalars(stmt, values).all()
+        record_metrics(db, ((run_id, data, v["results"]) for run_id, data, v in zip(chunk_ids, inputs, values)))
+        ids.extend(chunk_ids)
+    db.commit()
+
+    def lines():
+        for i, run_id in enumerate(ids):
+            yield json.dumps({"index": i, "id": run_id}) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
@@ -1,16 +1,37 @@
 from __future__ import annotations
-from fastapi import APIRouter
-from ..models.schemas import AcceptsEither, SimulationInput, SimulationResult
-from ..core.scheduler import simulate_baseline, simulate_memory_aware
+from fastapi import APIRouter, Depends, Response
+from fastapi.responses import StreamingResponse
+from ..models.schemas import SimulationResult, TraceMode
+from ..core.scheduler import run_baseline, run_memory_aware
+from ..core.stream import stream_simulation
+from ..core.workload import Workload
+from ..utils.cache import cache_key, result_cache
+from ..utils.serialization import WORKLOAD_BODY, dumps, json_response, workload_body
 
 router = APIRouter(prefix="/simulate", tags=["Simulation"])
 
-@router.post("/baseline", response_model=SimulationResult)
-def baseline(config: AcceptsEither | SimulationInput):
-    flat = config.to_flat() if isinstance(config, AcceptsEither) else AcceptsEither.model_validate(config.model_dump()).to_flat()
-    return simulate_baseline(flat)
+def _cached(namespace: str, run, workload: Workload, trace: TraceMode, faults: bool) -> Response:
+    body, hit = result_cache.get_or_compute(
+        cache_key(namespace, workload, trace=trace, faults=faults),
+        lambda: dumps(run(workload, trace, faults)),
+    )
+    return json_response(body, headers={"X-Cache": "HIT" if hit else "MISS"})
 
-@router.post("/memory-aware", response_model=SimulationResult)
-def memory_aware(config: AcceptsEither | SimulationInput):
-    flat = config.to_flat() if isinstance(config, AcceptsEither) else AcceptsEither.model_validate(config.model_dump()).to_flat()
-    return simulate_memory_aware(flat)
+# bodies are AcceptsEither | SimulationInput | WorkloadRef, parsed by workload_body in one validation pass;
+# ?faults=true adds the demand-paging fault_record (a replay over every simulated tick)
+@router.post("/baseline", response_model=SimulationResult, openapi_extra=WORKLOAD_BODY)
+def baseline(trace: TraceMode = "ticks", faults: bool = False, workload: Workload = Depends(workload_body)):
+    return _cached("baseline", run_baseline, workload, trace, faults)
+
+@router.post("/memory-aware", response_model=SimulationResult, openapi_extra=WORKLOAD_BODY)
+def memory_aware(trace: TraceMode = "ticks", faults: bool = False, workload: Workload = Depends(workload_body)):
+    return _cached("memory-aware", run_memory_aware, workload, trace, faults)
+
+# NDJSON variants: summary first, then timeline segments and trace rows as they are produced
+@router.post("/baseline/stream", openapi_extra=WORKLOAD_BODY)
+def baseline_stream(trace: TraceMode = "ticks", workload: Workload = Depends(workload_body)):
+    return StreamingResponse(stream_simulation(workload, "baseline", trace), media_type="application/x-ndjson")
+
+@router.post("/memory-aware/stream", openapi_extra=WORKLOAD_BODY)
+def memory_aware_stream(trace: TraceMode = "ticks", workload: Workload = Depends(workload_body)):
+    return StreamingResponse(stream_simulation(workload, "memory_aware", trace), media_type="application/x-ndjson")
@@ -0,0 +1,32 @@
+from __future__ import annotations
+from fastapi import APIRouter, HTTPException
+from ..models.schemas import SweepRequest, SweepResult
+from ..core.sweep import sweep as run_sweep
+from ..utils.metrics import timed
+from ..utils.workload_store import WorkloadNotFound, workload_store
+
+router = APIRouter(prefix="/sweep", tags=["Sweep"])
+
+# Accept both '/sweep' and '/sweep/' without redirect
+@router.post("", response_model=SweepResult)
+@router.post("/", response_model=SweepResult)
+def sweep(req: SweepRequest):
+    if req.workload_id is not None:
+        try:
+            flat = workload_store.get(req.workload_id)
+        except WorkloadNotFound:
+            raise HTTPException(status_code=404, detail="Workload not found")
+    else:
+        flat = req.config.to_flat()
+    q = req.axis_values("cpu_quantum", flat.cpu_quantum)
+    f = req.axis_values("total_frames", flat.total_frames)
+    g = req.axis_values("cpu_idle_gap", flat.cpu_idle_gap)
+    with timed("sweep"):
+        result = run_sweep(flat, q, f, g)
+    return {
+        "cpu_quantum": q,
+        "total_frames": f,
+        "cpu_idle_gap": g,
+        "shape": [len(q), len(f), len(g)],
+        **result,
+    }
@@ -0,0 +1,92 @@
+from __future__ import annotations
+from typing import Optional
+from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from ..core.generator import generate_workload
+from ..core.workload import Workload
+from ..models.schemas import GenerateRequest
+from ..utils.workload_import import UnsupportedFormat, UploadError, detect_format, read_csv, read_xlsx
+from ..utils.workload_store import WorkloadInUse, WorkloadNotFound, workload_store
+
+router = APIRouter(prefix="/workloads", tags=["Workloads"])
+
+def _parse(file: UploadFile, overrides: dict) -> Workload:
+    # runs in the threadpool; UploadFile spools large bodies to disk, so this reads from there
+    stream = file.file
+    head = stream.read(4)
+    stream.seek(0)
+    fmt = detect_format(file.filename, file.content_type, head)
+    return read_xlsx(stream, overrides) if fmt == "xlsx" else read_csv(stream, overrides)
+
+@router.post("/upload", status_code=201)
+async def upload_workload(
+    file: UploadFile = File(...),
+    name: Optional[str] = Form(None),
+    total_frames: Optional[int] = Form(None),
+    page_size: Optional[int] = Form(None),
+    cpu_quantum: Optional[int] = Form(None),
+    memory_threshold: Optional[float] = Form(None),
+    cpu_idle_gap: Optional[int] = Form(None),
+    replacement_policy: Optional[str] = Form(None),
+    paging_seed: Optional[int] = Form(None),
+    num_cpus: Optional[int] = Form(None),
+):
+    """
+    Store a CSV or XLSX workload server-side. The process table is parsed and validated
+    in chunks; form fields override the workbook's System sheet. The returned id can be
+    posted to /simulate, /compare and /jobs as {"workload_id": id} instead of the process list.
+    """
+    overrides = {
+        "total_frames": total_frames, "page_size": page_size, "cpu_quantum": cpu_quantum,
+        "memory_threshold": memory_threshold, "cpu_idle_gap": cpu_idle_gap,
+        "replacement_policy": replacement_policy, "paging_seed": paging_seed,
+        "num_cpus": num_cpus,
+    }
+    try:
+        workload = await run_in_threadpool(_parse, file, overrides)
+    except UnsupportedFormat as exc:
+        raise HTTPException(status_code=415, detail=str(exc))
+    except UploadError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    except ValidationError as exc:
+        # process rows are located in the file, system parameters in the form fields
+        raise RequestValidationError([
+            {**err, "loc": ("body", "file", *err["loc"]) if err["loc"][0] == "processes" else ("body", *err["loc"])}
+            for err in exc.errors(include_url=False)
+        ])
+    except Exception as exc:
+        # corrupt workbook / undecodable text
+        raise HTTPException(status_code=422, detail=f"Could not read {file.filename or 'upload'}: {exc}")
+    if not len(workload):
+        raise HTTPException(status_code=422, detail="The process table has no rows")
+    return await run_in_threadpool(workload_store.save, workload, name or file.filename or "Workload")
+
+@router.post("/generate", status_code=201)
+async def generate(req: GenerateRequest):
+    """
+    Store a seeded synthetic workload, drawn column by column without building Process
+    lists. The same request always gives the same workload; the returned id is used like
+    an upload's (/simulate, /compare, /jobs, /sweep, /runs).
+    """
+    workload = await run_in_threadpool(generate_workload, req)
+    name = req.name or f"Generated {req.num_processes} ({req.arrivals} arrivals, {req.bursts} bursts, seed {req.seed})"
+    return await run_in_threadpool(workload_store.save, workload, name)
+
+@router.get("/{workload_id}")
+def get_workload(workload_id: str):
+    try:
+        return workload_store.describe(workload_id)
+    except WorkloadNotFound:
+        raise HTTPException(status_code=404, detail="Workload not found")
+
+@router.delete("/{workload_id}")
+def delete_workload(workload_id: str):
+    try:
+        deleted = workload_store.delete(workload_id)
+    except WorkloadInUse as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Workload not found")
+    return {"message": "Workload deleted"}
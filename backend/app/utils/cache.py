@@ -0,0 +1,117 @@
+# backend/app/utils/cache.py
+from __future__ import annotations
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from sqlalchemy import func, select
+
+from ..core.workload import Workload, as_workload
+from ..db.base import SessionLocal
+from ..db.models import CachedResult
+from ..models.schemas import SystemConfig
+from .lru import LRUCache
+
+# bump when scheduler output or key derivation changes so stale on-disk entries stop matching
+CACHE_VERSION = "5"
+
+RESULT_CACHE_BYTES = int(os.getenv("RESULT_CACHE_BYTES", str(64 * 1024 * 1024)))
+RESULT_CACHE_DISK = os.getenv("RESULT_CACHE_DISK", "0").lower() in ("1", "true", "yes")
+RESULT_CACHE_DISK_ENTRIES = int(os.getenv("RESULT_CACHE_DISK_ENTRIES", "10000"))
+
+
+def cache_key(namespace: str, cfg: Union[SystemConfig, Workload], **params: Any) -> str:
+    """Canonical hash of the workload digest plus endpoint-specific params."""
+    payload = {"v": CACHE_VERSION, "ns": namespace, "cfg": as_workload(cfg).digest(), "params": params}
+    raw = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Serialized responses keyed by cache_key, evicted LRU under a byte budget.
+    Optionally backed by the result_cache table so entries survive a restart.
+    """
+
+    def __init__(self, max_bytes: int, disk: bool = False, disk_entries: int = 10000):
+        self.max_bytes = max_bytes
+        self.disk = disk
+        self.disk_entries = disk_entries
+        self._entries: LRUCache[str, bytes] = LRUCache(max_bytes, size=len)
+        # guards the counters; the LRU has its own lock
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        body = self._entries.get(key)
+        if body is not None:
+            with self._lock:
+                self.hits += 1
+            return body
+        if self.disk:
+            body = self._disk_get(key)
+            if body is not None:
+                with self._lock:
+                    self.disk_hits += 1
+                self._entries.put(key, body)
+                return body
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, body: bytes) -> None:
+        self._entries.put(key, body)
+        if self.disk:
+            self._disk_put(key, body)
+
+    def get_or_compute(self, key: str, compute: Callable[[], bytes]) -> Tuple[bytes, bool]:
+        # returns (body, hit)
+        body = self.get(key)
+        if body is not None:
+            return body, True
+        body = compute()
+        self.put(key, body)
+        return body, False
+
+    def clear(self) -> None:
+        self._entries.clear()
+        if self.disk:
+            with SessionLocal() as db:
+                db.query(CachedResult).delete()
+                db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._entries.total,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self._entries.evictions,
+                "disk": self.disk,
+            }
+
+    def _disk_get(self, key: str) -> Optional[bytes]:
+        with SessionLocal() as db:
+            row = db.get(CachedResult, key)
+            return row.body if row is not None else None
+
+    def _disk_put(self, key: str, body: bytes) -> None:
+        with SessionLocal() as db:
+            db.merge(CachedResult(key=key, body=body, size=len(body)))
+            db.commit()
+            # keep the table bounded: drop the oldest rows beyond disk_entries
+            count = db.scalar(select(func.count()).select_from(CachedResult))
+            if count and count > self.disk_entries:
+                oldest = select(CachedResult.key).order_by(CachedResult.created_at).limit(count - self.disk_entries)
+                db.query(CachedResult).filter(CachedResult.key.in_(oldest)).delete(synchronize_session=False)
+                db.commit()
+
+
+result_cache = ResultCache(RESULT_CACHE_BYTES, disk=RESULT_CACHE_DISK, disk_entries=RESULT_CACHE_DISK_ENTRIES)
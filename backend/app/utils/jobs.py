@@ -0,0 +1,197 @@
+# backend/app/utils/jobs.py
+from __future__ import annotations
+import os
+import threading
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Dict, Optional, Union
+
+from ..core.scheduler import run_baseline, run_memory_aware
+from ..core.workload import Workload, as_workload
+from ..db.analytics import record_metrics
+from ..db.base import SessionLocal
+from ..db.models import Run
+from ..models.schemas import SystemConfig, TraceMode
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "0")) or os.cpu_count() or 1
+# queued + running jobs accepted before /jobs answers 429
+JOB_QUEUE_MAX = int(os.getenv("JOB_QUEUE_MAX", "64"))
+# finished jobs kept in memory for status polling; results themselves live in the runs table
+JOB_HISTORY = int(os.getenv("JOB_HISTORY", "1000"))
+
+SCHEDULERS = {
+    "baseline": run_baseline,
+    "memory_aware": run_memory_aware,
+}
+
+
+def _run_scheduler(name: str, workload: Workload, trace_mode: TraceMode, faults: bool = False) -> Dict[str, Any]:
+    # executed in a worker process: the columnar workload pickles as a few arrays, results come back as plain data
+    return SCHEDULERS[name](workload, trace_mode, faults)
+
+
+class QueueFull(Exception):
+    pass
+
+
+class Job:
+    def __init__(self, name: str, workload: Workload, stored_input: Optional[Dict[str, Any]] = None):
+        self.id = uuid.uuid4().hex
+        self.name = name
+        self.input = workload.to_input()
+        # persisted instead of `input` for workloads submitted by workload_id (see Run.build)
+        self.stored_input = stored_input
+        self.state = "queued"
+        self.futures: Dict[str, Future] = {}
+        self.results: Dict[str, Any] = {}
+        self.run_id: Optional[int] = None
+        self.error: Optional[str] = None
+
+    @property
+    def active(self) -> bool:
+        return self.state in ("queued", "running")
+
+    def status(self) -> Dict[str, Any]:
+        state = self.state
+        if state == "queued" and any(f.running() or f.done() for f in self.futures.values()):
+            state = "running"
+        progress = 1.0 if self.state == "done" else len(self.results) / len(SCHEDULERS)
+        return {
+            "id": self.id,
+            "name": self.name,
+            "status": state,
+            "progress": progress,
+            "run_id": self.run_id,
+            "error": self.error,
+        }
+
+
+class JobManager:
+    """
+    Runs simulations in a process pool so large workloads never occupy the
+    request threadpool. Each scheduler of a job is its own task, so the two
+    halves of a comparison run in parallel and report progress separately.
+    """
+
+    def __init__(self, workers: int, max_active: int, history: int):
+        self.workers = workers
+        self.max_active = max_active
+        self.history = history
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._jobs: Dict[str, Job] = {}
+        # re-entrant: Future.cancel() runs done callbacks (which take the lock) synchronously
+        self._lock = threading.RLock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def _discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        # a worker died (e.g. killed for memory on a large job), which breaks the whole pool:
+        # the executor fails its pending tasks with BrokenProcessPool, and the next submit starts a fresh pool
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False)
+
+    def submit(self, cfg: Union[SystemConfig, Workload], name: str, trace_mode: TraceMode = "ticks",
+               faults: bool = False, stored_input: Optional[Dict[str, Any]] = None) -> Job:
+        workload = as_workload(cfg)
+        with self._lock:
+            if sum(1 for j in self._jobs.values() if j.active) >= self.max_active:
+                raise QueueFull()
+            job = Job(name, workload, stored_input)
+            self._jobs[job.id] = job
+            self._prune()
+            pool = self._get_pool()
+            try:
+                job.futures = {sched: pool.submit(_run_scheduler, sched, workload, trace_mode, faults)
+                               for sched in SCHEDULERS}
+            except BrokenProcessPool:
+                self._discard_pool(pool)
+                pool = self._get_pool()
+                job.futures = {sched: pool.submit(_run_scheduler, sched, workload, trace_mode, faults)
+                               for sched in SCHEDULERS}
+        for sched, fut in job.futures.items():
+            fut.add_done_callback(partial(self._on_done, job, sched, pool))
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        with self._lock:
+            if job.active:
+                # queued tasks are dropped; a task already running in a worker finishes
+                # but its result is discarded
+                for fut in job.futures.values():
+                    fut.cancel()
+                job.state = "cancelled"
+                job.results = {}
+        return job
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _on_done(self, job: Job, sched: str, pool: ProcessPoolExecutor, fut: Future) -> None:
+        if not fut.cancelled() and isinstance(fut.exception(), BrokenProcessPool):
+            self._discard_pool(pool)
+        with self._lock:
+            if fut.cancelled() or not job.active:
+                return
+            exc = fut.exception()
+            if exc is not None:
+                job.state = "failed"
+                job.error = f"{sched}: {exc}"
+                job.results = {}
+                for other in job.futures.values():
+                    other.cancel()
+                return
+            job.results[sched] = fut.result()
+            if len(job.results) < len(SCHEDULERS):
+                return
+        self._persist(job)
+
+    def _persist(self, job: Job) -> None:
+        # rows are written outside the lock; the commit and the state change happen under it,
+        # so a cancel that arrives meanwhile rolls the run back instead of being overwritten
+        try:
+            with SessionLocal() as db:
+                row = Run.build(job.name, job.input, job.results, job.stored_input)
+                db.add(row)
+                db.flush()
+                record_metrics(db, [(row.id, job.input, job.results)])
+                with self._lock:
+                    if not job.active:
+                        db.rollback()
+                        return
+                    db.commit()
+                    job.run_id = row.id
+                    job.state = "done"
+                    # the runs table owns the results from here on
+                    job.results = {}
+        except Exception as exc:
+            with self._lock:
+                if job.active:
+                    job.state = "failed"
+                    job.error = f"persist: {exc}"
+                job.results = {}
+
+    def _prune(self) -> None:
+        # drop the oldest finished jobs beyond the history limit (dicts keep insertion order)
+        extra = len(self._jobs) - self.history
+        if extra <= 0:
+            return
+        for job_id in [j.id for j in self._jobs.values() if not j.active][:extra]:
+            del self._jobs[job_id]
+
+
+job_manager = JobManager(JOB_WORKERS, JOB_QUEUE_MAX, JOB_HISTORY)
@@ -0,0 +1,73 @@
+# backend/app/utils/lru.py
+from __future__ import annotations
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Thread-safe in-memory LRU map. Bounded by entry count, or with `size` by the sum of
+    size(value) (e.g. bytes); a value larger than the whole bound is not kept.
+    """
+
+    def __init__(self, max_size: int, size: Optional[Callable[[V], int]] = None):
+        self.max_size = max_size
+        self._size = size or (lambda value: 1)
+        self._entries: "OrderedDict[K, V]" = OrderedDict()
+        self._total = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total(self) -> int:
+        """Current sum of entry sizes (the entry count without `size`)."""
+        return self._total
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        size = self._size(value)
+        with self._lock:
+            self._discard(key)
+            if size > self.max_size:
+                return
+            self._entries[key] = value
+            self._total += size
+            while self._total > self.max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self._total -= self._size(evicted)
+                self.evictions += 1
+
+    def get_or_build(self, key: K, build: Callable[[], V]) -> V:
+        # build runs outside the lock, so two callers may both build a missing entry; the last one is kept
+        value = self.get(key)
+        if value is None:
+            value = build()
+            self.put(key, value)
+        return value
+
+    def pop(self, key: K) -> None:
+        with self._lock:
+            self._discard(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total = 0
+
+    def _discard(self, key: K) -> None:
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._total -= self._size(old)
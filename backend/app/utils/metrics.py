@@ -0,0 +1,211 @@
+# backend/app/utils/metrics.py
+"""
+Request and simulation instrumentation, exported in the Prometheus text format on /metrics.
+
+Off by default. With METRICS_ENABLED=1 every hot-path phase (body parsing, validation,
+RR core, context switches, wait/turnaround, trace building, paging, serialization) is
+timed per scheduler into `scheduler_phase_seconds`, and requests, simulated ticks,
+segments, trace rows and response bytes are counted. SERVER_TIMING=1 also adds a
+Server-Timing header with the same per-request phase durations.
+When both are off, timed() hands back a shared no-op context manager.
+"""
+from __future__ import annotations
+import contextlib
+import os
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+SERVER_TIMING = os.getenv("SERVER_TIMING", "0").lower() in ("1", "true", "yes")
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "0").lower() in ("1", "true", "yes")
+# phases are only timed when something consumes them
+ENABLED = METRICS_ENABLED or SERVER_TIMING
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _num(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, *labels: str) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        lines.extend(f"{self.name}{_labels(self.labelnames, k)} {_num(v)}" for k, v in items)
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts..., +Inf count, sum]
+        self._values: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        with self._lock:
+            row = self._values.get(labels)
+            if row is None:
+                row = self._values[labels] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    row[i] += 1
+                    break
+            else:
+                row[len(self.buckets)] += 1
+            row[-1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._values.items())
+        for key, row in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets, row):
+                cumulative += n
+                le = _labels(self.labelnames, key, 'le="%s"' % _num(bound))
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            cumulative += row[len(self.buckets)]
+            le = _labels(self.labelnames, key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{le} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_num(row[-1])}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+REQUESTS = Counter("http_requests_total", "HTTP requests by route, method and status.", ("route", "method", "status"))
+REQUEST_SECONDS = Histogram("http_request_duration_seconds", "HTTP request latency by route.", ("route", "method"))
+RESPONSE_BYTES = Counter("http_response_bytes_total", "Response body bytes sent, by route.", ("route",))
+PHASE_SECONDS = Histogram("scheduler_phase_seconds", "Time spent per hot-path phase, by scheduler.", ("phase", "scheduler"))
+SIMULATIONS = Counter("scheduler_simulations_total", "Scheduler runs.", ("scheduler",))
+SIMULATED_TICKS = Counter("scheduler_simulated_ticks_total", "Simulated time units (total_time).", ("scheduler",))
+SEGMENTS = Counter("scheduler_segments_total", "Timeline segments produced.", ("scheduler",))
+TRACE_ROWS = Counter("scheduler_trace_rows_total", "Trace rows built (per-tick rows or RLE runs).", ("scheduler",))
+
+REGISTRY = (REQUESTS, REQUEST_SECONDS, RESPONSE_BYTES, PHASE_SECONDS, SIMULATIONS, SIMULATED_TICKS, SEGMENTS, TRACE_ROWS)
+
+# per-request phase totals, keyed "<scheduler>_<phase>" (or just phase); set by MetricsMiddleware
+_request_phases: ContextVar[Optional[Dict[str, float]]] = ContextVar("request_phases", default=None)
+
+_NOOP = contextlib.nullcontext()
+
+
+class _Timer:
+    __slots__ = ("phase", "scheduler", "t0")
+
+    def __init__(self, phase: str, scheduler: str):
+        self.phase = phase
+        self.scheduler = scheduler
+
+    def __enter__(self) -> "_Timer":
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        elapsed = time.perf_counter() - self.t0
+        if METRICS_ENABLED:
+            PHASE_SECONDS.observe(elapsed, self.phase, self.scheduler)
+        phases = _request_phases.get()
+        if phases is not None:
+            key = f"{self.scheduler}_{self.phase}" if self.scheduler else self.phase
+            phases[key] = phases.get(key, 0.0) + elapsed
+
+
+def timed(phase: str, scheduler: str = ""):
+    """Context manager timing one hot-path phase; a shared no-op when instrumentation is off."""
+    if not ENABLED:
+        return _NOOP
+    return _Timer(phase, scheduler)
+
+
+def record_simulation(scheduler: str, ticks: int, segments: int, trace_rows: int) -> None:
+    if not METRICS_ENABLED:
+        return
+    SIMULATIONS.inc(1, scheduler)
+    SIMULATED_TICKS.inc(ticks, scheduler)
+    SEGMENTS.inc(segments, scheduler)
+    TRACE_ROWS.inc(trace_rows, scheduler)
+
+
+def render() -> str:
+    lines: List[str] = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+def server_timing(phases: Dict[str, float]) -> str:
+    return ", ".join(f"{name};dur={seconds * 1000:.3f}" for name, seconds in phases.items())
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware: request count/latency/bytes per route template, and the
+    per-request phase dict that timed() fills (also across the threadpool, since
+    contextvars are copied into worker threads).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        phases: Dict[str, float] = {}
+        token = _request_phases.set(phases)
+        t0 = time.perf_counter()
+        status = [500]
+        sent = [0]
+
+        async def wrapped_send(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+                if SERVER_TIMING:
+                    phases["total"] = time.perf_counter() - t0
+                    message = dict(message)
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"server-timing", server_timing(phases).encode("latin-1"))
+                    ]
+            elif message["type"] == "http.response.body":
+                sent[0] += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, wrapped_send)
+        finally:
+            _request_phases.reset(token)
+            if METRICS_ENABLED:
+                route = getattr(scope.get("route"), "path", None) or "unmatched"
+                method = scope.get("method", "")
+                REQUESTS.inc(1, route, method, str(status[0]))
+                REQUEST_SECONDS.observe(time.perf_counter() - t0, route, method)
+                RESPONSE_BYTES.inc(sent[0], route)
@@ -0,0 +1,160 @@
+# backend/app/utils/workload_import.py
+"""
+Incremental CSV / XLSX workload parsing for POST /workloads/upload.
+
+Rows are read one at a time (csv.reader, openpyxl read-only mode) and validated in
+chunks of UPLOAD_CHUNK_ROWS straight into Workload columns, so memory stays around one
+chunk of row dicts plus the columns. Headers accept the same spellings as the frontend's
+ExcelUpload ("arrival time", "pages count", "pages", "page count", ...).
+"""
+from __future__ import annotations
+import codecs
+import csv
+import os
+from itertools import islice
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..core.workload import Workload
+from ..models.schemas import SystemParams
+
+UPLOAD_CHUNK_ROWS = int(os.getenv("UPLOAD_CHUNK_ROWS", "5000"))
+UPLOAD_MAX_PROCESSES = int(os.getenv("UPLOAD_MAX_PROCESSES", "1000000"))
+
+PROCESS_FIELDS = ("pid", "arrival_time", "burst_time", "priority", "pages_count")
+SYSTEM_FIELDS = tuple(SystemParams.model_fields)
+
+# normalized header -> field; anything already matching a field name maps to itself
+ALIASES = {
+    "pages": "pages_count",
+    "page_count": "pages_count",
+}
+
+
+class UploadError(ValueError):
+    pass
+
+
+class UnsupportedFormat(UploadError):
+    pass
+
+
+def normalize_key(key: Any) -> str:
+    # "Arrival Time" / "arrival-time" / "arrival_time" -> "arrival_time"
+    k = "_".join(str(key).strip().lower().replace("-", " ").split())
+    return ALIASES.get(k, k)
+
+
+def _cell(value: Any) -> Any:
+    # spreadsheet cells: integral floats become ints, blanks become missing
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.strip()
+        return value if value else None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _process_row(header: List[Optional[str]], values: Iterable[Any], index: int) -> Optional[Dict[str, Any]]:
+    row: Dict[str, Any] = {}
+    for field, value in zip(header, values):
+        if field is None:
+            continue
+        value = _cell(value)
+        if value is not None:
+            row[field] = value
+    if not row:
+        # blank line
+        return None
+    pid = row.get("pid")
+    # frontend default for rows without a pid; numeric pids become strings
+    row["pid"] = f"P{index + 1}" if pid is None else str(pid)
+    return row
+
+
+def _process_rows(rows: Iterator[Iterable[Any]]) -> Iterator[Dict[str, Any]]:
+    header_row = next(rows, None)
+    if header_row is None:
+        raise UploadError("the process table is empty")
+    header = [normalize_key(h) if h is not None else None for h in header_row]
+    header = [h if h in PROCESS_FIELDS else None for h in header]
+    missing = [f for f in PROCESS_FIELDS[1:] if f not in header]
+    if missing:
+        raise UploadError(f"the process table has no column for: {', '.join(missing)}")
+    index = 0
+    for values in rows:
+        row = _process_row(header, values, index)
+        if row is None:
+            continue
+        if index >= UPLOAD_MAX_PROCESSES:
+            raise UploadError(f"more than {UPLOAD_MAX_PROCESSES} processes")
+        index += 1
+        yield row
+
+
+def _chunks(rows: Iterator[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+    while True:
+        chunk = list(islice(rows, UPLOAD_CHUNK_ROWS))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _system(sheet_values: Dict[str, Any], overrides: Dict[str, Any]) -> SystemParams:
+    # form fields win over the System sheet; raises pydantic.ValidationError
+    data = {k: v for k, v in sheet_values.items() if k in SYSTEM_FIELDS}
+    data.update({k: v for k, v in overrides.items() if v is not None})
+    return SystemParams.model_validate(data)
+
+
+def read_csv(stream: IO[bytes], overrides: Dict[str, Any]) -> Workload:
+    """Process table as CSV (header row first); system parameters come from `overrides`."""
+    system = _system({}, overrides)
+    text = codecs.getreader("utf-8-sig")(stream)
+    return Workload.from_chunks(system, _chunks(_process_rows(iter(csv.reader(text)))))
+
+
+def _sheets(wb) -> Tuple[Any, Any]:
+    # same choice as ExcelUpload.jsx: "System"/"Processes" by name, else first/second sheet
+    names = wb.sheetnames
+    system = wb["System"] if "System" in names else wb[names[0]]
+    if "Processes" in names:
+        processes = wb["Processes"]
+    else:
+        processes = wb[names[1]] if len(names) > 1 else wb[names[0]]
+    return (system if system is not processes else None), processes
+
+
+def read_xlsx(stream: IO[bytes], overrides: Dict[str, Any]) -> Workload:
+    """
+    Workbook with a key/value System sheet and a Processes table, as exported for the
+    frontend. `overrides` (form fields) take precedence over the System sheet.
+    """
+    # heavy import, only needed for spreadsheet uploads
+    from openpyxl import load_workbook
+
+    wb = load_workbook(stream, read_only=True, data_only=True)
+    try:
+        system_sheet, process_sheet = _sheets(wb)
+        sheet_values: Dict[str, Any] = {}
+        if system_sheet is not None:
+            for row in system_sheet.iter_rows(values_only=True):
+                if len(row) >= 2 and row[0] is not None:
+                    sheet_values[normalize_key(row[0])] = _cell(row[1])
+        system = _system(sheet_values, overrides)
+        rows = process_sheet.iter_rows(values_only=True)
+        return Workload.from_chunks(system, _chunks(_process_rows(rows)))
+    finally:
+        wb.close()
+
+
+def detect_format(filename: Optional[str], content_type: Optional[str], head: bytes) -> str:
+    name = (filename or "").lower()
+    if name.endswith(".xlsx") or head.startswith(b"PK\x03\x04"):
+        return "xlsx"
+    if name.endswith(".xls"):
+        raise UnsupportedFormat("legacy .xls workbooks are not supported; save as .xlsx or .csv")
+    if name.endswith(".csv") or (content_type or "").startswith(("text/", "application/csv")):
+        return "csv"
+    raise UnsupportedFormat("unsupported file type; upload a .csv or .xlsx file")
@@ -0,0 +1,105 @@
+# backend/app/utils/workload_store.py
+from __future__ import annotations
+import os
+import uuid
+from typing import Any, Dict, Optional
+
+from sqlalchemy import func, select
+
+from ..core.workload import Workload
+from ..db.base import SessionLocal
+from ..db.models import Run, StoredWorkload
+from ..models.schemas import SystemParams
+from .lru import LRUCache
+
+# decoded workloads kept in memory, so repeated runs on one upload skip the database and decompression
+WORKLOAD_CACHE_ENTRIES = int(os.getenv("WORKLOAD_CACHE_ENTRIES", "16"))
+
+
+class WorkloadNotFound(KeyError):
+    pass
+
+
+class WorkloadInUse(Exception):
+    def __init__(self, workload_id: str, runs: int):
+        super().__init__(f"Workload {workload_id} is referenced by {runs} saved run(s)")
+        self.runs = runs
+
+
+def _describe(row: StoredWorkload) -> Dict[str, Any]:
+    return {
+        "id": row.id,
+        "name": row.name,
+        "created_at": getattr(row.created_at, "isoformat", lambda: str(row.created_at))(),
+        "process_count": row.process_count,
+        "digest": row.digest,
+        "system": row.system,
+    }
+
+
+class WorkloadStore:
+    """
+    Server-side workloads, stored once (deduplicated by Workload.digest) and referenced
+    by id, so large process lists never have to be posted again.
+    """
+
+    def __init__(self, max_entries: int):
+        self._entries: LRUCache[str, Workload] = LRUCache(max_entries)
+
+    def save(self, w: Workload, name: str) -> Dict[str, Any]:
+        digest = w.digest()
+        with SessionLocal() as db:
+            row = db.scalars(select(StoredWorkload).where(StoredWorkload.digest == digest).limit(1)).first()
+            if row is None:
+                row = StoredWorkload(id=uuid.uuid4().hex, name=name, digest=digest, process_count=len(w),
+                                     system=w.system(), columns=w.to_blob())
+                db.add(row)
+                db.commit()
+                db.refresh(row)
+            summary = _describe(row)
+        self._entries.put(summary["id"], w)
+        return summary
+
+    def describe(self, workload_id: str) -> Dict[str, Any]:
+        with SessionLocal() as db:
+            row = db.get(StoredWorkload, workload_id)
+            if row is None:
+                raise WorkloadNotFound(workload_id)
+            return _describe(row)
+
+    def get(self, workload_id: str) -> Workload:
+        w = self._entries.get(workload_id)
+        if w is not None:
+            return w
+        with SessionLocal() as db:
+            row = db.get(StoredWorkload, workload_id)
+            if row is None:
+                raise WorkloadNotFound(workload_id)
+            w = Workload.from_blob(SystemParams.model_validate(row.system), row.columns)
+        self._entries.put(workload_id, w)
+        return w
+
+    def resolve(self, workload_id: str, system: Optional[Dict[str, Any]] = None) -> Workload:
+        """The stored workload, with `system` (a partial SystemParams dict) overriding its parameters."""
+        w = self.get(workload_id)
+        if not system:
+            return w
+        return w.with_system(SystemParams.model_validate({**w.system(), **system}))
+
+    def delete(self, workload_id: str) -> bool:
+        """False if there is no such workload; WorkloadInUse while saved runs reference it."""
+        with SessionLocal() as db:
+            row = db.get(StoredWorkload, workload_id)
+            if row is None:
+                return False
+            # runs saved by workload_id store only the reference, so their input lives here
+            runs = db.scalar(select(func.count()).select_from(Run).where(Run.workload_id == workload_id))
+            if runs:
+                raise WorkloadInUse(workload_id, runs)
+            self._entries.pop(workload_id)
+            db.delete(row)
+            db.commit()
+            return True
+
+
+workload_store = WorkloadStore(WORKLOAD_CACHE_ENTRIES)
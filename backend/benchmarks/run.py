@@ -0,0 +1,275 @@
+# backend/benchmarks/run.py
+"""
+Scheduler and API benchmarks.
+
+    cd backend
+    python -m benchmarks.run --sizes 10,100,1000,10000 --output bench.json
+    python -m benchmarks.run --baseline bench.json --threshold 0.25
+
+Each benchmark is timed `--repeat` times (median and min reported) and run once more
+under tracemalloc for peak allocation. With --baseline, results are compared by name
+and the process exits 1 if any median is slower than baseline * (1 + threshold).
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# measure the simulators, not the result cache
+os.environ["RESULT_CACHE_BYTES"] = "0"
+os.environ["RESULT_CACHE_DISK"] = "0"
+
+import numpy as np  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.core.generator import generate_workload  # noqa: E402
+from app.core.paging import simulate_paging  # noqa: E402
+from app.core.policies import POLICIES  # noqa: E402
+from app.core.scheduler import (  # noqa: E402
+    build_trace, build_trace_rle, compute_wait_turnaround, count_context_switches, simulate_rr_with_quanta,
+)
+from app.core.smp import iter_smp_segments  # noqa: E402
+from app.core.workload import Workload  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.schemas import AcceptsEither, GenerateRequest, SimulationInput, SystemConfig  # noqa: E402
+
+from .workloads import SCENARIOS, make_workload, to_payload  # noqa: E402
+
+DEFAULT_SIZES = "10,100,1000,10000"
+
+_client: Optional[TestClient] = None
+
+
+def _rr_args(cfg: SystemConfig) -> Tuple[list, list, dict, dict, int]:
+    pids = [p.pid for p in cfg.processes]
+    return (
+        pids,
+        [p.burst_time for p in cfg.processes],
+        {p: cfg.cpu_quantum for p in pids},
+        {p.pid: p.arrival_time for p in cfg.processes},
+        cfg.cpu_idle_gap,
+    )
+
+
+def _timeline(cfg: SystemConfig) -> list:
+    pids, bursts, quanta, arrivals, gap = _rr_args(cfg)
+    return simulate_rr_with_quanta(pids, bursts, quanta, arrivals=arrivals, idle_between_quanta=gap, engine="event")
+
+
+def _rr(engine: str) -> Callable[[SystemConfig], Callable[[], Any]]:
+    def setup(cfg):
+        pids, bursts, quanta, arrivals, gap = _rr_args(cfg)
+        return lambda: simulate_rr_with_quanta(pids, bursts, quanta, arrivals=arrivals, idle_between_quanta=gap, engine=engine)
+    return setup
+
+
+def _rr_smp(num_cpus: int) -> Callable[[SystemConfig], Callable[[], Any]]:
+    def setup(cfg):
+        pids, bursts, quanta, arrivals, gap = _rr_args(cfg)
+        q = [quanta[p] for p in pids]
+        arr = [arrivals[p] for p in pids]
+        return lambda: sum(1 for _ in iter_smp_segments(bursts, q, arr, num_cpus, gap))
+    return setup
+
+
+def _policy(name: str) -> Callable[[SystemConfig], Callable[[], Any]]:
+    def setup(cfg):
+        w = Workload.from_config(cfg)
+        return lambda: POLICIES[name](w, "rle")
+    return setup
+
+
+def _on_timeline(fn: Callable[[list], Any]) -> Callable[[SystemConfig], Callable[[], Any]]:
+    def setup(cfg):
+        timeline = _timeline(cfg)
+        return lambda: fn(timeline)
+    return setup
+
+
+def _wait_turnaround(cfg):
+    pids, bursts, _, arrivals, _ = _rr_args(cfg)
+    timeline = _timeline(cfg)
+    return lambda: compute_wait_turnaround(pids, bursts, timeline, arrivals=arrivals)
+
+
+def _paging(cfg):
+    timeline = _timeline(cfg)
+    return lambda: simulate_paging(cfg, timeline)
+
+
+def _validation(cfg):
+    # the union -> model_dump -> AcceptsEither -> to_flat path the routers used to take
+    payload = to_payload(cfg)
+
+    def run():
+        parsed = SimulationInput.model_validate(payload)
+        return AcceptsEither.model_validate(parsed.model_dump()).to_flat()
+    return run
+
+
+def _workload(cfg):
+    # single-pass columnar validation used by the simulate/compare/jobs routes
+    payload = to_payload(cfg)
+    return lambda: Workload.from_payload(payload)
+
+
+def _generate(cfg):
+    # server-side generator at the same size, straight to columns
+    spec = GenerateRequest(num_processes=len(cfg.processes), arrivals="bursty", bursts="pareto",
+                           system=cfg.model_dump(exclude={"processes"}))
+    return lambda: generate_workload(spec)
+
+
+def _sweep_payload(cfg: SystemConfig) -> dict:
+    return {"config": to_payload(cfg), "cpu_quantum": [2, 4, 8], "total_frames": [64, 256, 1024]}
+
+
+def _http(path: str, build: Callable[[SystemConfig], dict] = to_payload) -> Callable[[SystemConfig], Callable[[], Any]]:
+    def setup(cfg):
+        global _client
+        if _client is None:
+            _client = TestClient(app)
+        client = _client
+        payload = build(cfg)
+
+        def run():
+            r = client.post(path, json=payload)
+            r.raise_for_status()
+            return len(r.content)
+        return run
+    return setup
+
+
+# name -> (setup, largest process count it is run at)
+BENCHMARKS: Dict[str, Tuple[Callable[[SystemConfig], Callable[[], Any]], int]] = {
+    "rr_event": (_rr("event"), 1_000_000),
+    "rr_legacy": (_rr("legacy"), 2_000),
+    "rr_smp_8": (_rr_smp(8), 1_000_000),
+    "rr_smp_64": (_rr_smp(64), 1_000_000),
+    "policy_sjf": (_policy("sjf"), 100_000),
+    "policy_srtf": (_policy("srtf"), 100_000),
+    "policy_priority": (_policy("priority"), 100_000),
+    "policy_mlfq": (_policy("mlfq"), 100_000),
+    "build_trace": (_on_timeline(build_trace), 10_000),
+    "build_trace_rle": (_on_timeline(build_trace_rle), 1_000_000),
+    "count_context_switches": (_on_timeline(count_context_switches), 1_000_000),
+    "compute_wait_turnaround": (_wait_turnaround, 1_000_000),
+    "simulate_paging": (_paging, 100_000),
+    "validate_accepts_either": (_validation, 100_000),
+    "validate_workload": (_workload, 1_000_000),
+    "generate_workload": (_generate, 1_000_000),
+    "http_simulate_baseline": (_http("/simulate/baseline"), 1_000),
+    "http_simulate_memory_aware": (_http("/simulate/memory-aware"), 1_000),
+    "http_compare": (_http("/compare"), 1_000),
+    "http_compare_rle": (_http("/compare?trace=rle"), 10_000),
+    "http_sweep": (_http("/sweep", _sweep_payload), 1_000),
+}
+
+
+def measure(fn: Callable[[], Any], repeat: int, memory: bool) -> Dict[str, Any]:
+    times: List[float] = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    out: Dict[str, Any] = {"median_s": statistics.median(times), "min_s": min(times), "repeat": repeat}
+    if memory:
+        tracemalloc.start()
+        try:
+            fn()
+            out["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return out
+
+
+def run_all(sizes: List[int], scenarios: List[str], only: Optional[str], repeat: int, seed: int, memory: bool
+            ) -> List[Dict[str, Any]]:
+    results = []
+    for n in sizes:
+        for scenario in scenarios:
+            cfg = make_workload(n, scenario, seed=seed)
+            for name, (setup, max_n) in BENCHMARKS.items():
+                if n > max_n or (only and only not in name):
+                    continue
+                fn = setup(cfg)
+                key = f"{name}[n={n},{scenario}]"
+                stats = measure(fn, repeat, memory)
+                results.append({"name": key, "benchmark": name, "n": n, "scenario": scenario, **stats})
+                print(f"{key:<60} {stats['median_s'] * 1000:>10.2f} ms", file=sys.stderr)
+    return results
+
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """Entries whose median exceeds the baseline median by more than `threshold` (a fraction)."""
+    base = {r["name"]: r for r in baseline.get("results", [])}
+    regressions = []
+    for r in results:
+        b = base.get(r["name"])
+        if b is None or b["median_s"] <= 0:
+            continue
+        ratio = r["median_s"] / b["median_s"]
+        if ratio > 1.0 + threshold:
+            regressions.append({"name": r["name"], "baseline_s": b["median_s"], "current_s": r["median_s"], "ratio": ratio})
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Scheduler and API benchmarks")
+    ap.add_argument("--sizes", default=DEFAULT_SIZES, help="comma-separated process counts (10 .. 1000000)")
+    ap.add_argument("--scenarios", default=",".join(SCENARIOS), help=f"subset of {','.join(SCENARIOS)}")
+    ap.add_argument("--only", default=None, help="run benchmarks whose name contains this string")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    ap.add_argument("--output", default=None, help="write JSON results here (default: stdout)")
+    ap.add_argument("--baseline", default=None, help="JSON results to compare against")
+    ap.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown vs baseline, as a fraction")
+    args = ap.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    scenarios = [s for s in args.scenarios.split(",") if s]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        ap.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    results = run_all(sizes, scenarios, args.only, args.repeat, args.seed, not args.no_memory)
+    report: Dict[str, Any] = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        "results": results,
+    }
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        report["regressions"] = regressions
+        for r in regressions:
+            print(f"REGRESSION {r['name']}: {r['baseline_s'] * 1000:.2f} ms -> {r['current_s'] * 1000:.2f} ms "
+                  f"(x{r['ratio']:.2f})", file=sys.stderr)
+        status = 1 if regressions else 0
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
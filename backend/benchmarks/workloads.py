@@ -0,0 +1,78 @@
+# backend/benchmarks/workloads.py
+from __future__ import annotations
+from typing import Dict, List
+
+import numpy as np
+
+from app.models.schemas import Process, SystemConfig
+
+BURSTS = ("uniform", "exponential", "pareto")
+ARRIVALS = ("batch", "uniform", "poisson", "bursty")
+
+# named scenarios run at every size: (burst distribution, arrival pattern, cpu_idle_gap)
+SCENARIOS: Dict[str, tuple] = {
+    "uniform-batch": ("uniform", "batch", 0),
+    "exp-poisson": ("exponential", "poisson", 0),
+    "pareto-bursty-gap": ("pareto", "bursty", 1),
+}
+
+MEAN_BURST = 20
+
+
+def _bursts(rng: np.random.Generator, n: int, kind: str) -> np.ndarray:
+    if kind == "uniform":
+        b = rng.integers(1, 2 * MEAN_BURST, size=n)
+    elif kind == "exponential":
+        b = np.ceil(rng.exponential(MEAN_BURST, size=n))
+    elif kind == "pareto":
+        # heavy tail, alpha 1.5, scaled to roughly the same mean
+        b = np.ceil((rng.pareto(1.5, size=n) + 1) * MEAN_BURST / 3)
+    else:
+        raise ValueError(f"unknown burst distribution {kind!r}")
+    return np.maximum(1, b).astype(np.int64)
+
+
+def _arrivals(rng: np.random.Generator, n: int, kind: str) -> np.ndarray:
+    # arrival rate chosen so the CPU is roughly saturated
+    if kind == "batch":
+        return np.zeros(n, dtype=np.int64)
+    if kind == "uniform":
+        return np.sort(rng.integers(0, n * MEAN_BURST, size=n))
+    if kind == "poisson":
+        return np.floor(np.cumsum(rng.exponential(MEAN_BURST, size=n))).astype(np.int64)
+    if kind == "bursty":
+        # clusters of ~50 processes arriving together, clusters spaced exponentially
+        clusters = max(1, n // 50)
+        starts = np.floor(np.cumsum(rng.exponential(50 * MEAN_BURST, size=clusters))).astype(np.int64)
+        return np.sort(starts[rng.integers(0, clusters, size=n)])
+    raise ValueError(f"unknown arrival pattern {kind!r}")
+
+
+def make_workload(n: int, scenario: str, seed: int = 0, cpu_quantum: int = 4, total_frames: int = 256) -> SystemConfig:
+    """Seeded synthetic workload; same (n, scenario, seed) always gives the same config."""
+    burst_kind, arrival_kind, idle_gap = SCENARIOS[scenario]
+    rng = np.random.default_rng([seed, n, list(SCENARIOS).index(scenario)])
+    bursts = _bursts(rng, n, burst_kind).tolist()
+    arrivals = _arrivals(rng, n, arrival_kind).tolist()
+    pages = rng.integers(1, 2 * total_frames, size=n).tolist()
+    priorities = rng.integers(0, 10, size=n).tolist()
+    processes: List[Process] = [
+        Process(pid=f"P{i + 1}", arrival_time=arrivals[i], burst_time=bursts[i], priority=priorities[i], pages_count=pages[i])
+        for i in range(n)
+    ]
+    return SystemConfig(
+        total_frames=total_frames,
+        page_size=4,
+        cpu_quantum=cpu_quantum,
+        memory_threshold=1.0,
+        cpu_idle_gap=idle_gap,
+        processes=processes,
+    )
+
+
+def to_payload(cfg: SystemConfig) -> dict:
+    # nested request body, as the frontend sends it
+    return {
+        "system": cfg.model_dump(exclude={"processes"}),
+        "processes": [p.model_dump() for p in cfg.processes],
+    }
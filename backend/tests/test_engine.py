@@ -0,0 +1,36 @@
+# backend/tests/test_engine.py
+"""The event-driven RR engine against the legacy pass-based loop it replaces."""
+from __future__ import annotations
+import random
+
+import pytest
+
+from app.core.engine import simulate_rr_event_driven
+from app.core.scheduler import simulate_rr_legacy
+
+
+def _case(rng: random.Random):
+    n = rng.randint(1, 12)
+    pids = [f"P{i + 1}" for i in range(n)]
+    # zero bursts never run; arrivals spread wide enough to leave the CPU idle between them
+    bursts = [0 if rng.random() < 0.1 else rng.randint(1, 30) for _ in pids]
+    quanta = {p: rng.randint(1, 8) for p in pids}
+    arrivals = {p: rng.randint(0, 60) for p in pids}
+    gap = rng.choice([0, 0, 1, 3])
+    return pids, bursts, quanta, arrivals, gap
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_event_engine_matches_legacy(seed):
+    rng = random.Random(seed)
+    for _ in range(500):
+        pids, bursts, quanta, arrivals, gap = _case(rng)
+        expected = simulate_rr_legacy(pids, bursts, quanta, arrivals=arrivals, idle_between_quanta=gap)
+        assert simulate_rr_event_driven(pids, bursts, quanta, arrivals=arrivals, idle_between_quanta=gap) == expected
+
+
+def test_default_arrivals_and_all_zero_bursts():
+    pids = ["A", "B", "C"]
+    quanta = {"A": 2, "B": 3, "C": 1}
+    assert simulate_rr_event_driven(pids, [5, 4, 2], quanta) == simulate_rr_legacy(pids, [5, 4, 2], quanta)
+    assert simulate_rr_event_driven(pids, [0, 0, 0], quanta, idle_between_quanta=2) == []
@@ -0,0 +1,43 @@
+# backend/tests/test_lru.py
+from __future__ import annotations
+
+from app.utils.lru import LRUCache
+
+
+def test_count_bound_evicts_least_recently_used():
+    lru: LRUCache[str, int] = LRUCache(2)
+    lru.put("a", 1)
+    lru.put("b", 2)
+    assert lru.get("a") == 1
+    lru.put("c", 3)
+    assert lru.get("b") is None and lru.get("a") == 1 and lru.get("c") == 3
+    assert len(lru) == 2 and lru.evictions == 1
+
+
+def test_size_bound_and_oversized_values():
+    lru: LRUCache[str, bytes] = LRUCache(10, size=len)
+    lru.put("a", b"12345")
+    lru.put("b", b"123456")
+    assert lru.get("a") is None and lru.total == 6
+    lru.put("b", b"1")
+    assert lru.total == 1
+    # larger than the whole budget: not kept, and replaces nothing
+    lru.put("c", b"x" * 11)
+    assert lru.get("c") is None and lru.total == 1
+
+
+def test_get_or_build_builds_once():
+    lru: LRUCache[int, list] = LRUCache(4)
+    calls = []
+    for _ in range(3):
+        assert lru.get_or_build(1, lambda: calls.append(1) or ["v"]) == ["v"]
+    assert calls == [1]
+    lru.pop(1)
+    lru.get_or_build(1, lambda: calls.append(1) or ["v"])
+    assert calls == [1, 1]
+
+
+def test_zero_bound_keeps_nothing():
+    lru: LRUCache[str, int] = LRUCache(0)
+    lru.put("a", 1)
+    assert lru.get("a") is None and len(lru) == 0
@@ -0,0 +1,110 @@
+# backend/tests/test_policies.py
+"""Queue-based scheduling policies (core/policies.py) against a tick-by-tick reference."""
+from __future__ import annotations
+import random
+from typing import List, Optional
+
+import numpy as np
+import pytest
+
+from app.core.engine import IDLE
+from app.core.policies import (
+    MLFQ_LEVELS, MLFQQueue, PriorityQueue, SJFQueue, SRTFQueue, check_policies, iter_policy_segments, run_policies,
+)
+from app.core.workload import Workload
+from app.models.schemas import SystemParams
+
+QUEUES = {"sjf": SJFQueue, "srtf": SRTFQueue, "priority": PriorityQueue, "mlfq": MLFQQueue}
+
+
+def _workload(rng: random.Random, n: int, num_cpus: int = 1) -> Workload:
+    system = SystemParams(total_frames=8, page_size=4, cpu_quantum=rng.randint(1, 4), memory_threshold=0.5,
+                          num_cpus=num_cpus)
+    return Workload(system, [f"P{i}" for i in range(n)],
+                    np.array([rng.randint(0, 30) for _ in range(n)], dtype=np.int64),
+                    np.array([rng.choice([0, 1, 2, 3, 5, 8]) for _ in range(n)], dtype=np.int64),
+                    np.array([rng.randint(0, 3) for _ in range(n)], dtype=np.int64),
+                    np.ones(n, dtype=np.int64))
+
+
+def _reference(w: Workload, policy: str) -> List[Optional[int]]:
+    # who holds the CPU at each tick (None = idle), deciding again every tick
+    arrival, burst, priority = w.arrival.tolist(), w.burst.tolist(), w.priority.tolist()
+    rem = burst[:]
+    key = {
+        "sjf": lambda i: (burst[i], arrival[i], i),
+        "srtf": lambda i: (rem[i], arrival[i], i),
+        "priority": lambda i: (priority[i], arrival[i], i),
+    }.get(policy)
+    ready: List[int] = []
+    levels: List[List[int]] = [[] for _ in range(MLFQ_LEVELS)]
+    level = [0] * len(w)
+    admitted = set()
+    live = sum(1 for b in burst if b > 0)
+    ticks: List[Optional[int]] = []
+    cur: Optional[int] = None
+    used = slice_ = 0
+    t = 0
+
+    def admit():
+        for i in range(len(w)):
+            if i not in admitted and rem[i] > 0 and arrival[i] <= t:
+                admitted.add(i)
+                (ready if key else levels[0]).append(i)
+
+    while live:
+        admit()
+        if cur is None or (policy == "srtf" and ready and key(min(ready, key=key))[0] < rem[cur]):
+            if cur is not None:
+                ready.append(cur)
+            if key:
+                cur = min(ready, key=key) if ready else None
+                if cur is not None:
+                    ready.remove(cur)
+            else:
+                k = next((k for k in range(MLFQ_LEVELS) if levels[k]), None)
+                cur = levels[k].pop(0) if k is not None else None
+                used, slice_ = 0, w.cpu_quantum * 2 ** (k or 0)
+        ticks.append(cur)
+        t += 1
+        if cur is None:
+            continue
+        rem[cur] -= 1
+        used += 1
+        if not rem[cur]:
+            live -= 1
+            cur = None
+        elif not key and used == slice_:
+            # arrivals at the end of the slice queue ahead of the demoted process
+            admit()
+            level[cur] = min(level[cur] + 1, MLFQ_LEVELS - 1)
+            levels[level[cur]].append(cur)
+            cur = None
+    return ticks
+
+
+@pytest.mark.parametrize("policy", sorted(QUEUES))
+def test_matches_tick_reference(policy):
+    rng = random.Random(policy)
+    for _ in range(500):
+        w = _workload(rng, rng.randint(0, 25))
+        ticks: List[Optional[int]] = []
+        for i, s, e in iter_policy_segments(QUEUES[policy](w, w.burst.tolist()), w.arrival.tolist()):
+            ticks += [None if i == IDLE else i] * (e - s)
+        assert ticks == _reference(w, policy)
+
+
+def test_run_policies_keys_results_by_name():
+    w = _workload(random.Random(1), 30)
+    results = run_policies(w, ["sjf", "srtf", "baseline", "sjf"], "rle")
+    assert list(results) == ["sjf", "srtf", "baseline"]
+    assert all(set(r["waiting_times"]) == set(w.pids) for r in results.values())
+
+
+def test_queue_policies_reject_smp():
+    w = _workload(random.Random(2), 5, num_cpus=2)
+    check_policies(w, ["baseline", "memory_aware"])
+    with pytest.raises(ValueError):
+        check_policies(w, ["sjf"])
+    with pytest.raises(ValueError):
+        check_policies(w, ["nope"])
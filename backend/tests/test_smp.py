@@ -0,0 +1,87 @@
+# backend/tests/test_smp.py
+"""The epoch-based SMP round-robin engine (core/smp.py)."""
+from __future__ import annotations
+import random
+
+import pytest
+
+from app.core import smp
+from app.core.engine import IDLE
+from app.core.scheduler import run_baseline
+from app.models.schemas import Process, SystemConfig
+
+
+def _case(rng: random.Random, n: int):
+    bursts = [rng.randint(0, 30) for _ in range(n)]
+    arrivals = [rng.randint(0, 80) for _ in range(n)]
+    quanta = [rng.randint(1, 6) for _ in range(n)]
+    return bursts, quanta, arrivals
+
+
+def _check(segments, bursts, quanta, arrivals, num_cpus):
+    ran = [0] * len(bursts)
+    core_end = [0] * num_cpus
+    last_end = {}
+    for c, i, s, e in segments:
+        assert 0 <= c < num_cpus and s < e and s >= core_end[c]
+        core_end[c] = e
+        if i == IDLE:
+            continue
+        # a process runs after it arrives, for at most its quantum, on one core at a time
+        assert s >= arrivals[i] and e - s <= quanta[i] and s >= last_end.get(i, 0)
+        last_end[i] = e
+        ran[i] += e - s
+    assert ran == bursts
+    starts = [s for _, i, s, _ in segments if i != IDLE]
+    assert starts == sorted(starts)
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_invariants(seed):
+    rng = random.Random(seed)
+    for _ in range(50):
+        bursts, quanta, arrivals = _case(rng, rng.randint(0, 60))
+        num_cpus = rng.randint(1, 9)
+        gap = rng.choice([0, 0, 1, 3])
+        epoch = rng.choice([0, 1, 5, 17, 200])
+        segments = list(smp.iter_smp_segments(bursts, quanta, arrivals, num_cpus, gap, epoch=epoch))
+        _check(segments, bursts, quanta, arrivals, num_cpus)
+        if gap:
+            # every quantum but the one that finishes the run is followed by its gap
+            quanta_run = sum(1 for _, i, _, _ in segments if i != IDLE)
+            assert sum(1 for _, i, _, _ in segments if i == IDLE) == max(0, quanta_run - 1)
+
+
+@pytest.mark.parametrize("num_cpus, quantum, burst", [(2, 10, 1), (4, 50, 7), (4, 4, 25), (8, 3, 3)])
+def test_saturated_run_keeps_every_core_busy(num_cpus, quantum, burst):
+    # everything queued at t=0: no core may wait for a boundary while work is queued
+    n = 100 * num_cpus
+    segments = list(smp.iter_smp_segments([burst] * n, [quantum] * n, [0] * n, num_cpus))
+    total = max(e for _, _, _, e in segments)
+    assert total == n * burst // num_cpus
+    busy = [0] * num_cpus
+    for c, i, s, e in segments:
+        busy[c] += e - s
+    assert busy == [total] * num_cpus
+
+
+def test_saturated_core_utilization():
+    processes = [Process(pid=f"P{i}", arrival_time=0, burst_time=1, priority=0, pages_count=1) for i in range(100)]
+    cfg = SystemConfig(total_frames=64, page_size=4, cpu_quantum=10, memory_threshold=1.0, num_cpus=2,
+                       processes=processes)
+    result = run_baseline(cfg)
+    assert result["total_time"] == 50
+    assert result["core_utilization"] == [100.0, 100.0]
+
+
+def test_pool_matches_inline(monkeypatch):
+    rng = random.Random(7)
+    bursts, quanta, arrivals = _case(rng, 400)
+    inline = list(smp.iter_smp_segments(bursts, quanta, arrivals, 4, 1, epoch=20))
+    monkeypatch.setattr(smp, "SMP_PARALLEL_MIN", 1)
+    monkeypatch.setattr(smp, "SMP_WORKERS", 2)
+    try:
+        pooled = list(smp.iter_smp_segments(bursts, quanta, arrivals, 4, 1, epoch=20))
+    finally:
+        smp.shutdown()
+    assert pooled == inline